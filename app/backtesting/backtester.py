@@ -15,6 +15,7 @@ Features:
 """
 
 import asyncio
+import inspect
 import logging
 from decimal import Decimal
 from dataclasses import dataclass, field
@@ -26,7 +27,7 @@ import json
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestTrade:
     """Record of a simulated trade"""
     id: int
@@ -242,7 +243,10 @@ class Backtester:
         
         # Generate signal
         try:
-            signal = await self.strategy.generate_signal(market_data, account_state)
+            # StrategyManager.generate_signal is async; SwingStrategy's is a plain call
+            signal = self.strategy.generate_signal(market_data, account_state)
+            if inspect.isawaitable(signal):
+                signal = await signal
             
             if signal:
                 self._open_position(signal, bar_time, bar_close)
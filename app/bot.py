@@ -17,7 +17,7 @@ import os
 from pathlib import Path
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from types import FrameType
 import json
 import re
@@ -265,6 +265,11 @@ class HyperAIBot:
         self._last_candle_fetch: Optional[datetime] = None
         self._candle_update_pending = False  # Track if we need fresh candles
         
+        # Close/volume series derived from _candles_cache (rebuilt only when the cache is replaced)
+        self._candle_series_source: Optional[List[Dict[str, Any]]] = None
+        self._candle_prices: List[Decimal] = []
+        self._candle_volumes: List[Decimal] = []
+        
         # BTC candles for correlation analysis (altcoins only)
         self._btc_candles_cache: List[Dict[str, Any]] = []
         self._last_btc_fetch: Optional[datetime] = None
@@ -580,6 +585,23 @@ class HyperAIBot:
         except Exception as e:
             logger.error(f"Error updating account state: {e}")
     
+    def _get_candle_series(self) -> Tuple[List[Decimal], List[Decimal]]:
+        """
+        Get close/volume series for the current candle cache
+        
+        The Decimal lists are rebuilt only when _candles_cache has been
+        replaced by a fresh fetch; between fetches every tick reuses them.
+        
+        Returns:
+            (prices, volumes) as Decimal lists
+        """
+        candles = self._candles_cache
+        if candles is not self._candle_series_source:
+            self._candle_prices = [Decimal(str(c['close'])) for c in candles]
+            self._candle_volumes = [Decimal(str(c['volume'])) for c in candles]
+            self._candle_series_source = candles
+        return self._candle_prices, self._candle_volumes
+    
     def _on_new_candle(self, symbol: str, candle: Dict[str, Any]):
         """
         Callback for real-time candle updates (Phase 3 + Phase 4 + Phase 5)
@@ -764,6 +786,8 @@ class HyperAIBot:
         """
         try:
             # PHASE 5: Adaptive monitoring frequency based on volatility
+            # Single clock read per monitoring pass - reused for trade durations
+            # and the per-symbol trailing stop throttle below
             now = datetime.now(timezone.utc)
             
             # Calculate adaptive check interval based on ATR (volatility)
@@ -833,7 +857,7 @@ class HyperAIBot:
                             
                             # Calculate duration
                             entry_time = trade_info.get('entry_time')
-                            duration_seconds = int((datetime.now(timezone.utc) - entry_time).total_seconds()) if entry_time else None
+                            duration_seconds = int((now - entry_time).total_seconds()) if entry_time else None
                             
                             try:
                                 await self.db.close_trade(
@@ -889,14 +913,15 @@ class HyperAIBot:
                     continue
                 
                 symbol = pos['symbol']
-                entry_price = Decimal(str(pos.get('entry_price', 0)))
-                unrealized_pnl = Decimal(str(pos.get('unrealized_pnl', 0)))
+                # The account snapshot already carries floats - no Decimal round-trip per tick
+                entry_price = float(pos.get('entry_price', 0))
+                unrealized_pnl = float(pos.get('unrealized_pnl', 0))
                 # Prevent division by zero if entry_price=0
                 if entry_price > 0:
-                    unrealized_pnl_pct = (unrealized_pnl / (abs(Decimal(str(size))) * entry_price)) * 100
+                    unrealized_pnl_pct = (unrealized_pnl / (abs(size) * entry_price)) * 100
                 else:
-                    unrealized_pnl_pct = Decimal('0')
-                current_price = Decimal(str(pos.get('mark_price', entry_price)))  # Use mark price
+                    unrealized_pnl_pct = 0.0
+                current_price = float(pos.get('mark_price', entry_price))  # Use mark price
                 
                 # Log position status every 60 loops (~1 min) for cleaner logs
                 if hasattr(self, '_position_log_counter'):
@@ -915,11 +940,10 @@ class HyperAIBot:
                     is_long = size > 0
                     
                     # Store entry price in order manager for trailing calculation
-                    self.order_manager.set_entry_price(symbol, float(entry_price))
+                    self.order_manager.set_entry_price(symbol, entry_price)
                     
                     # ==================== TRAILING STOP THROTTLE ====================
                     # Avoid spam orders - only update trailing stops every 30 seconds per symbol
-                    now = datetime.now(timezone.utc)
                     last_trail = self._last_trail_update.get(symbol)
                     can_update_trail = (
                         last_trail is None or 
@@ -935,14 +959,14 @@ class HyperAIBot:
                         # Calculate new SL at +3% PnL (0.6% price with 5x leverage)
                         if is_long:
                             # Move SL to entry + 0.6% price = +3% PnL locked
-                            trailing_sl = float(entry_price * Decimal('1.006'))
-                            if trailing_sl > float(current_price):
-                                trailing_sl = float(entry_price * Decimal('1.003'))  # Fallback to +1.5% PnL
+                            trailing_sl = entry_price * 1.006
+                            if trailing_sl > current_price:
+                                trailing_sl = entry_price * 1.003  # Fallback to +1.5% PnL
                         else:
                             # Short: Move SL to entry - 0.6% price = +3% PnL locked
-                            trailing_sl = float(entry_price * Decimal('0.994'))
-                            if trailing_sl < float(current_price):
-                                trailing_sl = float(entry_price * Decimal('0.997'))  # Fallback to +1.5% PnL
+                            trailing_sl = entry_price * 0.994
+                            if trailing_sl < current_price:
+                                trailing_sl = entry_price * 0.997  # Fallback to +1.5% PnL
                         
                         # Only update if we haven't already trailed to this level
                         current_sl = order_info.get('sl_price', 0)
@@ -999,23 +1023,11 @@ class HyperAIBot:
         if not self.asset_manager.can_open_new_position():
             return None
         
-        # Get assets available for trading
-        available = self.asset_manager.get_assets_without_positions()
-        if not available:
-            return None
-        
-        now = datetime.now(timezone.utc)
-        
-        # Scan each available asset
-        for symbol in available:
-            can_trade, reason = self.asset_manager.can_trade_asset(symbol)
-            if not can_trade:
-                logger.debug(f"⏭️ Skip {symbol}: {reason}")
-                continue
-            
-            # Get strategy for this symbol
-            strategy = self.strategies.get(symbol)
-            if not strategy:
+        # Collect tradeable assets (enabled, flat, off cooldown - one pass) that have
+        # a strategy and a live price, so no candles are fetched for unscannable symbols
+        candidates = []
+        for symbol in self.asset_manager.get_tradeable_assets():
+            if symbol not in self.strategies:
                 logger.warning(f"No strategy for {symbol}")
                 continue
             
@@ -1023,12 +1035,23 @@ class HyperAIBot:
             market_data = self.websocket.get_market_data(symbol)
             if not market_data or not market_data.get('price'):
                 continue
-            
-            # Fetch candles if needed (using configured timeframe)
-            if self.asset_manager.needs_candle_refresh(symbol):
-                candles = self.client.get_candles(symbol, self.timeframe, 150)
+            candidates.append((symbol, market_data))
+        
+        # Refresh stale candles (using configured timeframe) - independent
+        # requests, so fetch all symbols concurrently instead of one blocking call each
+        stale = [symbol for symbol, _ in candidates if self.asset_manager.needs_candle_refresh(symbol)]
+        if stale:
+            results = await asyncio.gather(*(
+                self.client.async_get_candles(symbol, self.timeframe, 150)
+                for symbol in stale
+            ))
+            for symbol, candles in zip(stale, results):
                 if candles:
                     self.asset_manager.update_candles(symbol, candles)
+        
+        # Scan each available asset
+        for symbol, market_data in candidates:
+            strategy = self.strategies[symbol]
             
             # Get cached candles
             candles = self.asset_manager.get_candles(symbol)
@@ -1188,11 +1211,14 @@ class HyperAIBot:
                         )
                         if htf_need_fetch:
                             try:
-                                for interval in self._htf_intervals:
-                                    # Skip if HTF equals our LTF
-                                    if interval == self.timeframe:
-                                        continue
-                                    htf_candles = self.client.get_candles(self.symbol, interval, 50)
+                                # Skip if HTF equals our LTF
+                                intervals = [i for i in self._htf_intervals if i != self.timeframe]
+                                # Independent requests - fetch all intervals concurrently
+                                results = await asyncio.gather(*(
+                                    self.client.async_get_candles(self.symbol, interval, 50)
+                                    for interval in intervals
+                                ))
+                                for interval, htf_candles in zip(intervals, results):
                                     if htf_candles:
                                         self._htf_candles_cache[interval] = htf_candles
                                 self._last_htf_fetch = now
@@ -1264,8 +1290,13 @@ class HyperAIBot:
                     else:
                         # SINGLE SYMBOL MODE (original behavior)
                         # Skip if position already open (max 1 position in single mode)
-                        positions = account_state.get('positions', [])
-                        has_open_position = any(float(pos.get('size', 0)) != 0 for pos in positions)
+                        # position_symbols only holds non-zero positions, so emptiness is the check
+                        position_symbols = account_state.get('position_symbols')
+                        if position_symbols is not None:
+                            has_open_position = bool(position_symbols)
+                        else:
+                            positions = account_state.get('positions', [])
+                            has_open_position = any(float(pos.get('size', 0)) != 0 for pos in positions)
                         
                         if has_open_position:
                             # Don't generate new signals while position is active
@@ -1274,9 +1305,8 @@ class HyperAIBot:
                         
                         # PHASE 5: Calculate indicators once using shared calculator
                         if self._candles_cache and self.indicator_calc:
-                            # Extract prices from candles
-                            prices_list = [Decimal(str(c['close'])) for c in self._candles_cache]
-                            volumes_list = [Decimal(str(c['volume'])) for c in self._candles_cache]
+                            # Extract prices from candles (once per candle refresh, not per tick)
+                            prices_list, volumes_list = self._get_candle_series()
                             
                             # Calculate all indicators once (pass candles for proper ADX/ATR)
                             shared_indicators = self.indicator_calc.calculate_all(
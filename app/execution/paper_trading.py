@@ -17,7 +17,7 @@ import json
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperPosition:
     """Simulated position."""
     symbol: str
@@ -35,7 +35,7 @@ class PaperPosition:
     realized_pnl: Optional[Decimal] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperTrade:
     """Completed paper trade record."""
     symbol: str
@@ -51,6 +51,8 @@ class HyperLiquidClient:
         self.websocket = None
         
         self._meta_cache: Optional[Dict] = None
+        self._sz_decimals: Dict[str, int] = {}  # symbol -> size decimals (static per asset)
+        self._price_decimals: Dict[str, int] = {}  # symbol -> price decimals (static per asset)
         
         logger.info(f"HyperLiquidClient initialized for {self.address[:10]}...")
     
@@ -116,11 +118,17 @@ class HyperLiquidClient:
         raise ValueError(f"Unknown symbol: {symbol}")
     
     def get_sz_decimals(self, symbol: str) -> int:
-        """Get size decimals for proper rounding."""
+        """Get size decimals for proper rounding (resolved once per symbol)."""
+        cached = self._sz_decimals.get(symbol)
+        if cached is not None:
+            return cached
+        
         meta = self.get_meta()
         for asset in meta.get("universe", []):
             if asset["name"] == symbol:
-                return asset.get("szDecimals", 3)
+                sz_decimals = asset.get("szDecimals", 3)
+                self._sz_decimals[symbol] = sz_decimals
+                return sz_decimals
         return 3
     
     def get_price_decimals(self, symbol: str) -> int:
@@ -129,7 +137,12 @@ class HyperLiquidClient:
         
         HyperLiquid uses: 6 - szDecimals for perps, 8 - szDecimals for spot.
         This matches the SDK's _slippage_price() rounding logic.
+        Resolved once per symbol; metadata is cached, so the value never changes.
         """
+        cached = self._price_decimals.get(symbol)
+        if cached is not None:
+            return cached
+        
         try:
             # Get szDecimals from metadata
             meta = self.get_meta()
@@ -137,7 +150,9 @@ class HyperLiquidClient:
                 if asset.get("name") == symbol:
                     sz_decimals = asset.get("szDecimals", 3)
                     # HyperLiquid formula: 6 - szDecimals for perps
-                    return max(0, 6 - sz_decimals)
+                    decimals = max(0, 6 - sz_decimals)
+                    self._price_decimals[symbol] = decimals
+                    return decimals
         except Exception:
             pass
         
@@ -274,6 +289,10 @@ class HyperLiquidClient:
         """Async get current funding rate for a symbol."""
         return await self._loop.run_in_executor(None, self.get_funding_rate, symbol)
     
+    async def async_get_candles(self, symbol: str, interval: str = "1m", limit: int = 100) -> List[Dict]:
+        """Async get historical candles (runs the blocking fetch in the executor)."""
+        return await self._loop.run_in_executor(None, self.get_candles, symbol, interval, limit)
+    
     async def get_market_price(self, symbol: str) -> float:
         """
         Async get current mid price for telegram bot compatibility.
@@ -423,6 +442,8 @@ class HyperLiquidClient:
             'margin_used': float(margin.get("totalMarginUsed", 0)),
             'available_margin': float(state.get("withdrawable", 0)),
             'positions': positions,
+            # Built once per snapshot so per-symbol strategies check membership in O(1)
+            'position_symbols': frozenset(pos['symbol'] for pos in positions),
         }
 
 
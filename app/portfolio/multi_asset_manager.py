@@ -16,6 +16,7 @@ Features:
 
 import asyncio
 import logging
+import time
 from decimal import Decimal
 from typing import Dict, Any, List, Optional, Set
 from dataclasses import dataclass, field
@@ -24,7 +25,7 @@ from datetime import datetime, timezone, timedelta
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AssetState:
     """State tracking for a single asset"""
     symbol: str
@@ -42,6 +43,7 @@ class AssetState:
     
     # Signal cooldown (prevent over-trading)
     last_signal_time: Optional[datetime] = None
+    last_signal_ns: Optional[int] = None  # time.monotonic_ns() of last signal, for cooldown math
     signal_cooldown_seconds: int = 60  # Min time between signals
     
     # Stats
@@ -117,6 +119,38 @@ class MultiAssetManager:
         """Check if we can open a new position (portfolio level)"""
         return self.total_positions < self.max_positions
     
+    def _block_reason(self, state: AssetState, now_ns: int) -> Optional[str]:
+        """
+        Single source of the per-asset trading gates
+        
+        Args:
+            state: Asset to check
+            now_ns: time.monotonic_ns() reading to measure the cooldown against
+        
+        Returns:
+            Why the asset can't be traded right now, or None if it can
+        """
+        symbol = state.symbol
+        
+        if not state.is_enabled:
+            return f"{symbol} is disabled"
+        
+        if state.has_position:
+            return f"{symbol} already has open position"
+        
+        if not self.can_open_new_position():
+            return f"Max positions ({self.max_positions}) reached"
+        
+        # Check signal cooldown (integer ns compare, no datetime/timedelta per check)
+        if state.last_signal_ns is not None:
+            elapsed_ns = now_ns - state.last_signal_ns
+            cooldown_ns = state.signal_cooldown_seconds * 1_000_000_000
+            if elapsed_ns < cooldown_ns:
+                remaining = (cooldown_ns - elapsed_ns) / 1e9
+                return f"{symbol} on cooldown ({remaining:.0f}s remaining)"
+        
+        return None
+    
     def can_trade_asset(self, symbol: str) -> tuple[bool, str]:
         """
         Check if an asset can be traded right now
@@ -127,25 +161,37 @@ class MultiAssetManager:
         if symbol not in self.assets:
             return False, f"Asset {symbol} not in managed list"
         
-        state = self.assets[symbol]
+        reason = self._block_reason(self.assets[symbol], time.monotonic_ns())
+        if reason is not None:
+            return False, reason
         
-        if not state.is_enabled:
-            return False, f"{symbol} is disabled"
+        return True, "OK"
+    
+    def get_tradeable_assets(self) -> List[str]:
+        """
+        Get every asset that would pass can_trade_asset right now
         
-        if state.has_position:
-            return False, f"{symbol} already has open position"
+        Resolves the whole scan in one pass over the asset states with a
+        single clock read. Enabled, flat assets that are held back (e.g. on
+        cooldown) are logged at debug level with the reason.
         
+        Returns:
+            Symbols that are enabled, flat and off cooldown
+        """
         if not self.can_open_new_position():
-            return False, f"Max positions ({self.max_positions}) reached"
-        
-        # Check signal cooldown
-        if state.last_signal_time:
-            elapsed = (datetime.now(timezone.utc) - state.last_signal_time).total_seconds()
-            if elapsed < state.signal_cooldown_seconds:
-                remaining = state.signal_cooldown_seconds - elapsed
-                return False, f"{symbol} on cooldown ({remaining:.0f}s remaining)"
+            return []
         
-        return True, "OK"
+        now_ns = time.monotonic_ns()
+        tradeable = []
+        for symbol, state in self.assets.items():
+            if not state.is_enabled or state.has_position:
+                continue
+            reason = self._block_reason(state, now_ns)
+            if reason is not None:
+                logger.debug(f"⏭️ Skip {symbol}: {reason}")
+                continue
+            tradeable.append(symbol)
+        return tradeable
     
     def get_next_asset_to_scan(self) -> Optional[str]:
         """
@@ -261,7 +307,9 @@ class MultiAssetManager:
         if symbol not in self.assets:
             return
         
-        self.assets[symbol].last_signal_time = datetime.now(timezone.utc)
+        state = self.assets[symbol]
+        state.last_signal_time = datetime.now(timezone.utc)
+        state.last_signal_ns = time.monotonic_ns()
     
     def update_candles(self, symbol: str, candles: List[Dict[str, Any]]):
         """Update candle cache for an asset"""
@@ -324,9 +372,14 @@ class MultiAssetManager:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get portfolio-wide stats"""
-        total_pnl = sum(s.pnl_today for s in self.assets.values())
-        total_trades = sum(s.trades_today for s in self.assets.values())
-        total_wins = sum(s.wins_today for s in self.assets.values())
+        # Single pass over asset states for all portfolio totals
+        total_pnl = Decimal('0')
+        total_trades = 0
+        total_wins = 0
+        for state in self.assets.values():
+            total_pnl += state.pnl_today
+            total_trades += state.trades_today
+            total_wins += state.wins_today
         
         return {
             'enabled_assets': self.get_enabled_assets(),
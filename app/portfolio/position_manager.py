@@ -137,6 +137,9 @@ class PositionManager:
         # Default TP/SL percentages for manual positions
         self.default_tp_pct = Decimal(str(self.config.get('default_tp_pct', 3.0)))
         self.default_sl_pct = Decimal(str(self.config.get('default_sl_pct', 1.5)))
+        # Float fractions for the price math (fixed per instance)
+        self._tp_frac = float(self.default_tp_pct) / 100
+        self._sl_frac = float(self.default_sl_pct) / 100
         
         # Health check thresholds
         self.health_check_interval = timedelta(seconds=30)
@@ -418,14 +421,14 @@ class PositionManager:
                 return
             
             # Calculate TP/SL prices
-            entry = Decimal(str(position.entry_price))
+            entry = float(position.entry_price)
             
             if position.side == 'long':
-                tp_price = float(entry * (1 + self.default_tp_pct / 100))
-                sl_price = float(entry * (1 - self.default_sl_pct / 100))
+                tp_price = entry * (1 + self._tp_frac)
+                sl_price = entry * (1 - self._sl_frac)
             else:
-                tp_price = float(entry * (1 - self.default_tp_pct / 100))
-                sl_price = float(entry * (1 + self.default_sl_pct / 100))
+                tp_price = entry * (1 - self._tp_frac)
+                sl_price = entry * (1 + self._sl_frac)
             
             # Set TP/SL using order manager
             logger.info(f"🛡️ Setting protection for {position.symbol} {position.side.upper()}")
@@ -4,11 +4,13 @@ Tracks peak equity and current drawdown with multiple alert levels
 """
 
 import logging
-from typing import Dict, Any, Optional, Callable, Tuple
+from typing import Dict, Any, Optional, Callable, Tuple, Iterator
 from decimal import Decimal
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
 from enum import Enum
+from collections import deque
+from itertools import islice
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +23,22 @@ class DrawdownLevel(Enum):
     EMERGENCY = "emergency"  # > 15%
 
 
-@dataclass
+# Level members bound once for the per-tick classification in update()
+_NORMAL = DrawdownLevel.NORMAL
+_WARNING = DrawdownLevel.WARNING
+_CRITICAL = DrawdownLevel.CRITICAL
+_EMERGENCY = DrawdownLevel.EMERGENCY
+
+# Position size multiplier per drawdown level (built once, not per call)
+_RECOVERY_MULTIPLIERS: Dict[DrawdownLevel, float] = {
+    DrawdownLevel.NORMAL: 1.0,
+    DrawdownLevel.WARNING: 0.7,
+    DrawdownLevel.CRITICAL: 0.4,
+    DrawdownLevel.EMERGENCY: 0.0,
+}
+
+
+@dataclass(slots=True)
 class DrawdownSnapshot:
     """Snapshot of drawdown at a point in time"""
     timestamp: datetime
@@ -75,8 +92,8 @@ class DrawdownMonitor:
         self.pause_reason: Optional[str] = None
         
         # History
-        self.snapshots: list[DrawdownSnapshot] = []
         self.max_snapshots = cfg.get('max_snapshots', 1000)
+        self.snapshots: deque[DrawdownSnapshot] = deque(maxlen=self.max_snapshots)
         
         # Current state
         self.current_level = DrawdownLevel.NORMAL
@@ -120,10 +137,8 @@ class DrawdownMonitor:
             level=level
         )
         
-        # Store snapshot
+        # Store snapshot (deque evicts the oldest once full)
         self.snapshots.append(snapshot)
-        if len(self.snapshots) > self.max_snapshots:
-            self.snapshots = self.snapshots[-self.max_snapshots:]
         
         # Update max drawdown
         if drawdown_pct > self.max_drawdown_ever_pct:
@@ -150,13 +165,13 @@ class DrawdownMonitor:
     def _calculate_level(self, drawdown_pct: Decimal) -> DrawdownLevel:
         """Calculate drawdown level"""
         if drawdown_pct >= self.emergency_threshold_pct:
-            return DrawdownLevel.EMERGENCY
+            return _EMERGENCY
         elif drawdown_pct >= self.critical_threshold_pct:
-            return DrawdownLevel.CRITICAL
+            return _CRITICAL
         elif drawdown_pct >= self.warning_threshold_pct:
-            return DrawdownLevel.WARNING
+            return _WARNING
         else:
-            return DrawdownLevel.NORMAL
+            return _NORMAL
     
     def _handle_level_change(self, old_level: DrawdownLevel, new_level: DrawdownLevel, 
                             drawdown_pct: Decimal):
@@ -261,8 +276,20 @@ class DrawdownMonitor:
         Returns:
             List of snapshot dictionaries
         """
-        recent = self.snapshots[-count:] if len(self.snapshots) > count else self.snapshots
-        return [s.to_dict() for s in recent]
+        return list(self.iter_recent_snapshots(count))
+    
+    def iter_recent_snapshots(self, count: int = 10) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield recent drawdown snapshots, oldest first
+        
+        Only the requested tail is visited and formatted.
+        
+        Args:
+            count: Number of snapshots to yield
+        """
+        start = max(0, len(self.snapshots) - count)
+        for snapshot in islice(self.snapshots, start, None):
+            yield snapshot.to_dict()
     
     def get_thresholds(self) -> Dict[str, Any]:
         """Get configured thresholds"""
@@ -290,14 +317,7 @@ class DrawdownMonitor:
             - CRITICAL: 0.4 (40% - significant reduction)
             - EMERGENCY: 0.0 (0% - no trading)
         """
-        multipliers = {
-            DrawdownLevel.NORMAL: 1.0,
-            DrawdownLevel.WARNING: 0.7,
-            DrawdownLevel.CRITICAL: 0.4,
-            DrawdownLevel.EMERGENCY: 0.0,
-        }
-        
-        multiplier = multipliers.get(self.current_level, 1.0)
+        multiplier = _RECOVERY_MULTIPLIERS.get(self.current_level, 1.0)
         
         if multiplier < 1.0:
             logger.info(f"🔄 Recovery Mode: {self.current_level.value} - position size at {multiplier*100:.0f}%")
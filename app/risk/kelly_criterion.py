@@ -20,6 +20,7 @@ from typing import Dict, Any, Optional, Tuple, List
 from decimal import Decimal
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
@@ -83,8 +84,8 @@ class KellyCriterion:
         self.max_position_pct = max_position_pct
         self.min_position_pct = min_position_pct
         
-        # Trade history for calculations
-        self.trade_history: List[Dict[str, Any]] = []
+        # Trade history for calculations (oldest first, evicted from the left)
+        self.trade_history: deque = deque()
         
         # Cached Kelly result
         self._cached_result: Optional[KellyResult] = None
@@ -109,8 +110,9 @@ class KellyCriterion:
             side: 'long' or 'short'
             strategy: Strategy name (optional)
         """
+        now = datetime.now(timezone.utc)
         trade = {
-            'timestamp': datetime.now(timezone.utc),
+            'timestamp': now,
             'pnl': pnl,
             'pnl_pct': (pnl / (size * entry_price)) * 100,
             'entry_price': entry_price,
@@ -126,9 +128,11 @@ class KellyCriterion:
         # Invalidate cache
         self._cached_result = None
         
-        # Keep only recent trades (rolling window)
-        cutoff = datetime.now(timezone.utc) - timedelta(days=self.ROLLING_WINDOW_DAYS * 2)
-        self.trade_history = [t for t in self.trade_history if t['timestamp'] > cutoff]
+        # Keep only recent trades (rolling window) - trades arrive in time order,
+        # so expired ones are always at the left end
+        cutoff = now - timedelta(days=self.ROLLING_WINDOW_DAYS * 2)
+        while self.trade_history and self.trade_history[0]['timestamp'] <= cutoff:
+            self.trade_history.popleft()
         
         logger.debug(f"Kelly: Added trade P&L ${pnl:+.2f}, total trades: {len(self.trade_history)}")
     
@@ -147,6 +151,10 @@ class KellyCriterion:
                 'strategy': trade.get('strategy')
             })
         
+        # Loaded timestamps come in caller order; add_trade evicts expired
+        # trades from the left end, which relies on the history being sorted
+        self.trade_history = deque(sorted(self.trade_history, key=lambda t: t['timestamp']))
+        
         logger.info(f"📊 Loaded {len(self.trade_history)} trades for Kelly calculation")
         self._cached_result = None
     
@@ -160,9 +168,11 @@ class KellyCriterion:
         Returns:
             KellyResult with optimal position sizing
         """
+        now = datetime.now(timezone.utc)
+        
         # Check cache
         if (self._cached_result and self._cache_time and 
-            datetime.now(timezone.utc) - self._cache_time < self._cache_ttl):
+            now - self._cache_time < self._cache_ttl):
             return self._cached_result
         
         # Filter trades
@@ -172,7 +182,7 @@ class KellyCriterion:
             trades = self.trade_history
         
         # Apply rolling window
-        cutoff = datetime.now(timezone.utc) - timedelta(days=self.ROLLING_WINDOW_DAYS)
+        cutoff = now - timedelta(days=self.ROLLING_WINDOW_DAYS)
         recent_trades = [t for t in trades if t['timestamp'] > cutoff]
         
         # Use recent if enough, otherwise all trades
@@ -253,7 +263,7 @@ class KellyCriterion:
         
         # Cache result
         self._cached_result = result
-        self._cache_time = datetime.now(timezone.utc)
+        self._cache_time = now
         
         logger.info(f"📊 Kelly Calculation:")
         logger.info(f"   Win Rate: {win_rate:.1%} ({len(winners)}/{sample_size})")
@@ -8,6 +8,7 @@ from typing import Dict, Any, Optional, Callable, List
 from decimal import Decimal
 from datetime import datetime, timezone
 from enum import Enum
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
@@ -57,10 +58,10 @@ class KillSwitch:
         self.position_loss_trigger_pct = Decimal(str(cfg.get('position_loss_trigger_pct', 8)))
         self.error_rate_threshold = cfg.get('error_rate_threshold', 0.5)  # 50% error rate
         
-        # Error tracking
-        self.recent_errors = []
-        self.recent_trades = []
+        # Error tracking (bounded - oldest entries drop off automatically)
         self.max_recent_items = 20
+        self.recent_errors: deque = deque(maxlen=self.max_recent_items)
+        self.recent_trades: deque = deque(maxlen=self.max_recent_items)
         
         # Callbacks (Python 3.8+ compatible)
         self.on_trigger_callbacks: List[Callable] = []
@@ -125,20 +126,25 @@ class KillSwitch:
                 return True
         
         # 4. Check position losses
+        # Compare loss * 100 against threshold * value so the common
+        # "no breach" path needs no per-position division; positions hold
+        # floats, so the Decimal threshold is converted once up front
+        trigger_pct = float(self.position_loss_trigger_pct)
         for symbol, position in self.position_manager.open_positions.items():
-            if position.unrealized_pnl < 0:
-                # Guard against division by zero
-                position_value = position.size * position.entry_price
-                if position_value > 0:
-                    loss_pct = abs(position.unrealized_pnl / position_value * 100)
-                else:
-                    loss_pct = Decimal('0')
-                if loss_pct >= self.position_loss_trigger_pct:
-                    self.trigger(
-                        TriggerReason.POSITION_LOSS,
-                        f"{symbol} loss {loss_pct:.2f}% >= {self.position_loss_trigger_pct}%"
-                    )
-                    return True
+            pnl = position.unrealized_pnl
+            if pnl >= 0:
+                continue
+            position_value = position.size * position.entry_price
+            # Guard against division by zero
+            if position_value <= 0:
+                continue
+            if -pnl * 100 >= trigger_pct * position_value:
+                loss_pct = -pnl / position_value * 100
+                self.trigger(
+                    TriggerReason.POSITION_LOSS,
+                    f"{symbol} loss {loss_pct:.2f}% >= {self.position_loss_trigger_pct}%"
+                )
+                return True
         
         # 5. Check error rate
         if len(self.recent_trades) >= 10:
@@ -213,22 +219,16 @@ class KillSwitch:
         Args:
             success: Whether trade was successful
         """
+        now = datetime.now(timezone.utc)
         self.recent_trades.append({
-            'time': datetime.now(timezone.utc),
+            'time': now,
             'success': success
         })
         
         if not success:
             self.recent_errors.append({
-                'time': datetime.now(timezone.utc)
+                'time': now
             })
-        
-        # Trim to max size
-        if len(self.recent_trades) > self.max_recent_items:
-            self.recent_trades = self.recent_trades[-self.max_recent_items:]
-        
-        if len(self.recent_errors) > self.max_recent_items:
-            self.recent_errors = self.recent_errors[-self.max_recent_items:]
     
     def record_connection_loss(self):
         """Record connection loss"""
@@ -13,6 +13,14 @@ logger = logging.getLogger(__name__)
 
 class RiskLimits:
     """Risk limit configuration"""
+    __slots__ = (
+        'max_position_size_pct', 'max_positions', 'max_symbol_exposure_pct',
+        'max_leverage', 'max_margin_usage_pct',
+        'max_daily_loss_pct', 'max_drawdown_pct', 'max_loss_per_trade_pct',
+        'max_trades_per_hour', 'max_trades_per_day',
+        'max_correlated_exposure_pct',
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         # Position limits
         self.max_position_size_pct = Decimal(str(config.get('max_position_size_pct', 50)))
@@ -189,42 +197,66 @@ class RiskEngine:
             self.daily_trades = 0
             self.day_reset_time = now
     
-    def calculate_risk_score(self) -> int:
+    def _account_metrics(self) -> Dict[str, float]:
+        """
+        Snapshot account risk metrics once for score, assessment and warnings
+        
+        Values are plain floats (heuristics only) and 0 when undefined.
+        """
+        equity = float(self.account_manager.current_equity)
+        peak_equity = float(self.account_manager.peak_equity)
+        session_start_equity = float(self.account_manager.session_start_equity)
+        session_pnl = float(self.account_manager.session_pnl)
+        
+        margin_usage_pct = float(self.account_manager.margin_used) / equity * 100 if equity > 0 else 0.0
+        drawdown_pct = (peak_equity - equity) / peak_equity * 100 if peak_equity > 0 else 0.0
+        if session_pnl < 0 and session_start_equity > 0:
+            daily_loss_pct = abs(session_pnl / session_start_equity * 100)
+        else:
+            daily_loss_pct = 0.0
+        
+        return {
+            'margin_usage_pct': margin_usage_pct,
+            'drawdown_pct': drawdown_pct,
+            'daily_loss_pct': daily_loss_pct,
+            'open_positions': len(self.position_manager.open_positions)
+        }
+    
+    def calculate_risk_score(self, metrics: Optional[Dict[str, float]] = None) -> int:
         """
         Calculate overall risk score (0-100)
         Higher score = higher risk
+        
+        Args:
+            metrics: Precomputed _account_metrics() snapshot (computed if omitted)
         """
+        if metrics is None:
+            metrics = self._account_metrics()
+        
         score = 0
         
         # Factor 1: Margin usage (0-25 points)
-        current_equity = self.account_manager.current_equity
-        if current_equity > 0:
-            margin_usage = float(self.account_manager.margin_used / current_equity * 100)
-            score += min(25, margin_usage / 4)
+        score += min(25, metrics['margin_usage_pct'] / 4)
         
         # Factor 2: Drawdown (0-25 points)
-        peak_equity = self.account_manager.peak_equity
-        if peak_equity > 0:
-            drawdown = float((peak_equity - current_equity) / peak_equity * 100)
-            score += min(25, max(0, drawdown * 2.5))  # Ensure non-negative
+        score += min(25, max(0, metrics['drawdown_pct'] * 2.5))  # Ensure non-negative
         
         # Factor 3: Position count (0-25 points)
         if self.limits.max_positions > 0:
-            position_count_pct = (len(self.position_manager.open_positions) / self.limits.max_positions) * 100
+            position_count_pct = (metrics['open_positions'] / self.limits.max_positions) * 100
             score += min(25, position_count_pct / 4)
         
         # Factor 4: Daily P&L (0-25 points)
-        session_start_equity = self.account_manager.session_start_equity
-        if self.account_manager.session_pnl < 0 and session_start_equity > 0:
-            daily_loss_pct = abs(float(self.account_manager.session_pnl / session_start_equity * 100))
-            score += min(25, daily_loss_pct * 5)
+        score += min(25, metrics['daily_loss_pct'] * 5)
         
         self.current_risk_score = int(score)
         return self.current_risk_score
     
     def get_risk_assessment(self) -> Dict[str, Any]:
         """Get comprehensive risk assessment"""
-        risk_score = self.calculate_risk_score()
+        # One pass over account state shared by score, fields and warnings
+        metrics = self._account_metrics()
+        risk_score = self.calculate_risk_score(metrics)
         
         # Risk level classification
         if risk_score < 30:
@@ -236,53 +268,46 @@ class RiskEngine:
         else:
             risk_level = "CRITICAL"
         
-        equity = self.account_manager.current_equity
-        margin_used = self.account_manager.margin_used
-        peak_equity = self.account_manager.peak_equity
-        session_start_equity = self.account_manager.session_start_equity
-        
         return {
             'risk_score': risk_score,
             'risk_level': risk_level,
             'is_enabled': self.is_enabled,
-            'margin_usage_pct': float(margin_used / equity * 100) if equity > 0 else 0,
-            'current_drawdown_pct': float((peak_equity - equity) / peak_equity * 100) if peak_equity > 0 else 0,
-            'daily_loss_pct': float(abs(self.account_manager.session_pnl / session_start_equity * 100)) if self.account_manager.session_pnl < 0 and session_start_equity > 0 else 0,
-            'open_positions': len(self.position_manager.open_positions),
+            'margin_usage_pct': metrics['margin_usage_pct'],
+            'current_drawdown_pct': metrics['drawdown_pct'],
+            'daily_loss_pct': metrics['daily_loss_pct'],
+            'open_positions': metrics['open_positions'],
             'daily_trades': self.daily_trades,
             'hourly_trades': self.hourly_trades,
             'can_trade': risk_level != "CRITICAL",
-            'warnings': self._get_warnings()
+            'warnings': self._get_warnings(metrics)
         }
     
-    def _get_warnings(self) -> list:
+    def _get_warnings(self, metrics: Optional[Dict[str, float]] = None) -> list:
         """Get active risk warnings"""
-        warnings = []
+        if metrics is None:
+            metrics = self._account_metrics()
         
-        equity = self.account_manager.current_equity
-        peak_equity = self.account_manager.peak_equity
-        session_start_equity = self.account_manager.session_start_equity
+        warnings = []
         
         # Check margin usage
-        margin_usage_pct = float(self.account_manager.margin_used / equity * 100) if equity > 0 else 0
+        margin_usage_pct = metrics['margin_usage_pct']
         if margin_usage_pct > 70:
             warnings.append(f"High margin usage: {margin_usage_pct:.1f}%")
         
-        # Check drawdown (guard for peak_equity > 0)
-        if peak_equity > 0:
-            drawdown_pct = float((peak_equity - equity) / peak_equity * 100)
-            if drawdown_pct > 7:
-                warnings.append(f"High drawdown: {drawdown_pct:.1f}%")
+        # Check drawdown
+        drawdown_pct = metrics['drawdown_pct']
+        if drawdown_pct > 7:
+            warnings.append(f"High drawdown: {drawdown_pct:.1f}%")
         
-        # Check daily loss (guard for session_start_equity > 0)
-        if self.account_manager.session_pnl < 0 and session_start_equity > 0:
-            daily_loss_pct = abs(float(self.account_manager.session_pnl / session_start_equity * 100))
-            if daily_loss_pct > 3:
-                warnings.append(f"Daily loss approaching limit: {daily_loss_pct:.1f}%")
+        # Check daily loss
+        daily_loss_pct = metrics['daily_loss_pct']
+        if daily_loss_pct > 3:
+            warnings.append(f"Daily loss approaching limit: {daily_loss_pct:.1f}%")
         
         # Check position count
-        if len(self.position_manager.open_positions) >= self.limits.max_positions * 0.8:
-            warnings.append(f"High position count: {len(self.position_manager.open_positions)}/{self.limits.max_positions}")
+        open_positions = metrics['open_positions']
+        if open_positions >= self.limits.max_positions * 0.8:
+            warnings.append(f"High position count: {open_positions}/{self.limits.max_positions}")
         
         return warnings
     
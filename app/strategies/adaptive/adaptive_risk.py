@@ -47,6 +47,7 @@ class AdaptiveRiskManager:
         self.base_risk_per_trade = Decimal(os.getenv('RISK_PER_TRADE_PCT', '2.0'))
         self.max_risk_per_trade = Decimal(os.getenv('MAX_RISK_PER_TRADE_PCT', '3.0'))
         self.base_leverage = int(os.getenv('MAX_LEVERAGE', '5'))
+        self.max_position_pct = Decimal(os.getenv('MAX_POSITION_SIZE_PCT', '55'))  # Read once, not per sizing call
         
         # ATR multipliers for TP/SL - PROFIT FOCUSED
         # With 5x leverage:
@@ -63,6 +64,12 @@ class AdaptiveRiskManager:
         self.min_tp_pct = Decimal('0.8')   # Minimum 0.8% TP (4% account gain with 5x)
         self.max_tp_pct = Decimal('6.0')   # Maximum 6% TP (30% account gain with 5x)
         
+        # Float copies of the constants above for the per-signal TP/SL math
+        self._sl_atr_mult = float(self.atr_sl_multiplier)
+        self._tp_atr_mult = float(self.atr_tp_multiplier)
+        self._sl_pct_bounds = (float(self.min_sl_pct), float(self.max_sl_pct))
+        self._tp_pct_bounds = (float(self.min_tp_pct), float(self.max_tp_pct))
+        
         # Risk reduction after losses
         self.consecutive_loss_count = 0
         self.max_consecutive_losses = int(os.getenv('MAX_CONSECUTIVE_LOSSES', '3'))
@@ -102,35 +109,38 @@ class AdaptiveRiskManager:
         Returns:
             Dict with stop_loss, take_profit, position_size_pct
         """
-        # Ensure all inputs are Decimal to avoid type mismatches
-        entry_price = Decimal(str(entry_price)) if not isinstance(entry_price, Decimal) else entry_price
-        atr = Decimal(str(atr)) if not isinstance(atr, Decimal) else atr
+        # TP/SL math runs in float end to end: every output below is a float,
+        # so Decimal intermediates only added cost and conversions
+        entry_price = float(entry_price)
+        atr = float(atr)
         
         # Base ATR-based distances
-        sl_distance = atr * self.atr_sl_multiplier
-        tp_distance = atr * self.atr_tp_multiplier
+        sl_distance = atr * self._sl_atr_mult
+        tp_distance = atr * self._tp_atr_mult
         
         # Apply regime adjustments
         if regime_params:
-            sl_distance *= Decimal(str(regime_params.get('sl_multiplier', 1.0)))
-            tp_distance *= Decimal(str(regime_params.get('tp_multiplier', 1.0)))
+            sl_distance *= float(regime_params.get('sl_multiplier', 1.0))
+            tp_distance *= float(regime_params.get('tp_multiplier', 1.0))
         
         # Apply session adjustments
         if session_params:
-            sl_distance *= Decimal(str(session_params.get('sl_multiplier', 1.0)))
-            tp_distance *= Decimal(str(session_params.get('tp_multiplier', 1.0)))
+            sl_distance *= float(session_params.get('sl_multiplier', 1.0))
+            tp_distance *= float(session_params.get('tp_multiplier', 1.0))
         
         # Convert to percentages
         sl_pct = (sl_distance / entry_price) * 100
         tp_pct = (tp_distance / entry_price) * 100
         
         # Apply bounds
-        sl_pct = max(self.min_sl_pct, min(self.max_sl_pct, sl_pct))
-        tp_pct = max(self.min_tp_pct, min(self.max_tp_pct, tp_pct))
+        min_sl_pct, max_sl_pct = self._sl_pct_bounds
+        min_tp_pct, max_tp_pct = self._tp_pct_bounds
+        sl_pct = max(min_sl_pct, min(max_sl_pct, sl_pct))
+        tp_pct = max(min_tp_pct, min(max_tp_pct, tp_pct))
         
         # Ensure R:R is at least 2.5:1 for sustainable profits
-        if tp_pct < sl_pct * Decimal('2.5'):
-            tp_pct = sl_pct * Decimal('3.0')  # Force 3:1 minimum R:R
+        if tp_pct < sl_pct * 2.5:
+            tp_pct = sl_pct * 3.0  # Force 3:1 minimum R:R
         
         # Calculate actual price levels
         if direction == 'long':
@@ -140,17 +150,17 @@ class AdaptiveRiskManager:
             stop_loss = entry_price * (1 + sl_pct / 100)
             take_profit = entry_price * (1 - tp_pct / 100)
         
-        # Calculate recommended position size
-        position_size_pct = self._calculate_position_size(sl_pct)
+        # Calculate recommended position size (risk sizing stays Decimal)
+        position_size_pct = self._calculate_position_size(Decimal(str(sl_pct)))
         
         return {
-            'stop_loss': float(stop_loss),
-            'take_profit': float(take_profit),
-            'sl_pct': float(sl_pct),
-            'tp_pct': float(tp_pct),
-            'rr_ratio': float(tp_pct / sl_pct),
+            'stop_loss': stop_loss,
+            'take_profit': take_profit,
+            'sl_pct': sl_pct,
+            'tp_pct': tp_pct,
+            'rr_ratio': tp_pct / sl_pct,
             'position_size_pct': float(position_size_pct),
-            'atr_used': float(atr),
+            'atr_used': atr,
         }
     
     def get_regime_params(self, regime: str) -> Dict[str, float]:
@@ -236,7 +246,7 @@ class AdaptiveRiskManager:
             Position size as percentage of account
         """
         if max_position_pct is None:
-            max_position_pct = Decimal(os.getenv('MAX_POSITION_SIZE_PCT', '55'))
+            max_position_pct = self.max_position_pct
         
         # Calculate stop distance in %
         stop_distance_pct = abs(entry_price - stop_loss) / entry_price * 100
@@ -389,5 +399,4 @@ class AdaptiveRiskManager:
         position_pct = (risk_pct / sl_pct) * self.base_leverage * 100
         
         # Cap at maximum
-        max_pct = Decimal(os.getenv('MAX_POSITION_SIZE_PCT', '55'))
-        return min(position_pct, max_pct)
+        return min(position_pct, self.max_position_pct)
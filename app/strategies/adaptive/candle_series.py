@@ -0,0 +1,94 @@
+"""
+Shared Candle Series
+Parses a candle list into float64 OHLCV arrays once per candle refresh.
+
+Several components of one strategy (Smart Money, OBV, ...) receive the same
+candle list on every tick and each used to convert it field by field. The
+bot replaces the list object whenever it fetches new candles, so the parsed
+arrays can be reused until a different list (or a changed tail) shows up.
+Array kernels shared by those indicators (True Range) live here as well.
+"""
+
+import logging
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+_LONG_OHLCV_KEYS = ('open', 'high', 'low', 'close', 'volume')
+_SHORT_OHLCV_KEYS = ('o', 'h', 'l', 'c', 'v')
+
+# Holds (candles, length, last_candle, arrays); keeping the list reference
+# alive makes the identity check safe.
+_series_cache: Optional[tuple] = None
+
+
+def candle_arrays(candles: List[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Get float64 OHLCV arrays for a candle list, parsed once per list.
+    
+    The arrays are shared between callers and marked read-only.
+    
+    Args:
+        candles: OHLCV candles, oldest first
+    
+    Returns:
+        Tuple of (opens, highs, lows, closes, volumes)
+    """
+    global _series_cache
+    
+    n = len(candles)
+    last = candles[-1] if candles else None
+    cached = _series_cache
+    if cached is not None and cached[0] is candles and cached[1] == n and cached[2] is last:
+        return cached[3]
+    
+    arrays = _parse(candles)
+    for arr in arrays:
+        arr.flags.writeable = False
+    _series_cache = (candles, n, last, arrays)
+    return arrays
+
+
+def _parse(candles: List[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert candles into float64 OHLCV arrays.
+    
+    Candles in one list share a key naming ('open'... or 'o'...), so the
+    first candle picks an itemgetter that reads all five fields in one call.
+    """
+    first = candles[0] if candles else {}
+    for keys in (_LONG_OHLCV_KEYS, _SHORT_OHLCV_KEYS):
+        if all(k in first for k in keys):
+            try:
+                ohlcv = np.array(list(map(itemgetter(*keys), candles)), dtype=np.float64)
+            except KeyError:
+                break  # Mixed key naming - fall back to per-field lookups
+            opens, highs, lows, closes, volumes = ohlcv.T.copy()
+            return opens, highs, lows, closes, volumes
+    
+    n = len(candles)
+    opens = np.fromiter((float(c.get('open', c.get('o', 0))) for c in candles), dtype=np.float64, count=n)
+    highs = np.fromiter((float(c.get('high', c.get('h', 0))) for c in candles), dtype=np.float64, count=n)
+    lows = np.fromiter((float(c.get('low', c.get('l', 0))) for c in candles), dtype=np.float64, count=n)
+    closes = np.fromiter((float(c.get('close', c.get('c', 0))) for c in candles), dtype=np.float64, count=n)
+    volumes = np.fromiter((float(c.get('volume', c.get('v', 0))) for c in candles), dtype=np.float64, count=n)
+    return opens, highs, lows, closes, volumes
+
+
+def true_range(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> np.ndarray:
+    """
+    True Range for bars 1..n-1: max(H-L, |H-prev_close|, |L-prev_close|).
+    
+    Args:
+        highs, lows, closes: Aligned OHLC arrays
+        
+    Returns:
+        True range of each bar from the second one on
+    """
+    high = highs[1:]
+    low = lows[1:]
+    prev_close = closes[:-1]
+    return np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
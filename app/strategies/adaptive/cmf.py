@@ -27,11 +27,12 @@ from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from collections import deque
+from itertools import islice
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CMFResult:
     """CMF calculation result."""
     cmf: float              # CMF value (-1 to +1)
@@ -89,9 +90,10 @@ class ChaikinMoneyFlow:
         if len(candles) < self.period:
             return None
         
-        # Calculate Money Flow Volume for each candle in period
-        mf_volumes = []
-        volumes = []
+        # Accumulate Money Flow Volume and volume sums for the period directly
+        # (running totals instead of building two lists just to sum them)
+        mf_volume_sum = 0.0
+        total_volume = 0.0
         
         for candle in candles[-self.period:]:
             high = float(candle.get('high', candle.get('h', 0)))
@@ -106,15 +108,12 @@ class ChaikinMoneyFlow:
                 mf_multiplier = 0
             
             # Money Flow Volume
-            mf_volume = mf_multiplier * volume
-            
-            mf_volumes.append(mf_volume)
-            volumes.append(volume)
+            mf_volume_sum += mf_multiplier * volume
+            total_volume += volume
         
         # CMF = Sum(MF Volume) / Sum(Volume)
-        total_volume = sum(volumes)
         if total_volume > 0:
-            cmf = sum(mf_volumes) / total_volume
+            cmf = mf_volume_sum / total_volume
         else:
             cmf = 0
         
@@ -133,8 +132,7 @@ class ChaikinMoneyFlow:
         # Determine trend
         self._cmf_history.append(cmf)
         if len(self._cmf_history) >= 5:
-            recent = list(self._cmf_history)[-5:]
-            cmf_change = recent[-1] - recent[0]
+            cmf_change = self._cmf_history[-1] - self._cmf_history[-5]
             
             if cmf_change > 0.05:
                 trend = 'rising'
@@ -168,8 +166,8 @@ class ChaikinMoneyFlow:
         if len(self._cmf_history) < 10 or len(self._price_history) < 10:
             return None
         
-        recent_cmf = list(self._cmf_history)[-10:]
-        recent_price = list(self._price_history)[-10:]
+        recent_cmf = list(islice(self._cmf_history, len(self._cmf_history) - 10, None))
+        recent_price = list(islice(self._price_history, len(self._price_history) - 10, None))
         
         # Split into first half and second half
         first_half_price = recent_price[:5]
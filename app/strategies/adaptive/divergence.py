@@ -21,6 +21,8 @@ from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
 
 class DivergenceType(Enum):
     """Types of divergence."""
@@ -30,7 +32,13 @@ class DivergenceType(Enum):
     HIDDEN_BEARISH = "hidden_bearish"       # Continuation down
 
 
-@dataclass
+# Divergence groups as constant tuples (no list built per membership test)
+_BULLISH_TYPES = (DivergenceType.REGULAR_BULLISH, DivergenceType.HIDDEN_BULLISH)
+_BEARISH_TYPES = (DivergenceType.REGULAR_BEARISH, DivergenceType.HIDDEN_BEARISH)
+_REGULAR_TYPES = (DivergenceType.REGULAR_BULLISH, DivergenceType.REGULAR_BEARISH)
+
+
+@dataclass(slots=True)
 class Divergence:
     """Represents a detected divergence."""
     divergence_type: DivergenceType
@@ -97,22 +105,26 @@ class DivergenceDetector:
         if len(candles) < self.lookback:
             return {'divergences': [], 'signal': None}
         
-        prices = [Decimal(str(c.get('close', c.get('c', 0)))) for c in candles]
+        # _detect_divergences only looks at the last `lookback` bars, so only
+        # that window of candles/MACD values is converted to Decimal
+        prices = [Decimal(str(c.get('close', c.get('c', 0)))) for c in candles[-self.lookback:]]
         
         # Detect RSI divergences
         if len(rsi_values) >= self.lookback:
             rsi_divs = self._detect_divergences(prices, rsi_values, 'rsi')
             self.recent_divergences.extend(rsi_divs)
         
+        recent_macd = macd_values[-self.lookback:]
+        
         # Detect MACD divergences (using MACD line, not histogram)
         if len(macd_values) >= self.lookback:
-            macd_line = [Decimal(str(m.get('macd', 0))) for m in macd_values]
+            macd_line = [Decimal(str(m.get('macd', 0))) for m in recent_macd]
             macd_divs = self._detect_divergences(prices, macd_line, 'macd')
             self.recent_divergences.extend(macd_divs)
         
         # Detect MACD histogram divergences (often earlier signal)
         if len(macd_values) >= self.lookback:
-            histogram = [Decimal(str(m.get('histogram', 0))) for m in macd_values]
+            histogram = [Decimal(str(m.get('histogram', 0))) for m in recent_macd]
             hist_divs = self._detect_divergences(prices, histogram, 'macd_histogram')
             self.recent_divergences.extend(hist_divs)
         
@@ -142,6 +154,7 @@ class DivergenceDetector:
         # Use last N bars
         prices = prices[-self.lookback:]
         indicator = indicator[-self.lookback:]
+        now = datetime.now(_UTC)  # One timestamp for every divergence found in this pass
         
         # Find swing highs and lows in price
         price_highs = self._find_swing_highs(prices)
@@ -173,7 +186,7 @@ class DivergenceDetector:
                             indicator_point2=float(ih2),
                             bar_distance=bar_dist,
                             strength=strength,
-                            detected_at=datetime.now(timezone.utc),
+                            detected_at=now,
                         ))
         
         # Check for REGULAR BULLISH divergence (Lower price lows, higher indicator lows)
@@ -198,7 +211,7 @@ class DivergenceDetector:
                             indicator_point2=float(il2),
                             bar_distance=bar_dist,
                             strength=strength,
-                            detected_at=datetime.now(timezone.utc),
+                            detected_at=now,
                         ))
         
         # Check for HIDDEN BULLISH divergence (Higher price lows, lower indicator lows)
@@ -223,7 +236,7 @@ class DivergenceDetector:
                             indicator_point2=float(il2),
                             bar_distance=bar_dist,
                             strength=strength,
-                            detected_at=datetime.now(timezone.utc),
+                            detected_at=now,
                         ))
         
         # Check for HIDDEN BEARISH divergence (Lower price highs, higher indicator highs)
@@ -248,7 +261,7 @@ class DivergenceDetector:
                             indicator_point2=float(ih2),
                             bar_distance=bar_dist,
                             strength=strength,
-                            detected_at=datetime.now(timezone.utc),
+                            detected_at=now,
                         ))
         
         return divergences
@@ -345,9 +358,9 @@ class DivergenceDetector:
         
         # Prioritize recent divergences
         bullish_divs = [d for d in self.recent_divergences 
-                       if d.divergence_type in [DivergenceType.REGULAR_BULLISH, DivergenceType.HIDDEN_BULLISH]]
+                       if d.divergence_type in _BULLISH_TYPES]
         bearish_divs = [d for d in self.recent_divergences 
-                       if d.divergence_type in [DivergenceType.REGULAR_BEARISH, DivergenceType.HIDDEN_BEARISH]]
+                       if d.divergence_type in _BEARISH_TYPES]
         
         # Calculate combined strength
         bullish_strength = sum(d.strength for d in bullish_divs)
@@ -423,12 +436,12 @@ class DivergenceDetector:
         reasons = []
         
         for div in self.recent_divergences:
-            is_bullish = div.divergence_type in [DivergenceType.REGULAR_BULLISH, DivergenceType.HIDDEN_BULLISH]
-            is_bearish = div.divergence_type in [DivergenceType.REGULAR_BEARISH, DivergenceType.HIDDEN_BEARISH]
+            is_bullish = div.divergence_type in _BULLISH_TYPES
+            is_bearish = div.divergence_type in _BEARISH_TYPES
             
             if (direction == 'long' and is_bullish) or (direction == 'short' and is_bearish):
                 # Regular divergence = stronger signal
-                if div.divergence_type in [DivergenceType.REGULAR_BULLISH, DivergenceType.REGULAR_BEARISH]:
+                if div.divergence_type in _REGULAR_TYPES:
                     score += 2.0 * div.strength
                     reasons.append(f"Regular {div.indicator.upper()} divergence")
                 else:
@@ -25,8 +25,11 @@ import logging
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from collections import deque
 from enum import Enum
 
+from app.strategies.adaptive.candle_series import candle_arrays
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,7 +42,15 @@ class DonchianPosition(Enum):
     BELOW_LOWER = "below_lower"  # Breakdown bearish
 
 
-@dataclass
+# Position members bound once for the per-call classification in calculate()
+_ABOVE_UPPER = DonchianPosition.ABOVE_UPPER
+_UPPER_ZONE = DonchianPosition.UPPER_ZONE
+_MIDDLE = DonchianPosition.MIDDLE
+_LOWER_ZONE = DonchianPosition.LOWER_ZONE
+_BELOW_LOWER = DonchianPosition.BELOW_LOWER
+
+
+@dataclass(slots=True)
 class DonchianResult:
     """Donchian Channel calculation result."""
     upper: Decimal      # Highest high
@@ -80,14 +91,14 @@ class DonchianChannel:
         self.period = period
         self.offset = offset
         
-        # State for breakout detection
-        self._prev_upper: Optional[Decimal] = None
-        self._prev_lower: Optional[Decimal] = None
-        self._prev_close: Optional[Decimal] = None
+        # State for breakout detection: previous close relative to each band
+        self._prev_upper_diff: Optional[Decimal] = None  # prev close - prev upper
+        self._prev_lower_diff: Optional[Decimal] = None  # prev close - prev lower
         
-        # Track channel width for squeeze detection
-        self._width_history: List[float] = []
+        # Track channel width for squeeze detection (bounded, O(1) eviction)
         self._max_history = 20
+        self._width_history: deque = deque(maxlen=self._max_history)
+        self._width_sum = 0.0  # Running sum of _width_history
         
         logger.info(f"📊 Donchian Channel initialized: period={period}, offset={offset}")
     
@@ -111,32 +122,30 @@ class DonchianChannel:
         if start_idx < 0:
             start_idx = 0
         
-        analysis_candles = candles[start_idx:end_idx]
-        
-        if not analysis_candles:
+        if end_idx <= start_idx:
             return None
         
-        # Calculate highest high and lowest low
-        highs = [Decimal(str(c.get('high', c.get('h', 0)))) for c in analysis_candles]
-        lows = [Decimal(str(c.get('low', c.get('l', 0)))) for c in analysis_candles]
-        
-        upper = max(highs)
-        lower = min(lows)
+        # Highest high / lowest low from the strategy's shared float arrays
+        # (already parsed this tick); only the two extremes become Decimal
+        _, highs, lows, _, _ = candle_arrays(candles)
+        upper = Decimal(str(float(highs[start_idx:end_idx].max())))
+        lower = Decimal(str(float(lows[start_idx:end_idx].min())))
         middle = (upper + lower) / 2
         width = upper - lower
         
         # Width as percentage
         width_pct = float(width / middle * 100) if middle > 0 else 0.0
         
-        # Track width history for squeeze detection
+        # Track width history (and its running sum) for squeeze detection
+        if len(self._width_history) == self._max_history:
+            self._width_sum -= self._width_history[0]  # Oldest value is about to be evicted
         self._width_history.append(width_pct)
-        if len(self._width_history) > self._max_history:
-            self._width_history.pop(0)
+        self._width_sum += width_pct
         
         # Detect squeeze (narrow channel = low volatility, often precedes big move)
         squeeze = False
         if len(self._width_history) >= 5:
-            avg_width = sum(self._width_history) / len(self._width_history)
+            avg_width = self._width_sum / len(self._width_history)
             squeeze = width_pct < avg_width * 0.7  # 30% below average
         
         # Get current price
@@ -147,32 +156,33 @@ class DonchianChannel:
         
         # Determine position within channel
         if close > upper:
-            position = DonchianPosition.ABOVE_UPPER
+            position = _ABOVE_UPPER
         elif close < lower:
-            position = DonchianPosition.BELOW_LOWER
+            position = _BELOW_LOWER
         elif close > middle + (width * Decimal('0.25')):
-            position = DonchianPosition.UPPER_ZONE
+            position = _UPPER_ZONE
         elif close < middle - (width * Decimal('0.25')):
-            position = DonchianPosition.LOWER_ZONE
+            position = _LOWER_ZONE
         else:
-            position = DonchianPosition.MIDDLE
+            position = _MIDDLE
         
-        # Detect breakouts
+        # Detect breakouts from the sign change of close relative to each band
         breakout = None
-        if self._prev_upper is not None and self._prev_close is not None:
-            # Bullish breakout: price was below upper, now closes above
-            if self._prev_close <= self._prev_upper and close > upper:
+        upper_diff = close - upper
+        lower_diff = close - lower
+        if self._prev_upper_diff is not None:
+            # Bullish breakout: price was at/below upper, now closes above
+            if self._prev_upper_diff <= 0 < upper_diff:
                 breakout = 'bullish'
                 logger.info(f"🚀 Donchian BULLISH breakout @ {float(close):.2f} (above {float(upper):.2f})")
-            # Bearish breakdown: price was above lower, now closes below
-            elif self._prev_close >= self._prev_lower and close < lower:
+            # Bearish breakdown: price was at/above lower, now closes below
+            elif self._prev_lower_diff >= 0 > lower_diff:
                 breakout = 'bearish'
                 logger.info(f"📉 Donchian BEARISH breakdown @ {float(close):.2f} (below {float(lower):.2f})")
         
         # Update state
-        self._prev_upper = upper
-        self._prev_lower = lower
-        self._prev_close = close
+        self._prev_upper_diff = upper_diff
+        self._prev_lower_diff = lower_diff
         
         return DonchianResult(
             upper=upper,
@@ -205,13 +215,13 @@ class DonchianChannel:
             return ('short', 0.85)
         
         # Position-based signals
-        if result.position == DonchianPosition.ABOVE_UPPER:
+        if result.position is _ABOVE_UPPER:
             return ('long', 0.7)
-        elif result.position == DonchianPosition.BELOW_LOWER:
+        elif result.position is _BELOW_LOWER:
             return ('short', 0.7)
-        elif result.position == DonchianPosition.UPPER_ZONE:
+        elif result.position is _UPPER_ZONE:
             return ('long', 0.5)
-        elif result.position == DonchianPosition.LOWER_ZONE:
+        elif result.position is _LOWER_ZONE:
             return ('short', 0.5)
         
         # Middle = neutral
@@ -259,7 +269,7 @@ class DonchianChannel:
     
     def reset(self):
         """Reset indicator state."""
-        self._prev_upper = None
-        self._prev_lower = None
-        self._prev_close = None
-        self._width_history = []
+        self._prev_upper_diff = None
+        self._prev_lower_diff = None
+        self._width_history.clear()
+        self._width_sum = 0.0
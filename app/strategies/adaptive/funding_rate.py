@@ -15,9 +15,13 @@ import logging
 from decimal import Decimal
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timezone, timedelta
+from collections import deque
+from itertools import islice
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
 
 class FundingRateFilter:
     """
@@ -50,7 +54,7 @@ class FundingRateFilter:
         self.warning_low = Decimal(os.getenv('FUNDING_WARNING_LOW', '-0.0005'))   # -0.05%
         
         # Funding rate history
-        self.funding_history: Dict[str, list] = {}  # symbol -> list of rates
+        self.funding_history: Dict[str, deque] = {}  # symbol -> last 100 rates
         
         # Cache
         self._cache: Dict[str, Tuple[Decimal, datetime]] = {}
@@ -72,10 +76,12 @@ class FundingRateFilter:
         Returns:
             Funding rate as Decimal (e.g., 0.0001 = 0.01%)
         """
+        now = datetime.now(_UTC)
+        
         # Check cache
         if symbol in self._cache:
             rate, cached_at = self._cache[symbol]
-            if (datetime.now(timezone.utc) - cached_at).total_seconds() < self._cache_ttl:
+            if (now - cached_at).total_seconds() < self._cache_ttl:
                 return rate
         
         try:
@@ -86,14 +92,12 @@ class FundingRateFilter:
                     rate = Decimal(str(funding))
                     
                     # Cache it
-                    self._cache[symbol] = (rate, datetime.now(timezone.utc))
+                    self._cache[symbol] = (rate, now)
                     
                     # Update history
                     if symbol not in self.funding_history:
-                        self.funding_history[symbol] = []
+                        self.funding_history[symbol] = deque(maxlen=100)  # O(1) eviction
                     self.funding_history[symbol].append(float(rate))
-                    if len(self.funding_history[symbol]) > 100:
-                        self.funding_history[symbol].pop(0)
                     
                     return rate
         except Exception as e:
@@ -237,7 +241,7 @@ class FundingRateFilter:
         
         return {
             'current': history[-1] if history else None,
-            'avg_1h': sum(history[-8:]) / len(history[-8:]) if len(history) >= 8 else None,  # 8x 8hr = 1 day approx
+            'avg_1h': sum(islice(history, len(history) - 8, None)) / 8 if len(history) >= 8 else None,  # 8x 8hr = 1 day approx
             'min': min(history),
             'max': max(history),
             'trend': 'rising' if len(history) >= 2 and history[-1] > history[-2] else 'falling',
@@ -10,10 +10,13 @@ from decimal import Decimal
 from typing import Dict, Any, Optional, List, Tuple
 from enum import Enum
 from collections import deque
+from itertools import islice
 from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
 
 class MarketRegime(Enum):
     """Market regime classifications."""
@@ -25,6 +28,10 @@ class MarketRegime(Enum):
     UNKNOWN = "unknown"
 
 
+# Directional regimes as a constant tuple (no list built per membership test)
+TRENDING_REGIMES = (MarketRegime.TRENDING_UP, MarketRegime.TRENDING_DOWN)
+
+
 class MarketRegimeDetector:
     """
     ML-Lite Market Regime Classifier
@@ -59,6 +66,7 @@ class MarketRegimeDetector:
         # ATR baseline for volatility comparison
         self._atr_baseline: Optional[Decimal] = None
         self._atr_history: deque = deque(maxlen=100)
+        self._atr_sum = 0.0  # Running sum of _atr_history (avoids re-summing every tick)
         
         # Strategy parameter adjustments per regime
         self.regime_params = {
@@ -149,9 +157,13 @@ class MarketRegimeDetector:
         
         # Update ATR baseline
         if atr:
-            self._atr_history.append(float(atr))
+            atr_f = float(atr)
+            if len(self._atr_history) == self._atr_history.maxlen:
+                self._atr_sum -= self._atr_history[0]  # Oldest value is about to be evicted
+            self._atr_history.append(atr_f)
+            self._atr_sum += atr_f
             if len(self._atr_history) >= 50:
-                self._atr_baseline = Decimal(str(sum(self._atr_history) / len(self._atr_history)))
+                self._atr_baseline = Decimal(str(self._atr_sum / len(self._atr_history)))
         
         # Classification logic
         regime = MarketRegime.UNKNOWN
@@ -182,19 +194,17 @@ class MarketRegimeDetector:
                     regime = MarketRegime.TRENDING_DOWN
                 else:
                     # EMAs too close - stay in previous direction or use price action
-                    if self.current_regime in [MarketRegime.TRENDING_UP, MarketRegime.TRENDING_DOWN]:
+                    if self.current_regime in TRENDING_REGIMES:
                         regime = self.current_regime  # Keep current direction
                     else:
                         # Use price action as tiebreaker
-                        prices = [Decimal(str(c.get('close', c.get('c', 0)))) for c in candles[-20:]]
-                        if prices[-1] > prices[0]:
+                        if self._price_rising(candles):
                             regime = MarketRegime.TRENDING_UP
                         else:
                             regime = MarketRegime.TRENDING_DOWN
             else:
                 # Use price action
-                prices = [Decimal(str(c.get('close', c.get('c', 0)))) for c in candles[-20:]]
-                if prices[-1] > prices[0]:
+                if self._price_rising(candles):
                     regime = MarketRegime.TRENDING_UP
                 else:
                     regime = MarketRegime.TRENDING_DOWN
@@ -225,8 +235,7 @@ class MarketRegimeDetector:
                         else:
                             regime = MarketRegime.TRENDING_DOWN
                     else:
-                        prices = [Decimal(str(c.get('close', c.get('c', 0)))) for c in candles[-20:]]
-                        if prices[-1] > prices[0]:
+                        if self._price_rising(candles):
                             regime = MarketRegime.TRENDING_UP
                         else:
                             regime = MarketRegime.TRENDING_DOWN
@@ -252,17 +261,17 @@ class MarketRegimeDetector:
             if self.current_regime == MarketRegime.UNKNOWN and regime != MarketRegime.UNKNOWN:
                 old_regime = self.current_regime
                 self.current_regime = regime
-                self.regime_start_time = datetime.now(timezone.utc)
+                self.regime_start_time = datetime.now(_UTC)
                 logger.info(f"📊 Initial regime detected: {regime.value} (confidence: {confidence:.1%})")
             else:
                 # Subsequent changes need confirmation
-                recent = list(self.regime_history)[-3:] if len(self.regime_history) >= 3 else list(self.regime_history)
+                recent = islice(self.regime_history, max(0, len(self.regime_history) - 3), None)
                 regime_count = sum(1 for r in recent if r == regime)
                 
                 if regime_count >= 2:  # Confirmed - regime seen at least 2x in last 3 checks
                     old_regime = self.current_regime
                     self.current_regime = regime
-                    self.regime_start_time = datetime.now(timezone.utc)
+                    self.regime_start_time = datetime.now(_UTC)
                     logger.info(f"🔄 Regime changed: {old_regime.value} → {regime.value} (confidence: {confidence:.1%})")
                 else:
                     # Not confirmed yet - keep current regime but log at debug level
@@ -276,16 +285,26 @@ class MarketRegimeDetector:
     def get_regime_duration(self) -> float:
         """Get how long current regime has been active (seconds)."""
         if self.regime_start_time:
-            return (datetime.now(timezone.utc) - self.regime_start_time).total_seconds()
+            return (datetime.now(_UTC) - self.regime_start_time).total_seconds()
         return 0.0
     
     def is_regime_stable(self, min_confirmations: int = 3) -> bool:
         """Check if regime has been consistent (stable for trading)."""
         if len(self.regime_history) < min_confirmations:
             return False
-        recent = list(self.regime_history)[-min_confirmations:]
+        recent = islice(self.regime_history, len(self.regime_history) - min_confirmations, None)
         return len(set(recent)) == 1
     
+    def _price_rising(self, candles: List[Dict], lookback: int = 20) -> bool:
+        """
+        Check if the last close is above the close `lookback` candles ago.
+        
+        Only the two endpoint closes are read - no per-candle price list.
+        """
+        first = candles[max(0, len(candles) - lookback)]
+        last = candles[-1]
+        return Decimal(str(last.get('close', last.get('c', 0)))) > Decimal(str(first.get('close', first.get('c', 0))))
+    
     def _calculate_adx(self, candles: List[Dict], period: int = 14) -> Optional[Decimal]:
         """Calculate ADX from candles using proper True Range (H/L/C)."""
         if len(candles) < period * 2:
@@ -12,13 +12,21 @@ Features:
 import os
 import logging
 from decimal import Decimal
-from typing import Dict, Any, Optional, List
+import numpy as np
+from typing import Dict, Any, Optional, List, Tuple
 from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# BTC-side series shared by every per-symbol analyzer. All symbols in a scan
+# pass the same cached BTC candle list, so its returns/trend are computed once
+# per BTC refresh instead of once per symbol.
+# Holds (btc_candles, length, period, returns, trend); keeping the list reference
+# alive makes the identity check safe.
+_btc_series_cache: Optional[tuple] = None
+
 
 class CorrelationState(Enum):
     """Asset correlation state with BTC."""
@@ -102,9 +110,9 @@ class MultiAssetCorrelationAnalyzer:
         """
         notes = []
         
-        # Extract prices
-        asset_prices = self._extract_returns(asset_candles)
-        btc_prices = self._extract_returns(btc_candles)
+        # Extract prices (only the returns the correlation window needs)
+        asset_prices = self._extract_returns(asset_candles, self.correlation_period)
+        btc_prices, btc_trend = self._get_btc_series(btc_candles)
         
         if len(asset_prices) < self.correlation_period or len(btc_prices) < self.correlation_period:
             return CorrelationAnalysis(
@@ -154,8 +162,7 @@ class MultiAssetCorrelationAnalyzer:
             rs = RelativeStrength.MATCHING
             notes.append(f"Matching BTC (RS: {rs_ratio:.3f})")
         
-        # Determine BTC trend
-        btc_trend = self._get_btc_trend(btc_candles)
+        # BTC trend (computed with the shared BTC series above)
         notes.append(f"BTC trend: {btc_trend}")
         
         # Decision logic
@@ -177,17 +184,52 @@ class MultiAssetCorrelationAnalyzer:
             notes=notes,
         )
     
-    def _extract_returns(self, candles: List[Dict]) -> List[Decimal]:
-        """Extract percentage returns from candles."""
-        returns = []
-        for i in range(1, len(candles)):
-            prev_close = Decimal(str(candles[i-1].get('close', candles[i-1].get('c', 0))))
-            curr_close = Decimal(str(candles[i].get('close', candles[i].get('c', 0))))
-            
-            if prev_close > 0:
-                ret = ((curr_close - prev_close) / prev_close) * 100
-                returns.append(ret)
+    def _get_btc_series(self, btc_candles: List[Dict]) -> Tuple[List[Decimal], str]:
+        """
+        Get BTC returns and trend, shared across symbols.
+        
+        Args:
+            btc_candles: BTC price candles
+        
+        Returns:
+            Tuple of (returns, trend)
+        """
+        global _btc_series_cache
+        
+        cached = _btc_series_cache
+        if (cached is not None and cached[0] is btc_candles
+                and cached[1] == len(btc_candles) and cached[2] == self.correlation_period):
+            return cached[3], cached[4]
         
+        returns = self._extract_returns(btc_candles, self.correlation_period)
+        trend = self._get_btc_trend(btc_candles)
+        _btc_series_cache = (btc_candles, len(btc_candles), self.correlation_period, returns, trend)
+        return returns, trend
+    
+    def _extract_returns(self, candles: List[Dict], count: Optional[int] = None) -> List[Decimal]:
+        """
+        Extract percentage returns from candles.
+        
+        Args:
+            candles: Price candles, oldest first
+            count: Only extract the most recent `count` returns (None = all)
+        
+        Returns:
+            Returns in chronological order
+        """
+        returns = []
+        # Walk backwards so a bounded request stops after `count` returns
+        # instead of converting every candle in the history
+        curr_close = None
+        for i in range(len(candles) - 1, -1, -1):
+            close = Decimal(str(candles[i].get('close', candles[i].get('c', 0))))
+            if curr_close is not None and close > 0:
+                returns.append(((curr_close - close) / close) * 100)
+                if count is not None and len(returns) >= count:
+                    break
+            curr_close = close
+        
+        returns.reverse()
         return returns
     
     def _calculate_correlation(
@@ -200,26 +242,21 @@ class MultiAssetCorrelationAnalyzer:
         if n < 2:
             return Decimal('0')
         
-        # Align series
-        a = returns_a[-n:]
-        b = returns_b[-n:]
-        
-        # Calculate means
-        mean_a = sum(a) / n
-        mean_b = sum(b) / n
-        
-        # Calculate covariance and std devs
-        cov = sum((a[i] - mean_a) * (b[i] - mean_b) for i in range(n)) / n
-        std_a = (sum((x - mean_a) ** 2 for x in a) / n) ** Decimal('0.5')
-        std_b = (sum((x - mean_b) ** 2 for x in b) / n) ** Decimal('0.5')
+        # Align series and demean as float64 arrays (vectorized, no per-element Decimal math)
+        a = np.asarray(returns_a[-n:], dtype=np.float64)
+        b = np.asarray(returns_b[-n:], dtype=np.float64)
+        a -= a.mean()
+        b -= b.mean()
         
-        if std_a == 0 or std_b == 0:
+        # Pearson r = sum(da*db) / sqrt(sum(da^2) * sum(db^2)) - the 1/n terms cancel
+        denom = float(np.sqrt(np.dot(a, a) * np.dot(b, b)))
+        if denom == 0:
             return Decimal('0')
         
-        correlation = cov / (std_a * std_b)
+        correlation = float(np.dot(a, b)) / denom
         
         # Clamp to [-1, 1]
-        return max(min(correlation, Decimal('1')), Decimal('-1'))
+        return Decimal(str(max(min(correlation, 1.0), -1.0)))
     
     def _calculate_relative_strength(
         self,
@@ -23,6 +23,11 @@ class TrendDirection(Enum):
     STRONG_DOWN = "strong_down"
 
 
+# Direction groups as constant tuples (no list built per membership test)
+_UP_TRENDS = (TrendDirection.UP, TrendDirection.STRONG_UP)
+_DOWN_TRENDS = (TrendDirection.DOWN, TrendDirection.STRONG_DOWN)
+
+
 class MultiTimeframeAnalyzer:
     """
     Multi-Timeframe Analysis (MTF)
@@ -125,22 +130,29 @@ class MultiTimeframeAnalyzer:
                     trend = TrendDirection.NEUTRAL
                     trend_strength = 0.3
         
-        # Calculate key levels
-        highs = [Decimal(str(c.get('high', c.get('h', 0)))) for c in candles[-20:]]
-        lows = [Decimal(str(c.get('low', c.get('l', 0)))) for c in candles[-20:]]
+        # Calculate key levels (floats straight away; the result is a float anyway)
+        key_candles = candles[-20:]
+        swing_high = max(float(c.get('high', c.get('h', 0))) for c in key_candles)
+        swing_low = min(float(c.get('low', c.get('l', 0))) for c in key_candles)
+        
+        # Alignment weight and weighted strength are fixed per analysis, so they
+        # are computed here once instead of on every alignment/bias query
+        weight = self.alignment_weights.get(interval, 0.2)
         
         analysis = {
             'interval': interval,
             'trend': trend,
             'trend_strength': trend_strength,
+            'weight': weight,
+            'weighted_strength': weight * trend_strength,
             'ema_fast': float(ema_fast) if ema_fast else None,
             'ema_slow': float(ema_slow) if ema_slow else None,
             'adx': float(adx) if adx else None,
             'current_price': float(current_price),
-            'swing_high': float(max(highs)),
-            'swing_low': float(min(lows)),
-            'bias': 'bullish' if trend in [TrendDirection.UP, TrendDirection.STRONG_UP] else
-                    'bearish' if trend in [TrendDirection.DOWN, TrendDirection.STRONG_DOWN] else 'neutral',
+            'swing_high': swing_high,
+            'swing_low': swing_low,
+            'bias': 'bullish' if trend in _UP_TRENDS else
+                    'bearish' if trend in _DOWN_TRENDS else 'neutral',
         }
         
         # Cache HTF analysis
@@ -175,30 +187,29 @@ class MultiTimeframeAnalyzer:
         reasons = []
         
         for interval, analysis in htf_analyses.items():
-            weight = self.alignment_weights.get(interval, 0.2)
+            weight, weighted_strength = self._weighted_strength(interval, analysis)
             total_weight += weight
             
             trend = analysis.get('trend', TrendDirection.NEUTRAL)
-            strength = analysis.get('trend_strength', 0)
             
             if ltf_direction == 'long':
-                if trend in [TrendDirection.UP, TrendDirection.STRONG_UP]:
-                    aligned_weight += weight * strength
+                if trend in _UP_TRENDS:
+                    aligned_weight += weighted_strength
                     reasons.append(f"{interval}:✅UP")
-                elif trend in [TrendDirection.DOWN, TrendDirection.STRONG_DOWN]:
+                elif trend in _DOWN_TRENDS:
                     # Against HTF trend - reduce score
-                    aligned_weight -= weight * strength * 0.5
+                    aligned_weight -= weighted_strength * 0.5
                     reasons.append(f"{interval}:❌DOWN")
                 else:
                     aligned_weight += weight * 0.3  # Neutral doesn't hurt much
                     reasons.append(f"{interval}:➖NEUTRAL")
             
             elif ltf_direction == 'short':
-                if trend in [TrendDirection.DOWN, TrendDirection.STRONG_DOWN]:
-                    aligned_weight += weight * strength
+                if trend in _DOWN_TRENDS:
+                    aligned_weight += weighted_strength
                     reasons.append(f"{interval}:✅DOWN")
-                elif trend in [TrendDirection.UP, TrendDirection.STRONG_UP]:
-                    aligned_weight -= weight * strength * 0.5
+                elif trend in _UP_TRENDS:
+                    aligned_weight -= weighted_strength * 0.5
                     reasons.append(f"{interval}:❌UP")
                 else:
                     aligned_weight += weight * 0.3
@@ -246,14 +257,13 @@ class MultiTimeframeAnalyzer:
         bearish_score = 0.0
         
         for interval, analysis in self.htf_cache.items():
-            weight = self.alignment_weights.get(interval, 0.2)
+            _, weighted_strength = self._weighted_strength(interval, analysis)
             trend = analysis.get('trend', TrendDirection.NEUTRAL)
-            strength = analysis.get('trend_strength', 0)
             
-            if trend in [TrendDirection.UP, TrendDirection.STRONG_UP]:
-                bullish_score += weight * strength
-            elif trend in [TrendDirection.DOWN, TrendDirection.STRONG_DOWN]:
-                bearish_score += weight * strength
+            if trend in _UP_TRENDS:
+                bullish_score += weighted_strength
+            elif trend in _DOWN_TRENDS:
+                bearish_score += weighted_strength
         
         if bullish_score > bearish_score * 1.3:
             return 'bullish'
@@ -261,6 +271,19 @@ class MultiTimeframeAnalyzer:
             return 'bearish'
         return 'neutral'
     
+    def _weighted_strength(self, interval: str, analysis: Dict) -> Tuple[float, float]:
+        """
+        Get (weight, weight * trend_strength) for an HTF analysis.
+        
+        Uses the values precomputed by analyze_timeframe; analyses built
+        elsewhere fall back to the weight table.
+        """
+        weighted_strength = analysis.get('weighted_strength')
+        if weighted_strength is not None:
+            return analysis['weight'], weighted_strength
+        weight = self.alignment_weights.get(interval, 0.2)
+        return weight, weight * analysis.get('trend_strength', 0)
+    
     def _calculate_ema(self, prices: List[Decimal], period: int) -> Optional[Decimal]:
         """Calculate EMA."""
         if len(prices) < period:
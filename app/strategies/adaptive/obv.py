@@ -26,11 +26,28 @@ from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from collections import deque
+import numpy as np
+
+from app.strategies.adaptive.candle_series import candle_arrays
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass 
+def _obv_series(closes: np.ndarray, volumes: np.ndarray) -> np.ndarray:
+    """
+    Running OBV for bars 1..n-1 (volume added on up-closes, subtracted on down-closes).
+    
+    Args:
+        closes: Close prices
+        volumes: Volumes aligned with closes
+        
+    Returns:
+        OBV after each bar from the second one on
+    """
+    return np.cumsum(np.sign(np.diff(closes)) * volumes[1:])
+
+
+@dataclass(slots=True)
 class OBVResult:
     """OBV calculation result."""
     obv: float              # Current OBV value
@@ -86,22 +103,9 @@ class OBVCalculator:
         if len(candles) < 10:
             return None
         
-        # Calculate OBV
-        obv = 0.0
-        obv_values = []
-        
-        for i in range(1, len(candles)):
-            close = float(candles[i].get('close', candles[i].get('c', 0)))
-            prev_close = float(candles[i-1].get('close', candles[i-1].get('c', 0)))
-            volume = float(candles[i].get('volume', candles[i].get('v', 0)))
-            
-            if close > prev_close:
-                obv += volume
-            elif close < prev_close:
-                obv -= volume
-            # If equal, OBV stays same
-            
-            obv_values.append(obv)
+        # Calculate OBV (closes/volumes from the shared per-tick parse, accumulated in numpy)
+        _, _, _, closes, volumes = candle_arrays(candles)
+        obv_values = _obv_series(closes, volumes).tolist()
         
         if not obv_values:
             return None
@@ -147,11 +151,11 @@ class OBVCalculator:
             strength = 0.0
         
         # Detect divergence
-        divergence = self._detect_divergence(candles, obv_values)
+        divergence = self._detect_divergence(closes, obv_values)
         
         # Store for history
         self._obv_history.append(current_obv)
-        self._price_history.append(float(candles[-1].get('close', candles[-1].get('c', 0))))
+        self._price_history.append(float(closes[-1]))
         self._prev_obv_ema = obv_ema
         
         return OBVResult(
@@ -162,27 +166,27 @@ class OBVCalculator:
             strength=strength
         )
     
-    def _detect_divergence(self, candles: List[Dict], obv_values: List[float]) -> Optional[str]:
+    def _detect_divergence(self, closes: np.ndarray, obv_values: List[float]) -> Optional[str]:
         """
         Detect price/OBV divergence.
         
         Bullish divergence: Price making lower lows, OBV making higher lows
         Bearish divergence: Price making higher highs, OBV making lower highs
         """
-        if len(candles) < self.divergence_lookback or len(obv_values) < self.divergence_lookback:
+        if len(closes) < self.divergence_lookback or len(obv_values) < self.divergence_lookback:
             return None
         
         lookback = self.divergence_lookback
         
         # Get recent prices and OBV
-        recent_closes = [float(c.get('close', c.get('c', 0))) for c in candles[-lookback:]]
+        recent_close_arr = closes[-lookback:]
+        recent_closes = recent_close_arr.tolist()
         recent_obv = obv_values[-lookback:]
         
-        # Find local extremes
-        price_min_idx = recent_closes.index(min(recent_closes))
-        price_max_idx = recent_closes.index(max(recent_closes))
-        obv_min_idx = recent_obv.index(min(recent_obv))
-        obv_max_idx = recent_obv.index(max(recent_obv))
+        # Find local extremes (argmin/argmax return the first occurrence in one
+        # pass, same as list.index(min(...)) without the second scan)
+        price_min_idx = int(recent_close_arr.argmin())
+        price_max_idx = int(recent_close_arr.argmax())
         
         # Check for bullish divergence (price lower low, OBV higher low)
         # Recent price is near low, but OBV is not
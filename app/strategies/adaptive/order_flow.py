@@ -13,8 +13,10 @@ from datetime import datetime, timezone, timedelta
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
 
-@dataclass
+
+@dataclass(slots=True)
 class LargeTrade:
     """Represents a detected large trade."""
     timestamp: datetime
@@ -52,7 +54,7 @@ class OrderFlowAnalyzer:
         self.whale_trades: deque = deque(maxlen=50)
         
         # Volume profile
-        self.volume_profile: Dict[Decimal, Decimal] = {}
+        self.volume_profile: Dict[int, Decimal] = {}  # Bin index (price / bin size) -> volume
         self.poc_price: Optional[Decimal] = None  # Point of Control
         self.value_area_high: Optional[Decimal] = None
         self.value_area_low: Optional[Decimal] = None
@@ -85,7 +87,7 @@ class OrderFlowAnalyzer:
         Returns:
             LargeTrade if this is a significant trade, None otherwise
         """
-        timestamp = timestamp or datetime.now(timezone.utc)
+        timestamp = timestamp or datetime.now(_UTC)
         size_usd = price * size
         
         # Update delta
@@ -215,21 +217,24 @@ class OrderFlowAnalyzer:
         Returns:
             Tuple of (bias, buy_count, sell_count)
         """
-        cutoff = datetime.now(timezone.utc) - timedelta(minutes=lookback_minutes)
+        cutoff = datetime.now(_UTC) - timedelta(minutes=lookback_minutes)
         
         buy_count = 0
         sell_count = 0
         buy_volume = Decimal('0')
         sell_volume = Decimal('0')
         
-        for trade in self.whale_trades:
-            if trade.timestamp >= cutoff:
-                if trade.side == 'buy':
-                    buy_count += 1
-                    buy_volume += trade.size_usd
-                else:
-                    sell_count += 1
-                    sell_volume += trade.size_usd
+        # whale_trades is in arrival order: walk back from the newest and stop
+        # at the first trade outside the window
+        for trade in reversed(self.whale_trades):
+            if trade.timestamp < cutoff:
+                break
+            if trade.side == 'buy':
+                buy_count += 1
+                buy_volume += trade.size_usd
+            else:
+                sell_count += 1
+                sell_volume += trade.size_usd
         
         if buy_volume > sell_volume * Decimal('1.5'):
             return 'bullish', buy_count, sell_count
@@ -310,48 +315,56 @@ class OrderFlowAnalyzer:
     
     def _update_volume_profile(self, price: Decimal, volume: Decimal):
         """Update volume profile with new data."""
-        # Round price to bin (configurable bin size)
-        bin_size = self.volume_profile_bin_pct
-        binned_price = round(price / bin_size) * bin_size
+        # Round price to an integer bin index (configurable bin size); bins are
+        # converted back to prices only for POC/value area
+        bin_idx = round(price / self.volume_profile_bin_pct)
         
-        if binned_price in self.volume_profile:
-            self.volume_profile[binned_price] += volume
+        if bin_idx in self.volume_profile:
+            self.volume_profile[bin_idx] += volume
         else:
-            self.volume_profile[binned_price] = volume
+            self.volume_profile[bin_idx] = volume
     
     def _calculate_poc_and_value_area(self):
         """Calculate POC and Value Area from volume profile."""
         if not self.volume_profile:
             return
         
+        bin_size = self.volume_profile_bin_pct
+        
         # POC = price level with highest volume
-        self.poc_price = max(self.volume_profile, key=self.volume_profile.get)
+        poc_bin = max(self.volume_profile, key=self.volume_profile.get)
+        self.poc_price = poc_bin * bin_size
         
         # Value Area = 70% of volume centered on POC
         total_volume = sum(self.volume_profile.values())
         target_volume = total_volume * Decimal('0.7')
         
-        # Sort by distance from POC
-        sorted_prices = sorted(
+        # Sort by distance from POC (integer bin distance)
+        sorted_bins = sorted(
             self.volume_profile.keys(),
-            key=lambda p: abs(p - self.poc_price)
+            key=lambda b: abs(b - poc_bin)
         )
         
         cumulative = Decimal('0')
-        included_prices = []
+        included_bins = []
         
-        for price in sorted_prices:
-            cumulative += self.volume_profile[price]
-            included_prices.append(price)
+        for bin_idx in sorted_bins:
+            cumulative += self.volume_profile[bin_idx]
+            included_bins.append(bin_idx)
             if cumulative >= target_volume:
                 break
         
-        if included_prices:
-            self.value_area_high = max(included_prices)
-            self.value_area_low = min(included_prices)
+        if included_bins:
+            self.value_area_high = max(included_bins) * bin_size
+            self.value_area_low = min(included_bins) * bin_size
     
     def _count_recent_whales(self, hours: int = 1) -> int:
         """Count whale trades in last N hours."""
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+        cutoff = datetime.now(_UTC) - timedelta(hours=hours)
         
-        return sum(1 for t in self.whale_trades if t.timestamp >= cutoff)
+        count = 0
+        for trade in reversed(self.whale_trades):  # Newest first; stop at the window edge
+            if trade.timestamp < cutoff:
+                break
+            count += 1
+        return count
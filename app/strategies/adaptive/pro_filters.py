@@ -20,11 +20,14 @@ from typing import Dict, Any, Optional, Tuple, List
 from enum import Enum
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
 
-@dataclass
+
+@dataclass(slots=True)
 class FilterResult:
     """Result of filter check."""
     passed: bool
@@ -70,9 +73,10 @@ class ProTradingFilters:
         # Momentum alignment
         self.require_all_momentum_agree = True  # RSI + MACD + EMA must agree
         
-        # ATR history for volatility regime
-        self._atr_history: List[float] = []
+        # ATR history for volatility regime (deque drops the oldest in O(1))
         self._atr_history_max = 100
+        self._atr_history: deque = deque(maxlen=self._atr_history_max)
+        self._atr_sum = 0.0  # Running sum of _atr_history (avoids re-summing every check)
         
         logger.info("🎯 Pro Trading Filters initialized")
         logger.info(f"   HTF Min Alignment: {self.htf_min_alignment*100:.0f}%")
@@ -141,7 +145,7 @@ class ProTradingFilters:
         
         # 4. Time Filter - Avoid first 15 min of major session opens
         total_checks += 1
-        time_passed, time_reason = self.check_time_filter(datetime.now(timezone.utc))
+        time_passed, time_reason = self.check_time_filter(datetime.now(_UTC))
         if time_passed:
             checks_passed += 1
         else:
@@ -266,17 +270,18 @@ class ProTradingFilters:
         - Too low = Choppy, fees eat profits
         - Too high = Unpredictable, reduce size
         """
-        # Update ATR history
+        # Update ATR history and its running sum
+        if len(self._atr_history) == self._atr_history.maxlen:
+            self._atr_sum -= self._atr_history[0]  # Oldest value is about to be evicted
         self._atr_history.append(current_atr)
-        if len(self._atr_history) > self._atr_history_max:
-            self._atr_history.pop(0)
+        self._atr_sum += current_atr
         
         # Need history to compare
         if len(self._atr_history) < 20:
             return True, "Warming up", VolatilityRegime.NORMAL
         
         # Calculate average ATR
-        avg_atr = sum(self._atr_history) / len(self._atr_history)
+        avg_atr = self._atr_sum / len(self._atr_history)
         vol_ratio = current_atr / avg_atr if avg_atr > 0 else 1.0
         
         # Classify regime
@@ -326,7 +331,8 @@ class ProTradingFilters:
         ema_slow = indicators.get('ema_slow')
         current_price = indicators.get('current_price', 0)
         
-        if not all([rsi, ema_fast, ema_slow]):
+        # Explicit None checks - a legitimate RSI of 0 must not read as missing
+        if rsi is None or ema_fast is None or ema_slow is None:
             return True, "Incomplete indicators - skipping check"
         
         # Get MACD signals
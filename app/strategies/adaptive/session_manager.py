@@ -12,6 +12,8 @@ from datetime import datetime, timezone, timedelta
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
 
 class TradingSession(Enum):
     """Major trading sessions."""
@@ -112,7 +114,7 @@ class SessionManager:
     
     def get_current_session(self) -> TradingSession:
         """Get current trading session."""
-        hour = datetime.now(timezone.utc).hour
+        hour = datetime.now(_UTC).hour
         
         for session, (start, end) in self.sessions.items():
             if start <= hour < end:
@@ -128,7 +130,7 @@ class SessionManager:
         params = self.session_params[session].copy()
         
         # Check for high-impact hour
-        hour = datetime.now(timezone.utc).hour
+        hour = datetime.now(_UTC).hour
         if hour in self.high_impact_hours:
             params['aggression'] *= 0.5
             params['position_size_mult'] *= 0.5
@@ -162,7 +164,7 @@ class SessionManager:
     
     def get_optimal_trade_time(self) -> Dict[str, Any]:
         """Get info about optimal trading times."""
-        now = datetime.now(timezone.utc)
+        now = datetime.now(_UTC)
         current_session = self.get_current_session()
         
         # Find next high-aggression session
@@ -205,7 +207,7 @@ class SessionManager:
     
     def time_until_session(self, target_session: TradingSession) -> timedelta:
         """Calculate time until a specific session starts."""
-        now = datetime.now(timezone.utc)
+        now = datetime.now(_UTC)
         start, _ = self.sessions[target_session]
         
         if now.hour < start:
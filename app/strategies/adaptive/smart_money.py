@@ -11,15 +11,46 @@ Detects institutional trading patterns:
 
 import os
 import logging
+from bisect import bisect_right
 from decimal import Decimal
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import Dict, Any, Optional, List, Tuple
 from enum import Enum
 from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+from app.strategies.adaptive.candle_series import candle_arrays
+
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
+
+def _swing_indices(values: np.ndarray, find_highs: bool) -> np.ndarray:
+    """
+    Find 5-bar swing points: values strictly beyond both neighbours on each side.
+    
+    Args:
+        values: Highs (for swing highs) or lows (for swing lows)
+        find_highs: True for local maxima, False for local minima
+        
+    Returns:
+        Indices into values, ascending
+    """
+    if len(values) < 5:
+        return np.empty(0, dtype=np.intp)
+    
+    windows = sliding_window_view(values, 5)
+    center = windows[:, 2:3]
+    neighbours = windows[:, [0, 1, 3, 4]]
+    if find_highs:
+        mask = (center > neighbours).all(axis=1)
+    else:
+        mask = (center < neighbours).all(axis=1)
+    return np.flatnonzero(mask) + 2
+
 
 class ZoneType(Enum):
     """Types of smart money zones."""
@@ -32,7 +63,7 @@ class ZoneType(Enum):
     IMBALANCE = "imbalance"
 
 
-@dataclass
+@dataclass(slots=True)
 class BreakOfStructure:
     """Represents a Break of Structure (BoS) event."""
     bos_type: str  # 'bullish_bos' or 'bearish_bos'
@@ -42,12 +73,12 @@ class BreakOfStructure:
     confirmed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SmartMoneyZone:
     """Represents a smart money zone on the chart."""
     zone_type: ZoneType
-    high: Decimal
-    low: Decimal
+    high: float
+    low: float
     created_time: datetime
     strength: float  # 0-1 strength score
     times_tested: int = 0
@@ -95,6 +126,16 @@ class SmartMoneyAnalyzer:
         self.recent_bos: deque = deque(maxlen=5)
         self.market_structure: str = 'unknown'  # 'bullish', 'bearish', 'unknown'
         
+        # Last analysis, reused while the candle window is unchanged
+        # (callers re-analyze the same cached candles on every tick until a new bar lands)
+        self._analysis_source: Optional[List[Dict]] = None
+        self._analysis_key: Optional[tuple] = None
+        self._analysis_result: Optional[Dict[str, Any]] = None
+        
+        # Lazily built price-at-zone lookup over fvg_zones + order_blocks
+        # (None = stale, rebuilt on the next is_price_at_zone query)
+        self._zone_index: Optional[Tuple[float, List[float], List[Tuple[float, int, SmartMoneyZone]]]] = None
+        
         logger.info("💰 Smart Money Analyzer initialized")
         logger.info(f"   FVG Min Gap: {self.fvg_min_gap_pct}%")
         logger.info(f"   Order Block Lookback: {self.ob_lookback}")
@@ -111,26 +152,41 @@ class SmartMoneyAnalyzer:
         if len(candles) < 50:
             return {'bias': None, 'zones': [], 'signals': [], 'bos': None}
         
+        # Same candle list with the same forming bar -> nothing new to detect
+        last = candles[-1]
+        key = (
+            len(candles),
+            last.get('high', last.get('h')),
+            last.get('low', last.get('l')),
+            last.get('close', last.get('c')),
+        )
+        if candles is self._analysis_source and key == self._analysis_key:
+            return self._analysis_result
+        
+        # Parse OHLC once into float arrays shared by every detector
+        opens, highs, lows, closes = self._candle_arrays(candles)
+        
         # Detect all patterns
-        fvgs = self.detect_fair_value_gaps(candles)
-        obs = self.detect_order_blocks(candles)
-        liquidity = self.detect_liquidity_levels(candles)
-        sweeps = self.detect_liquidity_sweeps(candles)
-        bos = self.detect_break_of_structure(candles)
+        fvgs = self.detect_fair_value_gaps(highs, lows, closes)
+        obs = self.detect_order_blocks(opens, highs, lows, closes)
+        liquidity = self.detect_liquidity_levels(highs, lows)
+        sweeps = self.detect_liquidity_sweeps(highs, lows, closes)
+        bos = self.detect_break_of_structure(highs, lows, closes)
         
         # Update internal state
         self.fvg_zones = fvgs
         self.order_blocks = obs
         self.liquidity_levels = liquidity
+        self._zone_index = None
         
         # Determine bias
-        current_price = Decimal(str(candles[-1].get('close', candles[-1].get('c', 0))))
+        current_price = float(closes[-1])
         bias = self._determine_bias(current_price, fvgs, obs, sweeps)
         
         # Generate signals
         signals = self._generate_signals(current_price, fvgs, obs, sweeps)
         
-        return {
+        result = {
             'bias': bias,
             'fvg_zones': fvgs,
             'order_blocks': obs,
@@ -141,8 +197,26 @@ class SmartMoneyAnalyzer:
             'market_structure': self.market_structure,
             'structure_confirmed': bos is not None and bos.confirmed,
         }
+        
+        self._analysis_source = candles
+        self._analysis_key = key
+        self._analysis_result = result
+        return result
     
-    def detect_break_of_structure(self, candles: List[Dict]) -> Optional[BreakOfStructure]:
+    def _candle_arrays(self, candles: List[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Convert candles into float64 OHLC arrays.
+        
+        The parse is shared with the other indicators reading the same candle
+        list this tick (see candle_series), so the arrays are read-only.
+        
+        Returns:
+            Tuple of (opens, highs, lows, closes)
+        """
+        opens, highs, lows, closes, _ = candle_arrays(candles)
+        return opens, highs, lows, closes
+    
+    def detect_break_of_structure(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> Optional[BreakOfStructure]:
         """
         Detect Break of Structure (BoS).
         
@@ -151,54 +225,30 @@ class SmartMoneyAnalyzer:
         - Bullish BoS: Price closes above previous swing high
         - Bearish BoS: Price closes below previous swing low
         
+        Args:
+            highs, lows, closes: OHLC arrays from _candle_arrays
+            
         Returns:
             BreakOfStructure if detected, None otherwise
         """
-        if len(candles) < self.bos_lookback:
+        if len(closes) < self.bos_lookback:
             return None
         
-        lookback_candles = candles[-self.bos_lookback:]
-        current_candle = candles[-1]
-        current_close = Decimal(str(current_candle.get('close', current_candle.get('c', 0))))
+        current_close = Decimal(str(float(closes[-1])))
         
-        # Get swing highs and lows from lookback period (excluding last 3 candles)
-        swing_highs = []
-        swing_lows = []
+        # Get swing highs and lows from lookback period (excluding last 3 candles).
+        # Dropping the final bar of the window leaves swing centers up to the 4th-from-last.
+        lookback_highs = highs[-self.bos_lookback:-1]
+        lookback_lows = lows[-self.bos_lookback:-1]
+        swing_highs = lookback_highs[_swing_indices(lookback_highs, find_highs=True)]
+        swing_lows = lookback_lows[_swing_indices(lookback_lows, find_highs=False)]
         
-        for i in range(2, len(lookback_candles) - 3):
-            high = Decimal(str(lookback_candles[i].get('high', lookback_candles[i].get('h', 0))))
-            low = Decimal(str(lookback_candles[i].get('low', lookback_candles[i].get('l', 0))))
-            
-            # Check if swing high (local maximum)
-            is_swing_high = True
-            for j in range(-2, 3):
-                if j == 0:
-                    continue
-                neighbor_high = Decimal(str(lookback_candles[i+j].get('high', lookback_candles[i+j].get('h', 0))))
-                if neighbor_high >= high:
-                    is_swing_high = False
-                    break
-            if is_swing_high:
-                swing_highs.append(high)
-            
-            # Check if swing low (local minimum)
-            is_swing_low = True
-            for j in range(-2, 3):
-                if j == 0:
-                    continue
-                neighbor_low = Decimal(str(lookback_candles[i+j].get('low', lookback_candles[i+j].get('l', 0))))
-                if neighbor_low <= low:
-                    is_swing_low = False
-                    break
-            if is_swing_low:
-                swing_lows.append(low)
-        
-        if not swing_highs or not swing_lows:
+        if not len(swing_highs) or not len(swing_lows):
             return None
         
         # Get the most recent significant swing points
-        recent_high = max(swing_highs[-5:]) if len(swing_highs) >= 1 else swing_highs[-1] if swing_highs else None
-        recent_low = min(swing_lows[-5:]) if len(swing_lows) >= 1 else swing_lows[-1] if swing_lows else None
+        recent_high = Decimal(str(float(swing_highs[-5:].max())))
+        recent_low = Decimal(str(float(swing_lows[-5:].min())))
         
         if not recent_high or not recent_low:
             return None
@@ -208,7 +258,7 @@ class SmartMoneyAnalyzer:
             bos = BreakOfStructure(
                 bos_type='bullish_bos',
                 level=recent_high,
-                broken_at=datetime.now(timezone.utc),
+                broken_at=datetime.now(_UTC),
                 strength=min(1.0, float((current_close - recent_high) / recent_high * 100)),
                 confirmed=True,
             )
@@ -222,7 +272,7 @@ class SmartMoneyAnalyzer:
             bos = BreakOfStructure(
                 bos_type='bearish_bos',
                 level=recent_low,
-                broken_at=datetime.now(timezone.utc),
+                broken_at=datetime.now(_UTC),
                 strength=min(1.0, float((recent_low - current_close) / recent_low * 100)),
                 confirmed=True,
             )
@@ -274,182 +324,182 @@ class SmartMoneyAnalyzer:
             return self.market_structure == 'bearish'
         return False
     
-    def detect_fair_value_gaps(self, candles: List[Dict]) -> List[SmartMoneyZone]:
+    def detect_fair_value_gaps(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> List[SmartMoneyZone]:
         """
         Detect Fair Value Gaps (price imbalances).
         
         FVG occurs when:
         - Bullish: Candle N-1 high < Candle N+1 low (gap up)
         - Bearish: Candle N-1 low > Candle N+1 high (gap down)
+        
+        Args:
+            highs, lows, closes: OHLC arrays from _candle_arrays
         """
         fvgs = []
+        if len(closes) < 3:
+            return fvgs
+        
+        min_gap_pct = float(self.fvg_min_gap_pct)
+        
+        # Candle N-1 / N+1 neighbours for every middle candle N (shifted views, no copies)
+        prev_high = highs[:-2]
+        prev_low = lows[:-2]
+        next_high = highs[2:]
+        next_low = lows[2:]
+        curr_close = closes[1:-1]
+        
+        # Bullish FVG: Gap between prev high and next low
+        bull_gap = next_low - prev_high
+        bull_pct = bull_gap / curr_close * 100
+        bull_keep = (bull_gap > 0) & (bull_pct >= min_gap_pct)
+        
+        # Bearish FVG: Gap between prev low and next high
+        bear_gap = prev_low - next_high
+        bear_pct = bear_gap / curr_close * 100
+        bear_keep = (bear_gap > 0) & (bear_pct >= min_gap_pct)
+        
+        # Keep only recent unfilled FVGs (last 20) - only those become zones
+        now = datetime.now(_UTC)
+        for j in np.flatnonzero(bull_keep | bear_keep)[-20:]:
+            if bull_keep[j]:
+                fvgs.append(SmartMoneyZone(
+                    zone_type=ZoneType.BULLISH_FVG,
+                    high=float(next_low[j]),
+                    low=float(prev_high[j]),
+                    created_time=now,
+                    strength=min(1.0, float(bull_pct[j]) / 0.5),
+                ))
+            else:
+                fvgs.append(SmartMoneyZone(
+                    zone_type=ZoneType.BEARISH_FVG,
+                    high=float(prev_low[j]),
+                    low=float(next_high[j]),
+                    created_time=now,
+                    strength=min(1.0, float(bear_pct[j]) / 0.5),
+                ))
         
-        for i in range(1, len(candles) - 1):
-            prev = candles[i - 1]
-            curr = candles[i]
-            next_c = candles[i + 1]
-            
-            prev_high = Decimal(str(prev.get('high', prev.get('h', 0))))
-            prev_low = Decimal(str(prev.get('low', prev.get('l', 0))))
-            next_high = Decimal(str(next_c.get('high', next_c.get('h', 0))))
-            next_low = Decimal(str(next_c.get('low', next_c.get('l', 0))))
-            curr_close = Decimal(str(curr.get('close', curr.get('c', 0))))
-            
-            # Bullish FVG: Gap between prev high and next low
-            if next_low > prev_high:
-                gap = next_low - prev_high
-                gap_pct = (gap / curr_close) * 100
-                
-                if gap_pct >= self.fvg_min_gap_pct:
-                    fvgs.append(SmartMoneyZone(
-                        zone_type=ZoneType.BULLISH_FVG,
-                        high=next_low,
-                        low=prev_high,
-                        created_time=datetime.now(timezone.utc),
-                        strength=min(1.0, float(gap_pct) / 0.5),
-                    ))
-            
-            # Bearish FVG: Gap between prev low and next high
-            elif prev_low > next_high:
-                gap = prev_low - next_high
-                gap_pct = (gap / curr_close) * 100
-                
-                if gap_pct >= self.fvg_min_gap_pct:
-                    fvgs.append(SmartMoneyZone(
-                        zone_type=ZoneType.BEARISH_FVG,
-                        high=prev_low,
-                        low=next_high,
-                        created_time=datetime.now(timezone.utc),
-                        strength=min(1.0, float(gap_pct) / 0.5),
-                    ))
-        
-        # Keep only recent unfilled FVGs (last 20)
-        return fvgs[-20:] if len(fvgs) > 20 else fvgs
+        return fvgs
     
-    def detect_order_blocks(self, candles: List[Dict]) -> List[SmartMoneyZone]:
+    def detect_order_blocks(
+        self,
+        opens: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+    ) -> List[SmartMoneyZone]:
         """
         Detect Order Blocks (institutional accumulation/distribution zones).
         
         Bullish OB: Last bearish candle before strong bullish move
         Bearish OB: Last bullish candle before strong bearish move
+        
+        Args:
+            opens, highs, lows, closes: OHLC arrays from _candle_arrays
         """
         obs = []
-        lookback = min(self.ob_lookback, len(candles) - 5)
-        
-        for i in range(lookback, len(candles) - 3):
-            curr = candles[i]
-            curr_open = Decimal(str(curr.get('open', curr.get('o', 0))))
-            curr_close = Decimal(str(curr.get('close', curr.get('c', 0))))
-            curr_high = Decimal(str(curr.get('high', curr.get('h', 0))))
-            curr_low = Decimal(str(curr.get('low', curr.get('l', 0))))
-            
-            # Check next 3 candles for strong move
-            next_closes = [
-                Decimal(str(candles[i+j].get('close', candles[i+j].get('c', 0))))
-                for j in range(1, 4) if i+j < len(candles)
-            ]
-            
-            if not next_closes:
-                continue
-            
-            move_pct = (next_closes[-1] - curr_close) / curr_close * 100
-            
-            # Bullish Order Block: Bearish candle followed by strong bullish move
-            if curr_close < curr_open and move_pct > Decimal('1.0'):
-                obs.append(SmartMoneyZone(
-                    zone_type=ZoneType.BULLISH_OB,
-                    high=curr_high,
-                    low=curr_low,
-                    created_time=datetime.now(timezone.utc),
-                    strength=min(1.0, float(abs(move_pct)) / 3.0),
-                ))
-            
-            # Bearish Order Block: Bullish candle followed by strong bearish move
-            elif curr_close > curr_open and move_pct < Decimal('-1.0'):
-                obs.append(SmartMoneyZone(
-                    zone_type=ZoneType.BEARISH_OB,
-                    high=curr_high,
-                    low=curr_low,
-                    created_time=datetime.now(timezone.utc),
-                    strength=min(1.0, float(abs(move_pct)) / 3.0),
-                ))
-        
-        return obs[-10:] if len(obs) > 10 else obs
+        start = max(min(self.ob_lookback, len(closes) - 5), 0)
+        end = len(closes) - 3
+        if end <= start:
+            return obs
+        
+        # Strong move = close 3 candles later vs this close (whole window at once)
+        curr_open = opens[start:end]
+        curr_close = closes[start:end]
+        move_pct = (closes[start + 3:end + 3] - curr_close) / curr_close * 100
+        
+        # Bullish Order Block: Bearish candle followed by strong bullish move
+        bull_keep = (curr_close < curr_open) & (move_pct > 1.0)
+        # Bearish Order Block: Bullish candle followed by strong bearish move
+        bear_keep = (curr_close > curr_open) & (move_pct < -1.0)
+        
+        # Only the last 10 blocks are kept, so only those become zones
+        now = datetime.now(_UTC)
+        for j in np.flatnonzero(bull_keep | bear_keep)[-10:]:
+            i = start + j
+            obs.append(SmartMoneyZone(
+                zone_type=ZoneType.BULLISH_OB if bull_keep[j] else ZoneType.BEARISH_OB,
+                high=float(highs[i]),
+                low=float(lows[i]),
+                created_time=now,
+                strength=min(1.0, abs(float(move_pct[j])) / 3.0),
+            ))
+        
+        return obs
     
-    def detect_liquidity_levels(self, candles: List[Dict]) -> List[SmartMoneyZone]:
+    def detect_liquidity_levels(self, highs: np.ndarray, lows: np.ndarray) -> List[SmartMoneyZone]:
         """
         Detect liquidity pools (stop-loss clusters).
         
         Equal highs/lows = liquidity (stops sitting above/below)
         Swing highs/lows = liquidity targets
+        
+        Args:
+            highs, lows: OHLC arrays from _candle_arrays
         """
         levels = []
-        lookback = min(self.liquidity_lookback, len(candles))
+        lookback = min(self.liquidity_lookback, len(highs))
         
-        highs = [Decimal(str(c.get('high', c.get('h', 0)))) for c in candles[-lookback:]]
-        lows = [Decimal(str(c.get('low', c.get('l', 0)))) for c in candles[-lookback:]]
+        highs = highs[-lookback:]
+        lows = lows[-lookback:]
+        now = datetime.now(_UTC)
         
         # Find swing highs (local maxima)
-        for i in range(2, len(highs) - 2):
-            if highs[i] > highs[i-1] and highs[i] > highs[i-2] and \
-               highs[i] > highs[i+1] and highs[i] > highs[i+2]:
-                levels.append(SmartMoneyZone(
-                    zone_type=ZoneType.LIQUIDITY_HIGH,
-                    high=highs[i] * Decimal('1.001'),  # Slightly above
-                    low=highs[i],
-                    created_time=datetime.now(timezone.utc),
-                    strength=0.7,
-                ))
+        for i in _swing_indices(highs, find_highs=True):
+            levels.append(SmartMoneyZone(
+                zone_type=ZoneType.LIQUIDITY_HIGH,
+                high=float(highs[i]) * 1.001,  # Slightly above
+                low=float(highs[i]),
+                created_time=now,
+                strength=0.7,
+            ))
         
         # Find swing lows (local minima)
-        for i in range(2, len(lows) - 2):
-            if lows[i] < lows[i-1] and lows[i] < lows[i-2] and \
-               lows[i] < lows[i+1] and lows[i] < lows[i+2]:
-                levels.append(SmartMoneyZone(
-                    zone_type=ZoneType.LIQUIDITY_LOW,
-                    high=lows[i],
-                    low=lows[i] * Decimal('0.999'),  # Slightly below
-                    created_time=datetime.now(timezone.utc),
-                    strength=0.7,
-                ))
+        for i in _swing_indices(lows, find_highs=False):
+            levels.append(SmartMoneyZone(
+                zone_type=ZoneType.LIQUIDITY_LOW,
+                high=float(lows[i]),
+                low=float(lows[i]) * 0.999,  # Slightly below
+                created_time=now,
+                strength=0.7,
+            ))
         
         return levels
     
-    def detect_liquidity_sweeps(self, candles: List[Dict]) -> deque:
+    def detect_liquidity_sweeps(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> deque:
         """
         Detect liquidity sweeps (stop hunts).
         
         Sweep = Price breaks level but closes back inside
         Strong signal for reversal in opposite direction
+        
+        Args:
+            highs, lows, closes: OHLC arrays from _candle_arrays
         """
         sweeps = deque(maxlen=5)
         
-        if len(candles) < 10:
+        if len(closes) < 10:
             return sweeps
         
-        # Get recent swing points
-        recent = candles[-20:]
-        highs = [Decimal(str(c.get('high', c.get('h', 0)))) for c in recent[:-3]]
-        lows = [Decimal(str(c.get('low', c.get('l', 0)))) for c in recent[:-3]]
+        # Get recent swing points (last 20 candles, excluding the last 3)
+        recent_highs = highs[-20:-3]
+        recent_lows = lows[-20:-3]
         
-        swing_high = max(highs) if highs else Decimal('0')
-        swing_low = min(lows) if lows else Decimal('0')
+        swing_high = float(recent_highs.max()) if len(recent_highs) else 0.0
+        swing_low = float(recent_lows.min()) if len(recent_lows) else 0.0
         
         # Check last candle for sweep
-        last = candles[-1]
-        last_high = Decimal(str(last.get('high', last.get('h', 0))))
-        last_low = Decimal(str(last.get('low', last.get('l', 0))))
-        last_close = Decimal(str(last.get('close', last.get('c', 0))))
-        last_open = Decimal(str(last.get('open', last.get('o', 0))))
+        last_high = float(highs[-1])
+        last_low = float(lows[-1])
+        last_close = float(closes[-1])
         
         # Bullish sweep: Wick below swing low, close back inside
         if last_low < swing_low and last_close > swing_low:
             sweeps.append({
                 'type': 'bullish_sweep',
-                'level': float(swing_low),
-                'wick_low': float(last_low),
-                'close': float(last_close),
-                'strength': min(1.0, float((swing_low - last_low) / swing_low) * 100),
+                'level': swing_low,
+                'wick_low': last_low,
+                'close': last_close,
+                'strength': min(1.0, (swing_low - last_low) / swing_low * 100),
             })
             logger.info(f"🎯 BULLISH SWEEP detected at {swing_low}")
         
@@ -457,10 +507,10 @@ class SmartMoneyAnalyzer:
         if last_high > swing_high and last_close < swing_high:
             sweeps.append({
                 'type': 'bearish_sweep',
-                'level': float(swing_high),
-                'wick_high': float(last_high),
-                'close': float(last_close),
-                'strength': min(1.0, float((last_high - swing_high) / swing_high) * 100),
+                'level': swing_high,
+                'wick_high': last_high,
+                'close': last_close,
+                'strength': min(1.0, (last_high - swing_high) / swing_high * 100),
             })
             logger.info(f"🎯 BEARISH SWEEP detected at {swing_high}")
         
@@ -469,7 +519,7 @@ class SmartMoneyAnalyzer:
     
     def _determine_bias(
         self, 
-        price: Decimal, 
+        price: float, 
         fvgs: List[SmartMoneyZone], 
         obs: List[SmartMoneyZone],
         sweeps: deque,
@@ -507,7 +557,7 @@ class SmartMoneyAnalyzer:
     
     def _generate_signals(
         self,
-        price: Decimal,
+        price: float,
         fvgs: List[SmartMoneyZone],
         obs: List[SmartMoneyZone],
         sweeps: deque,
@@ -522,7 +572,7 @@ class SmartMoneyAnalyzer:
                     signals.append({
                         'type': 'fvg_fill',
                         'direction': 'long',
-                        'entry': float(fvg.low),
+                        'entry': fvg.low,
                         'strength': fvg.strength,
                         'reason': 'Bullish FVG fill',
                     })
@@ -531,7 +581,7 @@ class SmartMoneyAnalyzer:
                     signals.append({
                         'type': 'fvg_fill',
                         'direction': 'short',
-                        'entry': float(fvg.high),
+                        'entry': fvg.high,
                         'strength': fvg.strength,
                         'reason': 'Bearish FVG fill',
                     })
@@ -543,7 +593,7 @@ class SmartMoneyAnalyzer:
                     signals.append({
                         'type': 'order_block',
                         'direction': 'long',
-                        'entry': float(ob.low),
+                        'entry': ob.low,
                         'strength': ob.strength,
                         'reason': 'Bullish Order Block test',
                     })
@@ -552,7 +602,7 @@ class SmartMoneyAnalyzer:
                     signals.append({
                         'type': 'order_block',
                         'direction': 'short',
-                        'entry': float(ob.high),
+                        'entry': ob.high,
                         'strength': ob.strength,
                         'reason': 'Bearish Order Block test',
                     })
@@ -578,16 +628,44 @@ class SmartMoneyAnalyzer:
         
         return signals
     
+    def _build_zone_index(self, tolerance_frac: float) -> Tuple[float, List[float], List[Tuple[float, int, SmartMoneyZone]]]:
+        """
+        Build the price-at-zone lookup for the current FVGs and order blocks.
+        
+        Each zone is widened by its tolerance once and sorted by the widened
+        low, so a query only has to look at zones whose low is at or below price.
+        
+        Args:
+            tolerance_frac: Tolerance as a fraction of the zone midpoint
+            
+        Returns:
+            Tuple of (tolerance_frac, sorted widened lows, entries of (widened high, scan order, zone))
+        """
+        entries = []
+        for order, zone in enumerate(self.fvg_zones + self.order_blocks):
+            tolerance = (zone.high + zone.low) / 2 * tolerance_frac
+            entries.append((zone.low - tolerance, zone.high + tolerance, order, zone))
+        entries.sort(key=lambda e: (e[0], e[2]))
+        
+        lows = [e[0] for e in entries]
+        return tolerance_frac, lows, [(hi, order, zone) for _, hi, order, zone in entries]
+    
     def is_price_at_zone(self, price: Decimal, tolerance_pct: Decimal = Decimal('0.2')) -> Optional[SmartMoneyZone]:
         """Check if price is at any significant SMC zone."""
-        for zone in self.fvg_zones + self.order_blocks:
-            if zone.invalidated:
-                continue
-            
-            zone_mid = (zone.high + zone.low) / 2
-            tolerance = zone_mid * tolerance_pct / 100
-            
-            if zone.low - tolerance <= price <= zone.high + tolerance:
-                return zone
-        
-        return None
+        # Zones are stored as floats; convert the Decimal inputs once
+        price = float(price)
+        tolerance_frac = float(tolerance_pct) / 100
+        
+        index = self._zone_index
+        if index is None or index[0] != tolerance_frac:
+            index = self._zone_index = self._build_zone_index(tolerance_frac)
+        _, lows, entries = index
+        
+        # Only zones whose widened low is at/below price can contain it;
+        # return the first one in FVG-then-order-block order, as before
+        best = None
+        for hi, order, zone in entries[:bisect_right(lows, price)]:
+            if price <= hi and not zone.invalidated and (best is None or order < best[0]):
+                best = (order, zone)
+        
+        return best[1] if best else None
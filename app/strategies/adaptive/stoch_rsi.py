@@ -27,11 +27,12 @@ from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from collections import deque
+from itertools import islice
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class StochRSIResult:
     """Stochastic RSI calculation result."""
     stoch_rsi: float      # Raw StochRSI (0-1)
@@ -86,8 +87,7 @@ class StochRSICalculator:
         # State
         self._rsi_history: deque = deque(maxlen=stoch_period + 10)
         self._k_history: deque = deque(maxlen=d_smooth + 1)
-        self._prev_k: Optional[float] = None
-        self._prev_d: Optional[float] = None
+        self._prev_kd_diff: Optional[float] = None  # Previous K - D (sign = which line was on top)
         
         logger.info(f"📊 Stochastic RSI initialized: RSI={rsi_period}, Stoch={stoch_period}, K={k_smooth}, D={d_smooth}")
     
@@ -106,28 +106,57 @@ class StochRSICalculator:
             return None
         
         # Calculate RSI values for stoch_period
+        # Closes and gains/losses are extracted once for the whole tail;
+        # each RSI window then just sums its slice instead of re-parsing
+        # rsi_period candles per window
+        rsi_count = self.stoch_period + self.k_smooth
+        closes = [
+            float(c.get('close', c.get('c', 0)))
+            for c in candles[-(rsi_count + self.rsi_period):]
+        ]
+        gains = []
+        losses = []
+        for i in range(1, len(closes)):
+            change = closes[i] - closes[i-1]
+            if change > 0:
+                gains.append(change)
+                losses.append(0)
+            else:
+                gains.append(0)
+                losses.append(abs(change))
+        
         rsi_values = []
-        for i in range(self.stoch_period + self.k_smooth):
-            end_idx = len(candles) - i
-            start_idx = end_idx - self.rsi_period - 1
-            if start_idx < 0:
-                continue
-            
-            rsi = self._calculate_rsi(candles[start_idx:end_idx])
-            if rsi is not None:
-                rsi_values.insert(0, rsi)
+        for start in range(len(gains) - self.rsi_period + 1):
+            end = start + self.rsi_period
+            rsi_values.append(self._rsi_from_sums(sum(gains[start:end]), sum(losses[start:end])))
         
         if len(rsi_values) < self.stoch_period:
             return None
         
-        # Calculate raw StochRSI values for smoothing
+        # Calculate raw StochRSI values for smoothing.
+        # Window highs/lows come from monotonic deques of indices (amortized O(1)
+        # per window) instead of max()/min() over every stoch_period slice.
         stoch_rsi_values = []
-        for i in range(len(rsi_values) - self.stoch_period + 1):
-            window = rsi_values[i:i + self.stoch_period]
-            highest = max(window)
-            lowest = min(window)
+        max_idx: deque = deque()
+        min_idx: deque = deque()
+        for i, current_rsi in enumerate(rsi_values):
+            while max_idx and rsi_values[max_idx[-1]] <= current_rsi:
+                max_idx.pop()
+            max_idx.append(i)
+            while min_idx and rsi_values[min_idx[-1]] >= current_rsi:
+                min_idx.pop()
+            min_idx.append(i)
+            
+            window_start = i - self.stoch_period + 1
+            if window_start < 0:
+                continue
+            if max_idx[0] < window_start:
+                max_idx.popleft()
+            if min_idx[0] < window_start:
+                min_idx.popleft()
             
-            current_rsi = window[-1]
+            highest = rsi_values[max_idx[0]]
+            lowest = rsi_values[min_idx[0]]
             if highest - lowest > 0:
                 stoch_rsi = (current_rsi - lowest) / (highest - lowest)
             else:
@@ -145,7 +174,7 @@ class StochRSICalculator:
         
         # D line = SMA of K
         if len(self._k_history) >= self.d_smooth:
-            d_line = sum(list(self._k_history)[-self.d_smooth:]) / self.d_smooth
+            d_line = sum(islice(self._k_history, len(self._k_history) - self.d_smooth, None)) / self.d_smooth
         else:
             d_line = k_line
         
@@ -160,17 +189,18 @@ class StochRSICalculator:
             zone = 'neutral'
             strength = 0.0
         
-        # Detect crossover
+        # Detect crossover from the sign change of K - D
         crossover = None
-        if self._prev_k is not None and self._prev_d is not None:
-            if self._prev_k <= self._prev_d and k_line > d_line:
+        kd_diff = k_line - d_line
+        prev_diff = self._prev_kd_diff
+        if prev_diff is not None:
+            if prev_diff <= 0 < kd_diff:
                 crossover = 'bullish'
-            elif self._prev_k >= self._prev_d and k_line < d_line:
+            elif prev_diff >= 0 > kd_diff:
                 crossover = 'bearish'
         
         # Update state
-        self._prev_k = k_line
-        self._prev_d = d_line
+        self._prev_kd_diff = kd_diff
         
         return StochRSIResult(
             stoch_rsi=stoch_rsi_values[-1],
@@ -181,6 +211,17 @@ class StochRSICalculator:
             strength=min(1.0, strength)
         )
     
+    def _rsi_from_sums(self, gain_sum: float, loss_sum: float) -> float:
+        """Convert summed gains/losses over rsi_period into an RSI value."""
+        avg_gain = gain_sum / self.rsi_period
+        avg_loss = loss_sum / self.rsi_period
+        
+        if avg_loss == 0:
+            return 100.0
+        
+        rs = avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
+    
     def _calculate_rsi(self, candles: List[Dict]) -> Optional[float]:
         """Calculate RSI for given candles."""
         if len(candles) < 2:
@@ -204,16 +245,7 @@ class StochRSICalculator:
         if len(gains) < self.rsi_period:
             return None
         
-        avg_gain = sum(gains[-self.rsi_period:]) / self.rsi_period
-        avg_loss = sum(losses[-self.rsi_period:]) / self.rsi_period
-        
-        if avg_loss == 0:
-            return 100.0
-        
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return rsi
+        return self._rsi_from_sums(sum(gains[-self.rsi_period:]), sum(losses[-self.rsi_period:]))
     
     def get_signal(self, candles: List[Dict]) -> Tuple[str, float]:
         """
@@ -250,5 +282,4 @@ class StochRSICalculator:
         """Reset indicator state."""
         self._rsi_history.clear()
         self._k_history.clear()
-        self._prev_k = None
-        self._prev_d = None
+        self._prev_kd_diff = None
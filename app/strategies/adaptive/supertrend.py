@@ -26,6 +26,9 @@ from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+import numpy as np
+
+from app.strategies.adaptive.candle_series import true_range
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +40,13 @@ class SupertrendDirection(Enum):
     NEUTRAL = "neutral"
 
 
-@dataclass
+# Direction members bound once for calculate() and get_signal()
+_BULLISH = SupertrendDirection.BULLISH
+_BEARISH = SupertrendDirection.BEARISH
+_NEUTRAL = SupertrendDirection.NEUTRAL
+
+
+@dataclass(slots=True)
 class SupertrendResult:
     """Supertrend calculation result."""
     direction: SupertrendDirection
@@ -140,10 +149,10 @@ class SupertrendIndicator:
             # Initial state - use close position to determine
             if close > final_upper:
                 supertrend = final_lower
-                direction = SupertrendDirection.BULLISH
+                direction = _BULLISH
             else:
                 supertrend = final_upper
-                direction = SupertrendDirection.BEARISH
+                direction = _BEARISH
         else:
             # Check for direction change
             if self._prev_supertrend == self._prev_upper_band:
@@ -151,22 +160,22 @@ class SupertrendIndicator:
                 if close > final_upper:
                     # Flip to bullish
                     supertrend = final_lower
-                    direction = SupertrendDirection.BULLISH
+                    direction = _BULLISH
                 else:
                     supertrend = final_upper
-                    direction = SupertrendDirection.BEARISH
+                    direction = _BEARISH
             else:
                 # Was bullish
                 if close < final_lower:
                     # Flip to bearish
                     supertrend = final_upper
-                    direction = SupertrendDirection.BEARISH
+                    direction = _BEARISH
                 else:
                     supertrend = final_lower
-                    direction = SupertrendDirection.BULLISH
+                    direction = _BULLISH
         
         # Check if direction changed
-        changed = direction != self._prev_direction and self._prev_direction != SupertrendDirection.NEUTRAL
+        changed = direction is not self._prev_direction and self._prev_direction is not _NEUTRAL
         
         # Calculate strength (distance from price as %)
         if close > 0:
@@ -199,21 +208,15 @@ class SupertrendIndicator:
         if len(candles) < self.period + 1:
             return None
         
-        tr_list = []
-        for i in range(1, len(candles)):
-            high = Decimal(str(candles[i].get('high', candles[i].get('h', 0))))
-            low = Decimal(str(candles[i].get('low', candles[i].get('l', 0))))
-            prev_close = Decimal(str(candles[i-1].get('close', candles[i-1].get('c', 0))))
-            
-            # True Range = max(H-L, |H-prev_close|, |L-prev_close|)
-            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
-            tr_list.append(tr)
-        
-        if len(tr_list) < self.period:
-            return None
+        # Only the last 'period' true ranges are averaged, so only period+1 candles are parsed
+        window = candles[-(self.period + 1):]
+        n = len(window)
+        highs = np.fromiter((float(c.get('high', c.get('h', 0))) for c in window), dtype=np.float64, count=n)
+        lows = np.fromiter((float(c.get('low', c.get('l', 0))) for c in window), dtype=np.float64, count=n)
+        closes = np.fromiter((float(c.get('close', c.get('c', 0))) for c in window), dtype=np.float64, count=n)
         
         # Simple average of last 'period' true ranges
-        return sum(tr_list[-self.period:]) / self.period
+        return Decimal(str(float(true_range(highs, lows, closes).mean())))
     
     def get_signal(self, candles: List[Dict]) -> Tuple[str, float]:
         """
@@ -229,9 +232,9 @@ class SupertrendIndicator:
             return ('neutral', 0.0)
         
         # Base confidence from direction
-        if result.direction == SupertrendDirection.BULLISH:
+        if result.direction is _BULLISH:
             direction = 'long'
-        elif result.direction == SupertrendDirection.BEARISH:
+        elif result.direction is _BEARISH:
             direction = 'short'
         else:
             return ('neutral', 0.0)
@@ -12,6 +12,7 @@ Trading Edge:
 """
 
 import os
+import math
 import logging
 from decimal import Decimal
 from typing import Dict, Any, Optional, List, Tuple
@@ -37,24 +38,32 @@ class VWAPCalculator:
         """Initialize VWAP calculator."""
         # Configuration
         self.session_hours = int(os.getenv('VWAP_SESSION_HOURS', '24'))  # Reset period
-        self.std_dev_mult = Decimal(os.getenv('VWAP_STD_MULT', '2.0'))   # Band multiplier
+        self.std_dev_mult = float(os.getenv('VWAP_STD_MULT', '2.0'))   # Band multiplier
         
-        # State
-        self.cumulative_pv: Decimal = Decimal('0')  # Σ(Price × Volume)
-        self.cumulative_volume: Decimal = Decimal('0')  # Σ(Volume)
+        # State (floats - candle values are parsed once, all VWAP math is FP64)
+        self.cumulative_pv: float = 0.0  # Σ(Price × Volume)
+        self.cumulative_volume: float = 0.0  # Σ(Volume)
         self.session_start: Optional[datetime] = None
-        self.vwap: Optional[Decimal] = None
+        self.vwap: Optional[float] = None
         
         # For standard deviation calculation
         self.prices: deque = deque(maxlen=500)
         self.volumes: deque = deque(maxlen=500)
         
+        # Running volume-weighted moments of the price window, kept in step with
+        # prices/volumes so the bands update in O(1). Prices are shifted by the
+        # session's first price to keep the variance numerically stable.
+        self._shift: Optional[float] = None
+        self._window_volume = 0.0  # Σ v
+        self._window_pv = 0.0      # Σ v·(p - shift)
+        self._window_p2v = 0.0     # Σ v·(p - shift)²
+        
         # VWAP history for trend detection
         self.vwap_history: deque = deque(maxlen=20)
         
         # Bands
-        self.upper_band: Optional[Decimal] = None
-        self.lower_band: Optional[Decimal] = None
+        self.upper_band: Optional[float] = None
+        self.lower_band: Optional[float] = None
         
         logger.info("📊 VWAP Calculator initialized")
         logger.info(f"   Session Hours: {self.session_hours}")
@@ -78,29 +87,39 @@ class VWAPCalculator:
         
         # Use typical price: (H + L + C) / 3
         for candle in candles:
-            high = Decimal(str(candle.get('high', candle.get('h', 0))))
-            low = Decimal(str(candle.get('low', candle.get('l', 0))))
-            close = Decimal(str(candle.get('close', candle.get('c', 0))))
-            volume = Decimal(str(candle.get('volume', candle.get('v', 0))))
-            
-            typical_price = (high + low + close) / 3
+            volume = float(candle.get('volume', candle.get('v', 0)))
             
             if volume > 0:
-                self._add_data_point(typical_price, volume)
+                high = float(candle.get('high', candle.get('h', 0)))
+                low = float(candle.get('low', candle.get('l', 0)))
+                close = float(candle.get('close', candle.get('c', 0)))
+                self._add_data_point((high + low + close) / 3, volume)
         
         if not self.vwap:
             return {'vwap': None, 'bias': None}
         
-        current_price = Decimal(str(candles[-1].get('close', candles[-1].get('c', 0))))
+        current_price = float(candles[-1].get('close', candles[-1].get('c', 0)))
         
         return self._get_analysis(current_price)
     
-    def _add_data_point(self, price: Decimal, volume: Decimal):
+    def _add_data_point(self, price: float, volume: float):
         """Add a single data point to VWAP calculation."""
         if volume <= 0:
             return
         
-        # Track for calculations
+        # Track for calculations (evicting the oldest point from the running moments)
+        if self._shift is None:
+            self._shift = price
+        if len(self.prices) == self.prices.maxlen:
+            old_dev = self.prices[0] - self._shift
+            old_volume = self.volumes[0]
+            self._window_volume -= old_volume
+            self._window_pv -= old_volume * old_dev
+            self._window_p2v -= old_volume * old_dev * old_dev
+        dev = price - self._shift
+        self._window_volume += volume
+        self._window_pv += volume * dev
+        self._window_p2v += volume * dev * dev
         self.prices.append(price)
         self.volumes.append(volume)
         
@@ -121,21 +140,19 @@ class VWAPCalculator:
         if len(self.prices) < 10 or not self.vwap:
             return
         
-        # Standard deviation from VWAP
-        squared_diffs = []
-        for price, volume in zip(self.prices, self.volumes):
-            weighted_diff = ((price - self.vwap) ** 2) * volume
-            squared_diffs.append(weighted_diff)
-        
-        total_volume = sum(self.volumes)
+        # Standard deviation from VWAP:
+        # Σ v·(p - vwap)² = Σ v·d² - 2·m·Σ v·d + m²·Σ v, with d = p - shift, m = vwap - shift
+        total_volume = self._window_volume
         if total_volume > 0:
-            variance = sum(squared_diffs) / total_volume
-            std_dev = variance ** Decimal('0.5')
+            m = self.vwap - self._shift
+            weighted_sq = self._window_p2v - 2 * m * self._window_pv + m * m * total_volume
+            variance = max(0.0, weighted_sq / total_volume)
+            std_dev = math.sqrt(variance)
             
             self.upper_band = self.vwap + (std_dev * self.std_dev_mult)
             self.lower_band = self.vwap - (std_dev * self.std_dev_mult)
     
-    def _get_analysis(self, current_price: Decimal) -> Dict[str, Any]:
+    def _get_analysis(self, current_price: float) -> Dict[str, Any]:
         """Get VWAP analysis for current price."""
         if not self.vwap:
             return {'vwap': None, 'bias': None}
@@ -144,13 +161,13 @@ class VWAPCalculator:
         vwap_distance_pct = ((current_price - self.vwap) / self.vwap) * 100
         
         # Determine bias
-        if abs(vwap_distance_pct) < Decimal('0.2'):
+        if abs(vwap_distance_pct) < 0.2:
             position = 'at_vwap'  # Prime entry zone
             bias = 'neutral'
-        elif vwap_distance_pct > Decimal('1.0'):
+        elif vwap_distance_pct > 1.0:
             position = 'extended_above'
             bias = 'bearish'  # Mean reversion expected
-        elif vwap_distance_pct < Decimal('-1.0'):
+        elif vwap_distance_pct < -1.0:
             position = 'extended_below'
             bias = 'bullish'  # Mean reversion expected
         elif vwap_distance_pct > 0:
@@ -167,15 +184,15 @@ class VWAPCalculator:
         entry_quality = self._calculate_entry_quality(current_price, vwap_distance_pct)
         
         return {
-            'vwap': float(self.vwap),
-            'upper_band': float(self.upper_band) if self.upper_band else None,
-            'lower_band': float(self.lower_band) if self.lower_band else None,
-            'vwap_distance_pct': float(vwap_distance_pct),
+            'vwap': self.vwap,
+            'upper_band': self.upper_band if self.upper_band else None,
+            'lower_band': self.lower_band if self.lower_band else None,
+            'vwap_distance_pct': vwap_distance_pct,
             'position': position,
             'bias': bias,
             'vwap_trend': vwap_trend,
             'entry_quality': entry_quality,
-            'at_vwap': abs(vwap_distance_pct) < Decimal('0.2'),  # Within 0.2%
+            'at_vwap': abs(vwap_distance_pct) < 0.2,  # Within 0.2%
             'at_band': self._is_at_band(current_price),
         }
     
@@ -184,19 +201,20 @@ class VWAPCalculator:
         if len(self.vwap_history) < 5:
             return 'unknown'
         
-        recent_vwaps = list(self.vwap_history)[-5:]
-        first_half = sum(recent_vwaps[:2]) / 2
-        second_half = sum(recent_vwaps[-2:]) / 2
+        # Index the deque ends directly instead of copying it to a list
+        history = self.vwap_history
+        first_half = (history[-5] + history[-4]) / 2
+        second_half = (history[-2] + history[-1]) / 2
         
         change_pct = ((second_half - first_half) / first_half) * 100
         
-        if change_pct > Decimal('0.1'):
+        if change_pct > 0.1:
             return 'rising'
-        elif change_pct < Decimal('-0.1'):
+        elif change_pct < -0.1:
             return 'falling'
         return 'flat'
     
-    def _calculate_entry_quality(self, price: Decimal, distance_pct: Decimal) -> float:
+    def _calculate_entry_quality(self, price: float, distance_pct: float) -> float:
         """
         Calculate entry quality score (0-1).
         
@@ -206,7 +224,7 @@ class VWAPCalculator:
         - At upper band for shorts
         """
         # Perfect entry at VWAP
-        if abs(distance_pct) < Decimal('0.2'):
+        if abs(distance_pct) < 0.2:
             return 1.0
         
         # Good entry at bands
@@ -216,10 +234,10 @@ class VWAPCalculator:
             if price >= self.upper_band:
                 return 0.9  # Good for shorts
         
-        # Decaying quality as distance increases (use Decimal for subtraction)
-        return max(0.0, float(Decimal('1.0') - abs(distance_pct) / 2))
+        # Decaying quality as distance increases
+        return max(0.0, 1.0 - abs(distance_pct) / 2)
     
-    def _is_at_band(self, price: Decimal) -> Optional[str]:
+    def _is_at_band(self, price: float) -> Optional[str]:
         """Check if price is at VWAP band."""
         if not self.upper_band or not self.lower_band:
             return None
@@ -227,21 +245,25 @@ class VWAPCalculator:
         upper_dist = abs(price - self.upper_band) / self.upper_band * 100
         lower_dist = abs(price - self.lower_band) / self.lower_band * 100
         
-        if upper_dist < Decimal('0.2'):
+        if upper_dist < 0.2:
             return 'upper_band'
-        if lower_dist < Decimal('0.2'):
+        if lower_dist < 0.2:
             return 'lower_band'
         return None
     
     def _reset_session(self):
         """Reset VWAP for new session."""
-        self.cumulative_pv = Decimal('0')
-        self.cumulative_volume = Decimal('0')
+        self.cumulative_pv = 0.0
+        self.cumulative_volume = 0.0
         self.vwap = None
         self.upper_band = None
         self.lower_band = None
         self.prices.clear()
         self.volumes.clear()
+        self._shift = None
+        self._window_volume = 0.0
+        self._window_pv = 0.0
+        self._window_p2v = 0.0
         self.session_start = datetime.now(timezone.utc)
     
     def get_vwap_signal(self, direction: str, vwap_analysis: Dict) -> Tuple[float, str]:
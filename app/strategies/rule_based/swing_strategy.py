@@ -19,13 +19,15 @@ Target: 65%+ win rate with 3:1+ R:R in favorable conditions.
 """
 
 import os
+import time
 import logging
 from decimal import Decimal
 from typing import Dict, Any, Optional, List, Tuple
 from collections import deque
 from datetime import datetime, timezone, timedelta
+import numpy as np
 
-from app.strategies.adaptive.market_regime import MarketRegimeDetector, MarketRegime
+from app.strategies.adaptive.market_regime import MarketRegimeDetector, MarketRegime, TRENDING_REGIMES
 from app.strategies.adaptive.smart_money import SmartMoneyAnalyzer
 from app.strategies.adaptive.multi_timeframe import MultiTimeframeAnalyzer
 from app.strategies.adaptive.order_flow import OrderFlowAnalyzer
@@ -41,9 +43,124 @@ from app.strategies.adaptive.donchian import DonchianChannel, DonchianPosition
 from app.strategies.adaptive.stoch_rsi import StochRSICalculator
 from app.strategies.adaptive.obv import OBVCalculator
 from app.strategies.adaptive.cmf import ChaikinMoneyFlow
+from app.strategies.adaptive.candle_series import candle_arrays, true_range
 
 logger = logging.getLogger(__name__)
 
+# Enum members bound once for the per-tick regime/Supertrend/Donchian checks
+# (each Enum class attribute lookup goes through the metaclass)
+_REGIME_UNKNOWN = MarketRegime.UNKNOWN
+_TRENDING_UP = MarketRegime.TRENDING_UP
+_TRENDING_DOWN = MarketRegime.TRENDING_DOWN
+_ST_BULLISH = SupertrendDirection.BULLISH
+_ST_BEARISH = SupertrendDirection.BEARISH
+_DC_ABOVE_UPPER = DonchianPosition.ABOVE_UPPER
+_DC_UPPER_ZONE = DonchianPosition.UPPER_ZONE
+_DC_LOWER_ZONE = DonchianPosition.LOWER_ZONE
+_DC_BELOW_LOWER = DonchianPosition.BELOW_LOWER
+
+_UTC = timezone.utc
+
+# Closed-bar EMA values kept per period: with the forming bar this gives the
+# 9 MACD values the signal line is built from
+_EMA_HISTORY = 8
+
+
+def _candle_time(candle: Dict) -> Any:
+    """Open time of a candle (None if the feed does not provide one)."""
+    return candle.get('time', candle.get('t'))
+
+
+def _as_decimal(value: Optional[float]) -> Optional[Decimal]:
+    """Convert a float indicator value to Decimal (None passes through)."""
+    return Decimal(str(value)) if value is not None else None
+
+
+def _rsi_wilder(closes: np.ndarray, period: int, avg_gain: Optional[float],
+                avg_loss: Optional[float]) -> Tuple[float, float, float]:
+    """
+    One step of Wilder-smoothed RSI.
+    
+    Args:
+        closes: Close prices (at least period + 1)
+        period: RSI period
+        avg_gain, avg_loss: Averages from the previous step (None to seed
+            from the last `period` changes)
+        
+    Returns:
+        Tuple of (rsi, avg_gain, avg_loss)
+    """
+    if avg_gain is None or avg_loss is None:
+        changes = np.diff(closes[-(period + 1):])
+        avg_gain = float(np.maximum(changes, 0.0).sum()) / period
+        avg_loss = float(-np.minimum(changes, 0.0).sum()) / period
+    else:
+        current_change = float(closes[-1] - closes[-2])
+        avg_gain = (avg_gain * (period - 1) + max(current_change, 0.0)) / period
+        avg_loss = (avg_loss * (period - 1) + abs(min(current_change, 0.0))) / period
+    
+    if avg_loss == 0:
+        return 100.0, avg_gain, avg_loss
+    
+    rs = avg_gain / avg_loss
+    return 100.0 - (100.0 / (1.0 + rs)), avg_gain, avg_loss
+
+
+def _adx(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int) -> float:
+    """
+    ADX from the last `period` bars' True Range and directional movement.
+    
+    Args:
+        highs, lows, closes: Aligned OHLC arrays (at least period + 1)
+        period: ADX period
+        
+    Returns:
+        ADX value (0-100)
+    """
+    window = slice(-period - 1, None)
+    high = highs[window]
+    low = lows[window]
+    
+    # True Range = max(high-low, abs(high-prev_close), abs(low-prev_close))
+    tr = true_range(high, low, closes[window])
+    
+    # Directional Movement using high/low
+    up_move = np.diff(high)
+    down_move = -np.diff(low)
+    
+    # +DM: up move is greater than down move and positive
+    plus_dm_arr = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+    # -DM: down move is greater than up move and positive
+    minus_dm_arr = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+    
+    atr = float(tr.sum()) / period
+    plus_dm = float(plus_dm_arr.sum()) / period
+    minus_dm = float(minus_dm_arr.sum()) / period
+    
+    plus_di = (plus_dm / atr * 100) if atr > 0 else 0.0
+    minus_di = (minus_dm / atr * 100) if atr > 0 else 0.0
+    
+    di_sum = plus_di + minus_di
+    di_diff = abs(plus_di - minus_di)
+    
+    return (di_diff / di_sum * 100) if di_sum > 0 else 0.0
+
+
+def _atr(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int) -> float:
+    """
+    Simple-average ATR over the last `period` bars.
+    
+    Args:
+        highs, lows, closes: Aligned OHLC arrays (at least `period`; the first
+            bar has no previous close, so exactly `period` bars give period - 1 ranges)
+        period: ATR period
+        
+    Returns:
+        ATR value
+    """
+    start = max(0, len(closes) - period - 1)
+    return float(true_range(highs[start:], lows[start:], closes[start:]).sum()) / period
+
 
 class SwingStrategy:
     """
@@ -73,7 +190,8 @@ class SwingStrategy:
         
         # Core parameters from environment
         self.leverage = int(os.getenv('MAX_LEVERAGE', '5'))
-        self.base_position_size = Decimal(os.getenv('POSITION_SIZE_PCT', '50'))
+        self.base_position_size = float(os.getenv('POSITION_SIZE_PCT', '50'))
+        self.max_position_size = float(os.getenv('MAX_POSITION_SIZE_PCT', '55'))  # Cap applied per signal
         
         # TP/SL is calculated dynamically by AdaptiveRiskManager using ATR
         # See ATR_SL_MULTIPLIER and ATR_TP_MULTIPLIER in .env
@@ -117,6 +235,7 @@ class SwingStrategy:
         
         # Volume confirmation threshold
         self.volume_multiplier = Decimal(os.getenv('VOLUME_CONFIRMATION_MULT', '1.2'))  # Require 20% above average
+        self._volume_threshold = float(self.volume_multiplier)  # Float copy for the per-signal compare
         
         # Initialize adaptive components
         self.regime_detector = MarketRegimeDetector()
@@ -161,6 +280,7 @@ class SwingStrategy:
         
         # State tracking - BE PATIENT, DON'T OVERTRADE
         self.last_signal_time: Optional[datetime] = None
+        self.last_signal_ns: Optional[int] = None  # time.monotonic_ns() of last signal, for cooldown math
         self.signal_cooldown_seconds = int(os.getenv('SWING_COOLDOWN', '600'))  # 10 min between signals (was 5)
         self.recent_prices: deque = deque(maxlen=200)
         
@@ -183,13 +303,16 @@ class SwingStrategy:
         self._long_score_history: deque = deque(maxlen=5)
         self._short_score_history: deque = deque(maxlen=5)
         
-        # Indicator cache
+        # Indicator cache, keyed by time, count and high/low/close of the newest candle
         self._indicator_cache = {}
-        self._cache_timestamp: Optional[datetime] = None
+        self._cache_key: Optional[tuple] = None
         
         # RSI smoothing state
-        self.rsi_avg_gain: Optional[Decimal] = None
-        self.rsi_avg_loss: Optional[Decimal] = None
+        self.rsi_avg_gain: Optional[float] = None
+        self.rsi_avg_loss: Optional[float] = None
+        
+        # Streaming EMA state: period -> (time, close, recent EMAs) of the last closed candle
+        self._ema_state: Dict[int, Tuple[Any, float, deque]] = {}
         
         # RSI/MACD history for divergence detection
         self.rsi_history: deque = deque(maxlen=30)
@@ -206,7 +329,7 @@ class SwingStrategy:
         logger.info(f"   Signal Threshold: {self.min_signal_score}/{self.max_signal_score}")
         logger.info(f"   Components: Regime, SMC, MTF, OrderFlow, Sessions, AdaptiveRisk")
     
-    async def generate_signal(
+    def generate_signal(
         self,
         market_data: Dict[str, Any],
         account_state: Dict[str, Any],
@@ -221,6 +344,10 @@ class SwingStrategy:
         Returns:
             Signal dict or None if no trade
         """
+        # Check cooldown first - a monotonic clock compare, cheaper than anything below
+        if not self._check_cooldown():
+            return None
+        
         # Extract candles from market_data
         candles = market_data.get('candles', [])
         htf_candles = market_data.get('htf_candles')
@@ -228,14 +355,6 @@ class SwingStrategy:
         if not candles or len(candles) < 100:
             return None
         
-        # Check cooldown
-        if not self._check_cooldown():
-            return None
-        
-        # Extract prices
-        prices = [Decimal(str(c.get('close', c.get('c', 0)))) for c in candles]
-        current_price = prices[-1]
-        
         # ==================== ANALYSIS LAYERS ====================
         
         # 1. Calculate technical indicators
@@ -262,9 +381,8 @@ class SwingStrategy:
         )
         
         # CRITICAL: Don't trade when regime is UNKNOWN (insufficient data/analysis)
-        from app.strategies.adaptive.market_regime import MarketRegime
-        if regime == MarketRegime.UNKNOWN:
-            logger.debug(f"⏸️ Regime UNKNOWN for {self.symbol} - skipping signal generation")
+        if regime is _REGIME_UNKNOWN:
+            logger.debug("⏸️ Regime UNKNOWN for %s - skipping signal generation", self.symbol)
             return None
         
         # 3. Smart Money Concepts analysis
@@ -284,6 +402,11 @@ class SwingStrategy:
         
         # ==================== SIGNAL GENERATION ====================
         
+        # Current price (only the last close is needed here; indicators parse their own
+        # series). Parsed only once the indicator/regime rejections above have passed.
+        last_candle = candles[-1]
+        current_price = Decimal(str(last_candle.get('close', last_candle.get('c', 0))))
+        
         # Calculate directional scores
         long_score = self._calculate_signal_score(
             direction='long',
@@ -306,8 +429,9 @@ class SwingStrategy:
         )
         
         # Apply enhanced scoring (VWAP, Divergence, Volume)
-        long_enhanced, long_details = self._calculate_enhanced_score('long', candles, indicators, long_score)
-        short_enhanced, short_details = self._calculate_enhanced_score('short', candles, indicators, short_score)
+        # Reuse the regime detected above instead of re-detecting it per direction
+        long_enhanced, long_details = self._calculate_enhanced_score('long', candles, indicators, long_score, regime=regime)
+        short_enhanced, short_details = self._calculate_enhanced_score('short', candles, indicators, short_score, regime=regime)
         
         # Track score history for stability analysis
         self._long_score_history.append(long_enhanced)
@@ -315,37 +439,36 @@ class SwingStrategy:
         
         # Log scores every time for visibility (INFO level for debugging signal generation)
         if long_enhanced > 5 or short_enhanced > 5:  # Only log if at least some score
-            logger.info(f"📊 Scores: LONG={long_enhanced}/{self.max_signal_score} | SHORT={short_enhanced}/{self.max_signal_score} | Regime={regime.value} | Threshold={self.min_signal_score}")
+            logger.info("📊 Scores: LONG=%s/%s | SHORT=%s/%s | Regime=%s | Threshold=%s", long_enhanced, self.max_signal_score, short_enhanced, self.max_signal_score, regime.value, self.min_signal_score)
         
         # Determine best direction
         if long_enhanced >= self.min_signal_score and long_enhanced > short_enhanced:
             direction = 'long'
             score = long_enhanced
             score_details = long_details
-            logger.info(f"✅ LONG wins: {long_enhanced} vs SHORT {short_enhanced}")
+            logger.info("✅ LONG wins: %s vs SHORT %s", long_enhanced, short_enhanced)
         elif short_enhanced >= self.min_signal_score and short_enhanced > long_enhanced:
             direction = 'short'
             score = short_enhanced
             score_details = short_details
-            logger.info(f"✅ SHORT wins: {short_enhanced} vs LONG {long_enhanced}")
+            logger.info("✅ SHORT wins: %s vs LONG %s", short_enhanced, long_enhanced)
         else:
             # No valid signal - reset confirmation
             self._pending_signal = None
             self._confirmation_count = 0
             if long_enhanced > 0 or short_enhanced > 0:
-                logger.debug(f"⏳ No signal: LONG={long_enhanced}/{self.min_signal_score}, SHORT={short_enhanced}/{self.min_signal_score} (need {self.min_signal_score}+)")
+                logger.debug("⏳ No signal: LONG=%s/%s, SHORT=%s/%s (need %s+)", long_enhanced, self.min_signal_score, short_enhanced, self.min_signal_score, self.min_signal_score)
             return None
         
         # ==================== CRITICAL: HARD COUNTER-TREND BLOCK ====================
         # This is a HARD REJECTION, not just a penalty. Counter-trend trades are the
         # primary cause of losses in trending markets.
-        from app.strategies.adaptive.market_regime import MarketRegime
-        if direction == 'long' and regime == MarketRegime.TRENDING_DOWN:
+        if direction == 'long' and regime is _TRENDING_DOWN:
             logger.warning(f"🚫 HARD BLOCK: Cannot LONG in TRENDING_DOWN regime - rejecting signal")
             self._pending_signal = None
             self._confirmation_count = 0
             return None
-        elif direction == 'short' and regime == MarketRegime.TRENDING_UP:
+        elif direction == 'short' and regime is _TRENDING_UP:
             logger.warning(f"🚫 HARD BLOCK: Cannot SHORT in TRENDING_UP regime - rejecting signal")
             self._pending_signal = None
             self._confirmation_count = 0
@@ -356,8 +479,8 @@ class SwingStrategy:
         st_result = self.supertrend.calculate(candles)
         if st_result:
             st_against = (
-                (direction == 'long' and st_result.direction == SupertrendDirection.BEARISH) or
-                (direction == 'short' and st_result.direction == SupertrendDirection.BULLISH)
+                (direction == 'long' and st_result.direction is _ST_BEARISH) or
+                (direction == 'short' and st_result.direction is _ST_BULLISH)
             )
             if st_against and st_result.strength > 1.5:  # Strong trend against us
                 logger.warning(f"🚫 HARD BLOCK: {direction.upper()} against strong Supertrend ({st_result.direction.value}, strength={st_result.strength:.1f})")
@@ -368,7 +491,7 @@ class SwingStrategy:
         # ==================== WHIPSAW PROTECTION ====================
         
         # 1. Direction Lock Check - adaptive based on volatility
-        now = datetime.now(timezone.utc)
+        now = datetime.now(_UTC)  # Reused for the signal timestamp below
         if self._direction_lock_until and now < self._direction_lock_until:
             if self._locked_direction and direction != self._locked_direction:
                 # Check if we should override lock due to high volatility reversal
@@ -377,14 +500,14 @@ class SwingStrategy:
                 )
                 if not override_lock:
                     remaining = (self._direction_lock_until - now).total_seconds()
-                    logger.debug(f"🔒 Direction locked to {self._locked_direction} for {remaining:.0f}s more - ignoring {direction}")
+                    logger.debug("🔒 Direction locked to %s for %.0fs more - ignoring %s", self._locked_direction, remaining, direction)
                     return None
                 else:
                     logger.info(f"⚡ Direction lock OVERRIDDEN due to high volatility reversal signal")
         
         # 2. Score Stability Check - detect erratic signals
         if not self._check_score_stability(direction, score):
-            logger.debug(f"📉 Score unstable for {direction} - waiting for consistency")
+            logger.debug("📉 Score unstable for %s - waiting for consistency", direction)
             return None
         
         # 3. Signal Confirmation - require consistent signals across multiple scans
@@ -395,13 +518,13 @@ class SwingStrategy:
         # Check HTF alignment
         htf_aligned, htf_score, htf_reason = self.mtf_analyzer.should_take_trade(direction)
         if not htf_aligned and htf_score < 0.4:
-            logger.debug(f"❌ Signal rejected: HTF misalignment ({htf_reason})")
+            logger.debug("❌ Signal rejected: HTF misalignment (%s)", htf_reason)
             return None
         
         # Check session
         should_trade, session_reason = self.session_manager.should_trade()
         if not should_trade:
-            logger.debug(f"❌ Signal rejected: {session_reason}")
+            logger.debug("❌ Signal rejected: %s", session_reason)
             return None
         
         # ==================== PRO TRADING FILTERS ====================
@@ -416,10 +539,10 @@ class SwingStrategy:
         )
         
         if not pro_result.passed:
-            logger.debug(f"❌ Signal rejected by pro filter: {pro_result.reason}")
+            logger.debug("❌ Signal rejected by pro filter: %s", pro_result.reason)
             return None
         
-        logger.info(f"✅ Pro filters passed: {pro_result.reason} (confidence: {pro_result.confidence:.1%})")
+        logger.info("✅ Pro filters passed: %s (confidence: %.1f%%)", pro_result.reason, pro_result.confidence * 100)
         
         # ==================== RISK CALCULATION ====================
         
@@ -428,47 +551,44 @@ class SwingStrategy:
             logger.warning(f"⚠️ Invalid ATR for {self.symbol}, using fallback")
             atr = current_price * Decimal('0.01')  # 1% of price as fallback
         
-        # Ensure ATR is Decimal
-        atr = Decimal(str(atr)) if not isinstance(atr, Decimal) else atr
-        
         # Get adaptive TP/SL levels
         risk_levels = self.risk_manager.calculate_adaptive_levels(
-            entry_price=Decimal(str(current_price)),
+            entry_price=current_price,
             direction=direction,
             atr=atr,
             regime_params=regime_params,
             session_params=session_params,
         )
         
+        # Sizing runs in float: every value lands in the signal dict as a float
+        entry_price = float(current_price)
+        
         # Apply session aggression to position size
-        aggression = Decimal(str(session_params.get('aggression', 1.0)))
-        position_size = self.base_position_size * aggression
+        position_size = self.base_position_size * float(session_params.get('aggression', 1.0))
         
         # Apply regime position size adjustment
-        regime_size_mult = Decimal(str(regime_params.get('position_size_mult', 1.0)))
-        position_size *= regime_size_mult
+        position_size *= float(regime_params.get('position_size_mult', 1.0))
         
         # Cap at maximum
-        max_size = Decimal(os.getenv('MAX_POSITION_SIZE_PCT', '55'))
-        position_size = min(position_size, max_size)
+        position_size = min(position_size, self.max_position_size)
         
         # ==================== BUILD SIGNAL ====================
         
         # Calculate size in tokens (approximate)
-        account_value = Decimal(str(account_state.get('account_value', 1000)))
+        account_value = float(account_state.get('account_value', 1000))
         size_usd = account_value * position_size / 100 * self.leverage
-        size_tokens = size_usd / current_price
+        size_tokens = size_usd / entry_price
         
         signal = {
             'symbol': self.symbol,
             'direction': direction,
             'side': 'buy' if direction == 'long' else 'sell',  # For compatibility
             'signal_type': f'{direction.upper()} (Swing)',
-            'entry_price': float(current_price),
+            'entry_price': entry_price,
             'stop_loss': risk_levels['stop_loss'],
             'take_profit': risk_levels['take_profit'],
-            'position_size_pct': float(position_size),
-            'size': float(size_tokens),  # Token size for order execution
+            'position_size_pct': position_size,
+            'size': size_tokens,  # Token size for order execution
             'leverage': self.leverage,
             
             # Scoring
@@ -495,21 +615,24 @@ class SwingStrategy:
             'reason': f"Regime: {regime.value}, Score: {score}/{self.max_signal_score}",
             
             # Metadata
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': now.isoformat(),
             'strategy': 'Swing',
         }
         
         # Update state
-        self.last_signal_time = datetime.now(timezone.utc)
+        self.last_signal_time = now
+        self.last_signal_ns = time.monotonic_ns()
         self.signals_generated += 1
         
-        logger.info(f"🎯 SIGNAL: {direction.upper()} {self.symbol}")
-        logger.info(f"   Score: {score}/{self.max_signal_score} ({score/self.max_signal_score*100:.0f}%)")
-        logger.info(f"   Entry: ${current_price:.4f}")
-        logger.info(f"   SL: ${risk_levels['stop_loss']:.4f} ({risk_levels['sl_pct']:.2f}%)")
-        logger.info(f"   TP: ${risk_levels['take_profit']:.4f} ({risk_levels['tp_pct']:.2f}%)")
-        logger.info(f"   R:R: {risk_levels['rr_ratio']:.1f}:1")
-        logger.info(f"   Regime: {regime.value} | HTF: {htf_score:.0%} | SMC: {smc_analysis.get('bias')}")
+        # Seven formatted lines per signal - skip building them when INFO is filtered out
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"🎯 SIGNAL: {direction.upper()} {self.symbol}")
+            logger.info(f"   Score: {score}/{self.max_signal_score} ({score/self.max_signal_score*100:.0f}%)")
+            logger.info(f"   Entry: ${entry_price:.4f}")
+            logger.info(f"   SL: ${risk_levels['stop_loss']:.4f} ({risk_levels['sl_pct']:.2f}%)")
+            logger.info(f"   TP: ${risk_levels['take_profit']:.4f} ({risk_levels['tp_pct']:.2f}%)")
+            logger.info(f"   R:R: {risk_levels['rr_ratio']:.1f}:1")
+            logger.info(f"   Regime: {regime.value} | HTF: {htf_score:.0%} | SMC: {smc_analysis.get('bias')}")
         
         return signal
     
@@ -540,6 +663,9 @@ class SwingStrategy:
         ema_slow = indicators.get('ema_slow')
         adx = indicators.get('adx')
         macd = indicators.get('macd', {})
+        macd_hist = macd.get('histogram')
+        macd_line = macd.get('macd')
+        macd_signal = macd.get('signal')
         
         if direction == 'long':
             # RSI condition (0-1 point) - STRICT for high win rate
@@ -556,15 +682,15 @@ class SwingStrategy:
             
             # ADX trend strength (0-1 point)
             if adx and adx > 25:  # Raised from 20 to 25 for stronger trends
-                if regime in [MarketRegime.TRENDING_UP, MarketRegime.TRENDING_DOWN]:
+                if regime in TRENDING_REGIMES:
                     score += 1
                 else:
                     score += 0.5
             
             # MACD (0-1 point)
-            if macd.get('histogram') and macd['histogram'] > 0:
+            if macd_hist and macd_hist > 0:
                 score += 1
-            elif macd.get('macd') and macd.get('signal') and macd['macd'] > macd['signal']:
+            elif macd_line and macd_signal and macd_line > macd_signal:
                 score += 0.5
         
         else:  # short
@@ -581,15 +707,15 @@ class SwingStrategy:
             
             # ADX trend strength
             if adx and adx > 20:
-                if regime in [MarketRegime.TRENDING_UP, MarketRegime.TRENDING_DOWN]:
+                if regime in TRENDING_REGIMES:
                     score += 1
                 else:
                     score += 0.5
             
             # MACD
-            if macd.get('histogram') and macd['histogram'] < 0:
+            if macd_hist and macd_hist < 0:
                 score += 1
-            elif macd.get('macd') and macd.get('signal') and macd['macd'] < macd['signal']:
+            elif macd_line and macd_signal and macd_line < macd_signal:
                 score += 0.5
         
         # ========== SMART MONEY (0-2 points) ==========
@@ -639,10 +765,10 @@ class SwingStrategy:
         bos_score, bos_reason = self.smc_analyzer.get_bos_signal(direction)
         if bos_score > 0:
             score += bos_score
-            logger.debug(f"   BoS: +{bos_score:.1f} ({bos_reason})")
+            logger.debug("   BoS: +%.1f (%s)", bos_score, bos_reason)
         elif bos_score < 0:
             score += bos_score  # Penalty
-            logger.debug(f"   BoS: {bos_score:.1f} ({bos_reason})")
+            logger.debug("   BoS: %.1f (%s)", bos_score, bos_reason)
         
         return int(score)
     
@@ -652,6 +778,7 @@ class SwingStrategy:
         candles: List[Dict],
         indicators: Dict,
         base_score: int,
+        regime: Optional[MarketRegime] = None,
     ) -> Tuple[int, Dict[str, Any]]:
         """
         Calculate enhanced score with pro-level indicators.
@@ -679,6 +806,7 @@ class SwingStrategy:
             candles: OHLCV candles
             indicators: Calculated indicators
             base_score: Score from _calculate_signal_score
+            regime: Regime already detected for these candles (detected here if None)
             
         Returns:
             Tuple of (enhanced_score, details)
@@ -688,32 +816,34 @@ class SwingStrategy:
         
         # ========== REGIME ALIGNMENT CHECK (CRITICAL) ==========
         # Counter-trend trading is DANGEROUS - heavy penalty
-        from app.strategies.adaptive.market_regime import MarketRegime
-        regime_result = self.regime_detector.detect_regime(candles)
-        # detect_regime returns (regime_enum, confidence, params) tuple
-        regime = regime_result[0] if isinstance(regime_result, tuple) else regime_result
+        if regime is None:
+            regime_result = self.regime_detector.detect_regime(candles)
+            # detect_regime returns (regime_enum, confidence, params) tuple
+            regime = regime_result[0] if isinstance(regime_result, tuple) else regime_result
         
-        if direction == 'long' and regime == MarketRegime.TRENDING_DOWN:
+        if direction == 'long' and regime is _TRENDING_DOWN:
             score -= self.regime_penalty  # -5 points
             details['penalties'].append({'type': 'regime', 'score': -self.regime_penalty, 'reason': 'LONG in downtrend'})
-            logger.debug(f"   ⛔ REGIME PENALTY: -{self.regime_penalty} (LONG against TRENDING_DOWN)")
-        elif direction == 'short' and regime == MarketRegime.TRENDING_UP:
+            logger.debug("   ⛔ REGIME PENALTY: -%s (LONG against TRENDING_DOWN)", self.regime_penalty)
+        elif direction == 'short' and regime is _TRENDING_UP:
             score -= self.regime_penalty  # -5 points
             details['penalties'].append({'type': 'regime', 'score': -self.regime_penalty, 'reason': 'SHORT in uptrend'})
-            logger.debug(f"   ⛔ REGIME PENALTY: -{self.regime_penalty} (SHORT against TRENDING_UP)")
-        elif (direction == 'long' and regime == MarketRegime.TRENDING_UP) or \
-             (direction == 'short' and regime == MarketRegime.TRENDING_DOWN):
+            logger.debug("   ⛔ REGIME PENALTY: -%s (SHORT against TRENDING_UP)", self.regime_penalty)
+        elif (direction == 'long' and regime is _TRENDING_UP) or \
+             (direction == 'short' and regime is _TRENDING_DOWN):
             score += 2.0  # Bonus for trend alignment
             details['regime_bonus'] = {'score': 2.0, 'reason': 'Trading WITH trend'}
-            logger.debug(f"   ✅ Regime: +2.0 (Trading WITH {regime.value})")
+            logger.debug("   ✅ Regime: +2.0 (Trading WITH %s)", regime.value)
         
         # ========== SUPERTREND (CRITICAL) ==========
         # This is a key trend filter - trading against supertrend is risky
         st_result = self.supertrend.calculate(candles)
         if st_result:
+            st_direction = st_result.direction
+            st_direction_name = st_direction.value  # Read the enum value once per call
             st_aligned = (
-                (direction == 'long' and st_result.direction == SupertrendDirection.BULLISH) or
-                (direction == 'short' and st_result.direction == SupertrendDirection.BEARISH)
+                (direction == 'long' and st_direction is _ST_BULLISH) or
+                (direction == 'short' and st_direction is _ST_BEARISH)
             )
             
             if st_aligned:
@@ -726,22 +856,22 @@ class SwingStrategy:
                 score += st_score
                 details['supertrend'] = {
                     'aligned': True, 
-                    'direction': st_result.direction.value,
+                    'direction': st_direction_name,
                     'score': st_score,
                     'strength': st_result.strength
                 }
-                logger.debug(f"   ✅ Supertrend: +{st_score:.1f} ({st_result.direction.value}, strength={st_result.strength:.1f}%)")
+                logger.debug("   ✅ Supertrend: +%.1f (%s, strength=%.1f%%)", st_score, st_direction_name, st_result.strength)
             else:
                 # Against supertrend - HEAVY PENALTY (this is dangerous!)
                 score -= self.supertrend_penalty  # -3 points
-                details['penalties'].append({'type': 'supertrend', 'score': -self.supertrend_penalty, 'reason': f'Against {st_result.direction.value}'})
+                details['penalties'].append({'type': 'supertrend', 'score': -self.supertrend_penalty, 'reason': f'Against {st_direction_name}'})
                 details['supertrend'] = {
                     'aligned': False,
-                    'direction': st_result.direction.value,
+                    'direction': st_direction_name,
                     'score': -self.supertrend_penalty,
                     'warning': 'Trading against trend!'
                 }
-                logger.debug(f"   ⛔ SUPERTREND PENALTY: -{self.supertrend_penalty} (AGAINST {st_result.direction.value} trend!)")
+                logger.debug("   ⛔ SUPERTREND PENALTY: -%s (AGAINST %s trend!)", self.supertrend_penalty, st_direction_name)
         
         # ========== DONCHIAN CHANNEL (0-1.5 points) ==========
         dc_result = self.donchian.calculate(candles)
@@ -758,23 +888,23 @@ class SwingStrategy:
                 dc_reason = "Bearish breakdown!"
             # Position-based scoring
             elif direction == 'long':
-                if dc_result.position == DonchianPosition.UPPER_ZONE:
+                if dc_result.position is _DC_UPPER_ZONE:
                     dc_score = 0.5
                     dc_reason = "Upper zone (bullish)"
-                elif dc_result.position == DonchianPosition.ABOVE_UPPER:
+                elif dc_result.position is _DC_ABOVE_UPPER:
                     dc_score = 1.0
                     dc_reason = "Above upper band"
-                elif dc_result.position == DonchianPosition.LOWER_ZONE:
+                elif dc_result.position is _DC_LOWER_ZONE:
                     dc_score = -0.5
                     dc_reason = "Lower zone (bearish bias)"
             else:  # short
-                if dc_result.position == DonchianPosition.LOWER_ZONE:
+                if dc_result.position is _DC_LOWER_ZONE:
                     dc_score = 0.5
                     dc_reason = "Lower zone (bearish)"
-                elif dc_result.position == DonchianPosition.BELOW_LOWER:
+                elif dc_result.position is _DC_BELOW_LOWER:
                     dc_score = 1.0
                     dc_reason = "Below lower band"
-                elif dc_result.position == DonchianPosition.UPPER_ZONE:
+                elif dc_result.position is _DC_UPPER_ZONE:
                     dc_score = -0.5
                     dc_reason = "Upper zone (bullish bias)"
             
@@ -792,7 +922,7 @@ class SwingStrategy:
                     'squeeze': dc_result.squeeze,
                     'width_pct': dc_result.width_pct
                 }
-                logger.debug(f"   Donchian: {dc_score:+.1f} ({dc_reason})")
+                logger.debug("   Donchian: %+.1f (%s)", dc_score, dc_reason)
         
         # ========== VWAP CONFLUENCE (0-1.5 points) ==========
         vwap_analysis = self.vwap_calculator.calculate_from_candles(candles)
@@ -800,7 +930,7 @@ class SwingStrategy:
         if vwap_score != 0:
             score += vwap_score
             details['vwap'] = {'score': vwap_score, 'reason': vwap_reason}
-            logger.debug(f"   VWAP: +{vwap_score:.1f} ({vwap_reason})")
+            logger.debug("   VWAP: +%.1f (%s)", vwap_score, vwap_reason)
         
         # ========== DIVERGENCE (0-2 points) ==========
         if len(self.rsi_history) >= 15 and len(self.macd_history) >= 15:
@@ -813,7 +943,7 @@ class SwingStrategy:
             if div_score != 0:
                 score += div_score
                 details['divergence'] = {'score': div_score, 'reason': div_reason}
-                logger.debug(f"   Divergence: +{div_score:.1f} ({div_reason})")
+                logger.debug("   Divergence: +%.1f (%s)", div_score, div_reason)
         
         # ========== VOLUME CONFIRMATION (CRITICAL) ==========
         # "Volume is truth" - no volume = fake move
@@ -821,13 +951,13 @@ class SwingStrategy:
         if volume_ok:
             score += 1.5  # Increased bonus for volume confirmation
             details['volume'] = {'confirmed': True, 'ratio': volume_ratio}
-            logger.debug(f"   ✅ Volume: +1.5 (ratio: {volume_ratio:.1f}x)")
+            logger.debug("   ✅ Volume: +1.5 (ratio: %.1fx)", volume_ratio)
         else:
             # Weak volume is a serious warning - PENALTY
             score -= self.volume_penalty  # -2 points
-            details['penalties'].append({'type': 'volume', 'score': -self.volume_penalty, 'reason': f'Weak volume ({volume_ratio:.1f}x)'})
+            details['penalties'].append({'type': 'volume', 'score': -self.volume_penalty, 'reason': 'Weak volume', 'ratio': volume_ratio})
             details['volume'] = {'confirmed': False, 'ratio': volume_ratio}
-            logger.debug(f"   ⛔ VOLUME PENALTY: -{self.volume_penalty} (weak: {volume_ratio:.1f}x)")
+            logger.debug("   ⛔ VOLUME PENALTY: -%s (weak: %.1fx)", self.volume_penalty, volume_ratio)
         
         # ========== STOCH RSI (0-1.5 points) ==========
         # More sensitive than regular RSI for detecting extreme conditions
@@ -840,23 +970,23 @@ class SwingStrategy:
             if direction == 'long':
                 if stoch_result.zone == 'oversold':
                     stoch_score = 1.0
-                    stoch_reason = f"Oversold (K={stoch_result.k_line:.1f})"
+                    stoch_reason = "Oversold"
                     if stoch_result.crossover == 'bullish':
                         stoch_score = 1.5
-                        stoch_reason += " + bullish crossover"
+                        stoch_reason = "Oversold + bullish crossover"
                 elif stoch_result.zone == 'overbought':
                     stoch_score = -0.5
-                    stoch_reason = f"Overbought warning (K={stoch_result.k_line:.1f})"
+                    stoch_reason = "Overbought warning"
             else:  # short
                 if stoch_result.zone == 'overbought':
                     stoch_score = 1.0
-                    stoch_reason = f"Overbought (K={stoch_result.k_line:.1f})"
+                    stoch_reason = "Overbought"
                     if stoch_result.crossover == 'bearish':
                         stoch_score = 1.5
-                        stoch_reason += " + bearish crossover"
+                        stoch_reason = "Overbought + bearish crossover"
                 elif stoch_result.zone == 'oversold':
                     stoch_score = -0.5
-                    stoch_reason = f"Oversold warning (K={stoch_result.k_line:.1f})"
+                    stoch_reason = "Oversold warning"
             
             if stoch_score != 0:
                 score += stoch_score
@@ -868,7 +998,7 @@ class SwingStrategy:
                     'crossover': stoch_result.crossover,
                     'reason': stoch_reason
                 }
-                logger.debug(f"   StochRSI: {stoch_score:+.1f} ({stoch_reason})")
+                logger.debug("   StochRSI: %+.1f (%s, K=%.1f)", stoch_score, stoch_reason, stoch_result.k_line)
         
         # ========== OBV - On Balance Volume (0-1.5 points, -1 for divergence) ==========
         # Volume-price confirmation from institutional trading
@@ -894,10 +1024,10 @@ class SwingStrategy:
             # Trend confirmation
             elif direction == 'long' and obv_result.trend == 'rising':
                 obv_score = 1.0 if obv_result.strength > 0.5 else 0.5
-                obv_reason = f"OBV rising (strength={obv_result.strength:.1f})"
+                obv_reason = "OBV rising"
             elif direction == 'short' and obv_result.trend == 'falling':
                 obv_score = 1.0 if obv_result.strength > 0.5 else 0.5
-                obv_reason = f"OBV falling (strength={obv_result.strength:.1f})"
+                obv_reason = "OBV falling"
             # Against trend
             elif direction == 'long' and obv_result.trend == 'falling':
                 obv_score = -0.5
@@ -916,9 +1046,9 @@ class SwingStrategy:
                     'reason': obv_reason
                 }
                 if obv_score > 0:
-                    logger.debug(f"   OBV: {obv_score:+.1f} (trend={obv_result.trend}, {obv_reason})")
+                    logger.debug("   OBV: %+.1f (trend=%s, strength=%.1f, %s)", obv_score, obv_result.trend, obv_result.strength, obv_reason)
                 else:
-                    logger.debug(f"   OBV: {obv_score:+.1f} ⚠️ ({obv_reason})")
+                    logger.debug("   OBV: %+.1f ⚠️ (%s)", obv_score, obv_reason)
         
         # ========== CMF - Chaikin Money Flow (0-1.5 points) ==========
         # Institutional buying/selling pressure
@@ -938,23 +1068,23 @@ class SwingStrategy:
             elif direction == 'long':
                 if cmf_result.zone == 'strong_buy':
                     cmf_score = 1.0
-                    cmf_reason = f"Strong buying ({cmf_result.cmf:.2f})"
+                    cmf_reason = "Strong buying"
                 elif cmf_result.zone == 'buy':
                     cmf_score = 0.5
-                    cmf_reason = f"Buying pressure ({cmf_result.cmf:.2f})"
+                    cmf_reason = "Buying pressure"
                 elif cmf_result.zone in ['sell', 'strong_sell']:
                     cmf_score = -0.5
-                    cmf_reason = f"Against money flow ({cmf_result.cmf:.2f})"
+                    cmf_reason = "Against money flow"
             else:  # short
                 if cmf_result.zone == 'strong_sell':
                     cmf_score = 1.0
-                    cmf_reason = f"Strong selling ({cmf_result.cmf:.2f})"
+                    cmf_reason = "Strong selling"
                 elif cmf_result.zone == 'sell':
                     cmf_score = 0.5
-                    cmf_reason = f"Selling pressure ({cmf_result.cmf:.2f})"
+                    cmf_reason = "Selling pressure"
                 elif cmf_result.zone in ['buy', 'strong_buy']:
                     cmf_score = -0.5
-                    cmf_reason = f"Against money flow ({cmf_result.cmf:.2f})"
+                    cmf_reason = "Against money flow"
             
             if cmf_score != 0:
                 score += cmf_score
@@ -966,7 +1096,7 @@ class SwingStrategy:
                     'divergence': cmf_result.divergence,
                     'reason': cmf_reason
                 }
-                logger.debug(f"   CMF: {cmf_score:+.1f} ({cmf_reason})")
+                logger.debug("   CMF: %+.1f (%s, %.2f)", cmf_score, cmf_reason, cmf_result.cmf)
         
         # ========== FINAL SCORE CALCULATION ==========
         # Floor at 0 (can't go negative) and cap at max_signal_score
@@ -979,10 +1109,10 @@ class SwingStrategy:
         details['final_score'] = final_score
         
         # Only log score summary at debug level (too verbose for info)
-        logger.debug(f"   📊 Score: {base_score} (base) + bonuses - {abs(total_penalties):.0f} (penalties) = {final_score}/{self.max_signal_score}")
+        logger.debug("   📊 Score: %s (base) + bonuses - %.0f (penalties) = %s/%s", base_score, abs(total_penalties), final_score, self.max_signal_score)
         
         if final_score > self.max_signal_score:
-            logger.debug(f"   Score capped: {int(score)} → {final_score}")
+            logger.debug("   Score capped: %s → %s", int(score), final_score)
         
         return final_score, details
     
@@ -1001,111 +1131,160 @@ class SwingStrategy:
         if len(candles) < 20:
             return True, 1.0  # Not enough data, pass
         
-        volumes = [float(c.get('volume', c.get('v', 0))) for c in candles]
-        avg_volume = sum(volumes[-20:]) / 20
+        # Only the 20-candle average window is needed
+        volumes = [float(c.get('volume', c.get('v', 0))) for c in candles[-20:]]
+        avg_volume = sum(volumes) / 20
         current_volume = volumes[-1]
         
         if avg_volume <= 0:
             return True, 1.0
         
         volume_ratio = current_volume / avg_volume
-        is_confirmed = Decimal(str(volume_ratio)) >= self.volume_multiplier
+        is_confirmed = volume_ratio >= self._volume_threshold
         
         return is_confirmed, volume_ratio
     
     def _calculate_indicators(self, candles: List[Dict]) -> Optional[Dict]:
-        """Calculate all technical indicators."""
-        prices = [Decimal(str(c.get('close', c.get('c', 0)))) for c in candles]
+        """
+        Calculate all technical indicators.
         
-        if len(prices) < 50:
+        The helpers work on float64 arrays (the candle parse shared with the
+        other indicators this tick); results become Decimal only here, for the
+        regime/scoring code that consumes them.
+        """
+        if len(candles) < 50:
             return None
         
-        return {
-            'rsi': self._calculate_rsi(prices),
-            'ema_fast': self._calculate_ema(prices, self.ema_fast),
-            'ema_slow': self._calculate_ema(prices, self.ema_slow),
-            'adx': self._calculate_adx(candles),
-            'atr': self._calculate_atr(candles),
-            'macd': self._calculate_macd(prices),
-            'bb_bandwidth': self._calculate_bb_bandwidth(prices),
+        # Same newest candle (and same high/low/close, it may still be forming)
+        # means the same indicators - also keeps repeat calls from re-advancing RSI state
+        last = candles[-1]
+        last_time = _candle_time(last)
+        cache_key = (
+            last_time,
+            len(candles),
+            last.get('high', last.get('h')),
+            last.get('low', last.get('l')),
+            last.get('close', last.get('c')),
+        )
+        if last_time is not None and cache_key == self._cache_key:
+            return self._indicator_cache
+        
+        _, highs, lows, closes, _ = candle_arrays(candles)
+        ema_fast = self._streaming_ema(candles, closes, self.ema_fast)
+        ema_slow = self._streaming_ema(candles, closes, self.ema_slow)
+        macd = self._calculate_macd(candles, closes)
+        
+        indicators = {
+            'rsi': _as_decimal(self._calculate_rsi(closes)),
+            'ema_fast': _as_decimal(ema_fast[-1]) if ema_fast else None,
+            'ema_slow': _as_decimal(ema_slow[-1]) if ema_slow else None,
+            'adx': _as_decimal(self._calculate_adx(highs, lows, closes)),
+            'atr': _as_decimal(self._calculate_atr(highs, lows, closes)),
+            'macd': {key: Decimal(str(value)) for key, value in macd.items()},
+            'bb_bandwidth': _as_decimal(self._calculate_bb_bandwidth(closes)),
         }
+        
+        self._indicator_cache = indicators
+        self._cache_key = cache_key
+        return indicators
     
-    def _calculate_rsi(self, prices: List[Decimal], period: int = 14) -> Optional[Decimal]:
+    def _calculate_rsi(self, closes: np.ndarray, period: int = 14) -> Optional[float]:
         """Calculate RSI with Wilder's smoothing."""
-        if len(prices) < period + 1:
+        if len(closes) < period + 1:
             return None
         
-        # Ensure prices are Decimal
-        decimal_prices = [Decimal(str(p)) if not isinstance(p, Decimal) else p for p in prices]
-        period_dec = Decimal(str(period))
-        
-        current_change = decimal_prices[-1] - decimal_prices[-2]
-        current_gain = max(current_change, Decimal('0'))
-        current_loss = abs(min(current_change, Decimal('0')))
+        rsi, self.rsi_avg_gain, self.rsi_avg_loss = _rsi_wilder(
+            closes, period, self.rsi_avg_gain, self.rsi_avg_loss
+        )
+        return rsi
+    
+    def _calculate_ema(self, values: np.ndarray, period: int) -> Optional[float]:
+        """Calculate EMA."""
+        if len(values) < period:
+            return None
         
-        if self.rsi_avg_gain is None:
-            changes = [decimal_prices[i] - decimal_prices[i-1] for i in range(-period, 0)]
-            gains = [max(c, Decimal('0')) for c in changes]
-            losses = [abs(min(c, Decimal('0'))) for c in changes]
-            self.rsi_avg_gain = sum(gains) / period_dec
-            self.rsi_avg_loss = sum(losses) / period_dec
-        else:
-            self.rsi_avg_gain = (self.rsi_avg_gain * (period_dec - Decimal('1')) + current_gain) / period_dec
-            self.rsi_avg_loss = (self.rsi_avg_loss * (period_dec - Decimal('1')) + current_loss) / period_dec
+        multiplier = 2.0 / (period + 1)
+        keep = 1.0 - multiplier
         
-        if self.rsi_avg_loss == 0:
-            return Decimal('100')
+        ema = float(values[:period].sum()) / period
+        for price in values[period:].tolist():
+            ema = (price * multiplier) + (ema * keep)
         
-        rs = self.rsi_avg_gain / self.rsi_avg_loss
-        return Decimal('100') - (Decimal('100') / (Decimal('1') + rs))
+        return ema
     
-    def _calculate_ema(self, prices: List[Decimal], period: int) -> Optional[Decimal]:
-        """Calculate EMA."""
-        if len(prices) < period:
-            return None
+    def _streaming_ema(self, candles: List[Dict], closes: np.ndarray, period: int) -> List[float]:
+        """
+        EMA for the most recent bars, carried forward between calls.
         
-        # Ensure all arithmetic uses Decimal to avoid float/Decimal mixing
-        multiplier = Decimal('2') / Decimal(str(period + 1))
+        The EMA up to the last closed candle is kept per period, so a call only
+        folds in the candles that closed since the previous one instead of
+        re-walking the whole window. The forming candle is applied on top of
+        that state without being stored, since its close still moves. Without
+        usable state (first call, gap, other series) it is seeded like
+        _calculate_ema.
         
-        # Ensure prices are all Decimal
-        decimal_prices = [Decimal(str(p)) if not isinstance(p, Decimal) else p for p in prices]
+        Returns:
+            Up to _EMA_HISTORY + 1 EMA values, oldest first, the last one for
+            the forming candle (empty if there are too few candles to seed)
+        """
+        last_closed = len(closes) - 2
+        if last_closed < 0:
+            return []
+        
+        multiplier = 2.0 / (period + 1)
+        keep = 1.0 - multiplier
+        
+        start = None
+        state = self._ema_state.get(period)
+        if state is not None:
+            state_time, state_close, history = state
+            # Time alone could match a different symbol's candles, so the close must too
+            for i in range(last_closed, -1, -1):
+                if _candle_time(candles[i]) == state_time:
+                    if closes[i] == state_close:
+                        start = i + 1
+                    break
+        
+        if start is None:
+            if last_closed + 1 < period:
+                return []
+            history = deque(maxlen=_EMA_HISTORY)
+            ema = float(closes[:period].sum()) / period
+            history.append(ema)
+            start = period
+        else:
+            ema = history[-1]
         
-        ema = sum(decimal_prices[:period]) / Decimal(str(period))
+        for price in closes[start:last_closed + 1].tolist():
+            ema = (price * multiplier) + (ema * keep)
+            history.append(ema)
         
-        for price in decimal_prices[period:]:
-            ema = (price * multiplier) + (ema * (Decimal('1') - multiplier))
+        closed_time = _candle_time(candles[last_closed])
+        if closed_time is not None:
+            self._ema_state[period] = (closed_time, float(closes[last_closed]), history)
         
-        return ema
+        return [*history, (float(closes[-1]) * multiplier) + (ema * keep)]
     
-    def _calculate_macd(self, prices: List[Decimal]) -> Dict:
+    def _calculate_macd(self, candles: List[Dict], closes: np.ndarray) -> Dict[str, float]:
         """Calculate MACD with proper signal line (EMA of MACD values)."""
         # Need at least 26 + 9 = 35 prices to calculate signal line
-        if len(prices) < 35:
+        if len(closes) < 35:
             # Fallback: calculate just MACD line without proper signal
-            ema_12 = self._calculate_ema(prices, 12)
-            ema_26 = self._calculate_ema(prices, 26)
+            ema_12 = self._calculate_ema(closes, 12)
+            ema_26 = self._calculate_ema(closes, 26)
             if not ema_12 or not ema_26:
                 return {}
             macd_line = ema_12 - ema_26
             return {
                 'macd': macd_line,
                 'signal': macd_line,  # No proper signal available
-                'histogram': Decimal('0'),
+                'histogram': 0.0,
             }
         
-        # Calculate MACD values for the last 9 periods to build signal line
-        macd_values = []
-        for i in range(9):
-            # Use prices up to position -(8-i) from the end
-            # i=0: prices[:-8], i=1: prices[:-7], ... i=8: prices[:] (all)
-            end_idx = len(prices) - (8 - i) if i < 8 else len(prices)
-            price_slice = prices[:end_idx]
-            
-            ema_12 = self._calculate_ema(price_slice, 12)
-            ema_26 = self._calculate_ema(price_slice, 26)
-            
-            if ema_12 and ema_26:
-                macd_values.append(ema_12 - ema_26)
+        # MACD values for the last 9 bars to build the signal line
+        ema_12 = self._streaming_ema(candles, closes, 12)
+        ema_26 = self._streaming_ema(candles, closes, 26)
+        macd_values = [fast - slow for fast, slow in zip(ema_12[-9:], ema_26[-9:])]
         
         if len(macd_values) < 9:
             return {}
@@ -1114,7 +1293,7 @@ class SwingStrategy:
         macd_line = macd_values[-1]
         
         # Signal line is EMA(9) of MACD values
-        signal_line = self._calculate_ema(macd_values, 9) or macd_line
+        signal_line = self._calculate_ema(np.array(macd_values), 9) or macd_line
         
         return {
             'macd': macd_line,
@@ -1122,97 +1301,44 @@ class SwingStrategy:
             'histogram': macd_line - signal_line,
         }
     
-    def _calculate_adx(self, candles: List[Dict], period: int = 14) -> Optional[Decimal]:
+    def _calculate_adx(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                       period: int = 14) -> Optional[float]:
         """Calculate ADX with proper True Range (using H/L/C, not just close)."""
-        if len(candles) < period * 2:
-            return None
-        
-        tr_list, plus_dm_list, minus_dm_list = [], [], []
-        
-        for i in range(1, len(candles)):
-            # Get OHLC data
-            high = Decimal(str(candles[i].get('high', candles[i].get('h', 0))))
-            low = Decimal(str(candles[i].get('low', candles[i].get('l', 0))))
-            prev_close = Decimal(str(candles[i-1].get('close', candles[i-1].get('c', 0))))
-            prev_high = Decimal(str(candles[i-1].get('high', candles[i-1].get('h', 0))))
-            prev_low = Decimal(str(candles[i-1].get('low', candles[i-1].get('l', 0))))
-            
-            # True Range = max(high-low, abs(high-prev_close), abs(low-prev_close))
-            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
-            tr_list.append(tr)
-            
-            # Directional Movement using high/low
-            up_move = high - prev_high
-            down_move = prev_low - low
-            
-            # +DM: up move is greater than down move and positive
-            plus_dm = up_move if (up_move > down_move and up_move > 0) else Decimal('0')
-            # -DM: down move is greater than up move and positive
-            minus_dm = down_move if (down_move > up_move and down_move > 0) else Decimal('0')
-            
-            plus_dm_list.append(plus_dm)
-            minus_dm_list.append(minus_dm)
-        
-        if len(tr_list) < period:
+        if len(closes) < period * 2:
             return None
-        
-        period_dec = Decimal(str(period))
-        atr = sum(tr_list[-period:]) / period_dec
-        plus_dm = sum(plus_dm_list[-period:]) / period_dec
-        minus_dm = sum(minus_dm_list[-period:]) / period_dec
-        
-        plus_di = (plus_dm / atr * Decimal('100')) if atr > 0 else Decimal('0')
-        minus_di = (minus_dm / atr * Decimal('100')) if atr > 0 else Decimal('0')
-        
-        di_sum = plus_di + minus_di
-        di_diff = abs(plus_di - minus_di)
-        
-        return (di_diff / di_sum * Decimal('100')) if di_sum > 0 else Decimal('0')
+        return _adx(highs, lows, closes, period)
     
-    def _calculate_atr(self, candles: List[Dict], period: int = 14) -> Optional[Decimal]:
+    def _calculate_atr(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                       period: int = 14) -> Optional[float]:
         """Calculate ATR."""
-        if len(candles) < period:
+        if len(closes) < period:
             return None
-        
-        tr_list = []
-        for i in range(1, len(candles)):
-            high = Decimal(str(candles[i].get('high', candles[i].get('h', 0))))
-            low = Decimal(str(candles[i].get('low', candles[i].get('l', 0))))
-            prev_close = Decimal(str(candles[i-1].get('close', candles[i-1].get('c', 0))))
-            
-            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
-            tr_list.append(tr)
-        
-        return sum(tr_list[-period:]) / Decimal(str(period))
+        return _atr(highs, lows, closes, period)
     
-    def _calculate_bb_bandwidth(self, prices: List[Decimal], period: int = 20) -> Optional[Decimal]:
+    def _calculate_bb_bandwidth(self, closes: np.ndarray, period: int = 20) -> Optional[float]:
         """Calculate Bollinger Band bandwidth."""
-        if len(prices) < period:
+        if len(closes) < period:
             return None
         
-        recent = prices[-period:]
-        period_dec = Decimal(str(period))
-        sma = sum(recent) / period_dec
-        variance = sum((p - sma) ** 2 for p in recent) / period_dec
-        std = variance ** Decimal('0.5')
+        recent = closes[-period:]
+        sma = float(recent.mean())
+        std = float(recent.std())  # Population std, same as the band formula
         
-        upper = sma + (std * 2)
-        lower = sma - (std * 2)
-        
-        return ((upper - lower) / sma) * 100
+        # (upper - lower) / sma with upper/lower = sma +/- 2 * std
+        return (4 * std / sma) * 100
     
     def _check_cooldown(self) -> bool:
-        """Check if signal cooldown has passed."""
-        if not self.last_signal_time:
+        """Check if signal cooldown has passed (integer ns compare, no datetime math per tick)."""
+        if self.last_signal_ns is None:
             return True
         
-        elapsed = (datetime.now(timezone.utc) - self.last_signal_time).total_seconds()
-        return elapsed >= self.signal_cooldown_seconds
+        elapsed_ns = time.monotonic_ns() - self.last_signal_ns
+        return elapsed_ns >= self.signal_cooldown_seconds * 1_000_000_000
     
     def invalidate_indicator_cache(self):
         """Invalidate cache when new candle arrives."""
         self._indicator_cache = {}
-        self._cache_timestamp = None
+        self._cache_key = None
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get strategy statistics for Telegram /stats command."""
@@ -1234,8 +1360,8 @@ class SwingStrategy:
             'htf_bias': self.mtf_analyzer.get_htf_bias(),
             'session': self.session_manager.get_current_session().value,
             'cooldown_remaining': max(0, self.signal_cooldown_seconds - 
-                (datetime.now(timezone.utc) - self.last_signal_time).total_seconds()
-                if self.last_signal_time else 0),
+                (time.monotonic_ns() - self.last_signal_ns) / 1e9
+                if self.last_signal_ns is not None else 0),
         }
     
     def record_trade_execution(self, signal: Dict[str, Any], result: Dict[str, Any]):
@@ -1353,7 +1479,8 @@ class SwingStrategy:
             logger.info(f"⚡ Lock override: {' | '.join(override_reasons)} (override_score={override_score})")
             return True
         
-        logger.debug(f"🔒 Lock maintained: override_score={override_score}/3 ({', '.join(override_reasons) or 'no signals'})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"🔒 Lock maintained: override_score={override_score}/3 ({', '.join(override_reasons) or 'no signals'})")
         return False
     
     def _confirm_signal(self, direction: str, score: float, current_price: Decimal, indicators: Dict = None) -> bool:
@@ -1372,17 +1499,21 @@ class SwingStrategy:
         Returns:
             True if signal is confirmed, False if still building confirmation
         """
-        now = datetime.now(timezone.utc)
+        now = datetime.now(_UTC)
+        price = float(current_price)
         
-        # Adaptive confirmation based on volatility
-        confirmations_needed = self.signal_confirmation_required
+        # ATR as % of price (float; reused for the price-move threshold below)
+        atr_pct = None
         if indicators:
             atr = indicators.get('atr')
-            if atr and current_price > 0:
-                atr_pct = float(atr) / float(current_price) * 100
-                if atr_pct > 3.0:  # High volatility
-                    confirmations_needed = max(1, self.signal_confirmation_required - 1)
-                    logger.debug(f"⚡ High volatility ({atr_pct:.2f}%) - reduced confirmations to {confirmations_needed}")
+            if atr and price > 0:
+                atr_pct = float(atr) / price * 100
+        
+        # Adaptive confirmation based on volatility
+        confirmations_needed = self.signal_confirmation_required
+        if atr_pct is not None and atr_pct > 3.0:  # High volatility
+            confirmations_needed = max(1, self.signal_confirmation_required - 1)
+            logger.debug("⚡ High volatility (%.2f%%) - reduced confirmations to %s", atr_pct, confirmations_needed)
         
         # Check if this is a new direction or continuation
         if self._pending_signal is None or self._pending_signal.get('direction') != direction:
@@ -1390,7 +1521,7 @@ class SwingStrategy:
             self._pending_signal = {
                 'direction': direction,
                 'first_seen': now,
-                'price_at_first': float(current_price),
+                'price_at_first': price,
                 'scores': [score],
             }
             self._confirmation_count = 1
@@ -1402,16 +1533,13 @@ class SwingStrategy:
         self._pending_signal['scores'].append(score)
         
         # Check if price moved too much during confirmation (invalidates signal)
-        first_price = Decimal(str(self._pending_signal['price_at_first']))
-        price_change_pct = abs(current_price - first_price) / first_price * 100
+        first_price = self._pending_signal['price_at_first']
+        price_change_pct = abs(price - first_price) / first_price * 100
         
         # Adaptive price threshold based on volatility
-        max_price_move = Decimal('1.0')
-        if indicators:
-            atr = indicators.get('atr')
-            if atr and current_price > 0:
-                atr_pct = Decimal(str(float(atr) / float(current_price) * 100))
-                max_price_move = min(Decimal('2.0'), atr_pct)  # Allow up to ATR% move, max 2%
+        max_price_move = 1.0
+        if atr_pct is not None:
+            max_price_move = min(2.0, atr_pct)  # Allow up to ATR% move, max 2%
         
         if price_change_pct > max_price_move:
             logger.info(f"❌ Confirmation reset: price moved {price_change_pct:.2f}% > {max_price_move:.2f}% during confirmation")
@@ -1448,7 +1576,7 @@ class SwingStrategy:
                     atr_pct = float(atr) / float(current_price) * 100
                     if atr_pct > 3.0:  # High volatility
                         lock_seconds = max(300, lock_seconds // 2)  # Reduce lock, min 5 min
-                        logger.debug(f"⚡ High volatility - reduced direction lock to {lock_seconds}s")
+                        logger.debug("⚡ High volatility - reduced direction lock to %ss", lock_seconds)
             
             self._direction_lock_until = now + timedelta(seconds=lock_seconds)
             self._locked_direction = direction
@@ -1487,7 +1615,7 @@ class SwingStrategy:
         # Check for large swings (volatility in scores = volatility in market)
         score_range = max(recent_scores) - min(recent_scores)
         if score_range > 4:  # More than 4 point swing in scores
-            logger.debug(f"⚠️ Score instability detected: range={score_range:.1f} in last 3 scans")
+            logger.debug("⚠️ Score instability detected: range=%.1f in last 3 scans", score_range)
             return False
         
         # Check if opposite direction was stronger recently
@@ -1496,7 +1624,7 @@ class SwingStrategy:
             opposite_recent = list(opposite_history)[-2:]
             if max(opposite_recent) > current_score:
                 # Opposite direction was stronger very recently - whipsaw risk
-                logger.debug(f"⚠️ Whipsaw risk: opposite direction scored {max(opposite_recent):.1f} vs current {current_score:.1f}")
+                logger.debug("⚠️ Whipsaw risk: opposite direction scored %.1f vs current %.1f", max(opposite_recent), current_score)
                 return False
         
         return True
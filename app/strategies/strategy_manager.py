@@ -7,7 +7,6 @@ import os
 import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timezone
-import asyncio
 
 # Import strategies - SWING ONLY (scalping removed - fees kill profits)
 from app.strategies.rule_based.swing_strategy import SwingStrategy
@@ -77,13 +76,17 @@ class StrategyManager:
         Returns:
             Trading signal or None
         """
-        # Check if already in position
-        positions = account_state.get('positions', [])
-        if any(p['symbol'] == self.symbol for p in positions):
+        # Check if already in position (O(1) set lookup when the snapshot provides it)
+        position_symbols = account_state.get('position_symbols')
+        if position_symbols is not None:
+            in_position = self.symbol in position_symbols
+        else:
+            in_position = any(p['symbol'] == self.symbol for p in account_state.get('positions', []))
+        if in_position:
             return None  # Already in position, don't generate new signals
         
-        # Run all strategies in parallel
-        signals = await self._run_all_strategies(market_data, account_state)
+        # Run all strategies
+        signals = self._run_all_strategies(market_data, account_state)
         
         # Filter valid signals
         valid_signals = [s for s in signals if s is not None]
@@ -155,10 +158,13 @@ class StrategyManager:
         """
         self.btc_candles = candles
     
-    async def _run_all_strategies(self, market_data: Dict[str, Any],
-                                   account_state: Dict[str, Any]) -> List[Optional[Dict[str, Any]]]:
+    def _run_all_strategies(self, market_data: Dict[str, Any],
+                            account_state: Dict[str, Any]) -> List[Optional[Dict[str, Any]]]:
         """
-        Run all strategies in parallel
+        Run all strategies
+        
+        Signal generation is pure computation (nothing awaits), so strategies
+        are called directly instead of being wrapped in coroutines/tasks.
         
         Args:
             market_data: Market data
@@ -167,25 +173,13 @@ class StrategyManager:
         Returns:
             List of signals (may contain None)
         """
-        tasks = []
-        strategy_names = []
-        
-        for name, strategy in self.strategies.items():
-            task = strategy.generate_signal(market_data, account_state)
-            tasks.append(task)
-            strategy_names.append(name)
-        
-        # Execute all in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Handle exceptions
         signals = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Strategy {strategy_names[i]} error: {result}")
+        for name, strategy in self.strategies.items():
+            try:
+                signals.append(strategy.generate_signal(market_data, account_state))
+            except Exception as e:
+                logger.error(f"Strategy {name} error: {e}")
                 signals.append(None)
-            else:
-                signals.append(result)
         
         return signals
     
@@ -219,11 +213,17 @@ class StrategyManager:
             next_idx = (last_idx + 1) % len(strategy_names)
             next_strategies = strategy_names[next_idx:] + strategy_names[:next_idx]
             
+            # Index the first signal per strategy in one pass instead of
+            # rescanning every signal for each strategy in the rotation
+            first_by_strategy: Dict[str, Dict[str, Any]] = {}
+            for signal in signals:
+                first_by_strategy.setdefault(signal['strategy'], signal)
+            
             # Find first signal from next strategies
             for strategy_name in next_strategies:
-                for signal in signals:
-                    if signal['strategy'] == strategy_name:
-                        return signal
+                signal = first_by_strategy.get(strategy_name)
+                if signal is not None:
+                    return signal
         except (ValueError, IndexError):
             pass
         
@@ -314,10 +314,22 @@ class StrategyManager:
         Returns:
             Statistics dictionary
         """
-        total_signals = sum(s['signals'] for s in self.strategy_stats.values())
-        total_trades = sum(s['trades'] for s in self.strategy_stats.values())
+        # Totals and per-strategy breakdown in one pass over the counters
+        total_signals = 0
+        total_trades = 0
+        breakdown = {}
+        for name, counters in self.strategy_stats.items():
+            signals = counters['signals']
+            trades = counters['trades']
+            total_signals += signals
+            total_trades += trades
+            breakdown[name] = {
+                'signals': signals,
+                'trades': trades,
+                'execution_rate': trades / signals if signals > 0 else 0,
+            }
         
-        stats = {
+        return {
             'manager': 'StrategyManager',
             'symbol': self.symbol,
             'total_signals': total_signals,
@@ -325,21 +337,8 @@ class StrategyManager:
             'execution_rate': total_trades / total_signals if total_signals > 0 else 0,
             'execution_mode': self.execution_mode,
             'last_strategy_used': self.last_strategy_used,
-            'strategy_breakdown': {}
+            'strategy_breakdown': breakdown,
         }
-        
-        # Add per-strategy stats
-        for name, strategy in self.strategies.items():
-            strategy_stats = strategy.get_statistics()
-            stats['strategy_breakdown'][name] = {
-                'signals': self.strategy_stats[name]['signals'],
-                'trades': self.strategy_stats[name]['trades'],
-                'execution_rate': (self.strategy_stats[name]['trades'] / 
-                                  self.strategy_stats[name]['signals'] 
-                                  if self.strategy_stats[name]['signals'] > 0 else 0)
-            }
-        
-        return stats
     
     def log_statistics(self):
         """Log current statistics"""
@@ -4,12 +4,26 @@ Calculates indicators once and shares across all strategies
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from decimal import Decimal
 from collections import deque
+from itertools import islice
 
 logger = logging.getLogger(__name__)
 
+# EMA smoothing constants per period: (alpha, 1 - alpha), computed once
+_EMA_ALPHAS: Dict[int, Tuple[Decimal, Decimal]] = {}
+
+
+def _ema_alpha(period: int) -> Tuple[Decimal, Decimal]:
+    """Get (alpha, 1 - alpha) for an EMA period, with alpha = 2 / (period + 1)."""
+    alphas = _EMA_ALPHAS.get(period)
+    if alphas is None:
+        multiplier = Decimal('2') / (period + 1)
+        alphas = (multiplier, 1 - multiplier)
+        _EMA_ALPHAS[period] = alphas
+    return alphas
+
 
 class IndicatorCalculator:
     """
@@ -27,11 +41,14 @@ class IndicatorCalculator:
         # Cache for indicators
         self._indicator_cache: Dict[str, Any] = {}
         self._last_prices_hash: Optional[int] = None
+        self._last_prices_ref: Optional[List[Decimal]] = None  # List object behind the cache
+        self._last_prices_len = 0
         
         # State for stateful indicators (RSI, MACD, ADX)
         self.rsi_avg_gain: Optional[Decimal] = None
         self.rsi_avg_loss: Optional[Decimal] = None
         self.macd_values = deque(maxlen=50)
+        self.macd_signal: Optional[Decimal] = None  # Running EMA(9) of MACD line
         self.adx_value: Optional[Decimal] = None
         
         logger.info("📊 Shared Indicator Calculator initialized (Phase 5)")
@@ -51,10 +68,16 @@ class IndicatorCalculator:
         if len(prices) < 100:
             return {}
         
+        # Same list object (same length) as last time -> nothing changed, skip even the hash
+        if prices is self._last_prices_ref and len(prices) == self._last_prices_len and self._indicator_cache:
+            return self._indicator_cache
+        
         # Check if prices changed (cache validation)
         prices_hash = hash(tuple(prices[-50:]))
         if prices_hash == self._last_prices_hash and self._indicator_cache:
             logger.debug("⚡ Using cached indicators (no price change)")
+            self._last_prices_ref = prices
+            self._last_prices_len = len(prices)
             return self._indicator_cache
         
         # Calculate all indicators
@@ -65,16 +88,17 @@ class IndicatorCalculator:
         if rsi:
             indicators['rsi'] = rsi
         
-        # EMAs
-        ema_fast = self._calculate_ema(prices, 21)
-        ema_slow = self._calculate_ema(prices, 50)
+        # EMAs (trend 21/50 and MACD 12/26 share a single pass over prices)
+        emas = self._calculate_emas(prices, (12, 21, 26, 50))
+        ema_fast = emas.get(21)
+        ema_slow = emas.get(50)
         if ema_fast and ema_slow:
             indicators['ema_fast'] = ema_fast
             indicators['ema_slow'] = ema_slow
             indicators['ema_trend'] = 'up' if ema_fast > ema_slow else 'down'
         
         # MACD
-        macd = self._calculate_macd(prices)
+        macd = self._calculate_macd(prices, emas.get(12), emas.get(26))
         if macd:
             indicators['macd'] = macd
         
@@ -108,6 +132,8 @@ class IndicatorCalculator:
         # Update cache
         self._indicator_cache = indicators
         self._last_prices_hash = prices_hash
+        self._last_prices_ref = prices
+        self._last_prices_len = len(prices)
         
         rsi_val = float(rsi) if rsi else 0
         ema_fast_val = float(ema_fast) if ema_fast else 0
@@ -143,26 +169,63 @@ class IndicatorCalculator:
         rsi = 100 - (100 / (1 + rs))
         return rsi
     
-    def _calculate_ema(self, prices: List[Decimal], period: int) -> Optional[Decimal]:
-        """Calculate Exponential Moving Average"""
+    def _calculate_ema(self, prices: Sequence[Decimal], period: int) -> Optional[Decimal]:
+        """Calculate Exponential Moving Average (accepts lists or deques without copying)"""
         if len(prices) < period:
             return None
         
-        multiplier = Decimal('2') / (period + 1)
-        ema = sum(prices[:period]) / period
+        multiplier, keep = _ema_alpha(period)
+        it = iter(prices)
+        ema = sum(islice(it, period)) / period
         
-        for price in prices[period:]:
-            ema = (price * multiplier) + (ema * (1 - multiplier))
+        for price in it:
+            ema = (price * multiplier) + (ema * keep)
         
         return ema
     
-    def _calculate_macd(self, prices: List[Decimal]) -> Optional[Dict[str, Decimal]]:
-        """Calculate MACD indicator"""
+    def _calculate_emas(self, prices: Sequence[Decimal], periods: Sequence[int]) -> Dict[int, Decimal]:
+        """
+        Calculate several EMAs in one pass over prices
+        
+        Each EMA is seeded and updated exactly as in _calculate_ema, so the
+        values are identical - the price series is just walked once.
+        
+        Args:
+            prices: Price series
+            periods: EMA periods to calculate
+            
+        Returns:
+            {period: ema} for every period with enough data
+        """
+        alphas = {period: _ema_alpha(period) for period in periods}
+        sums = {period: Decimal('0') for period in periods}
+        emas: Dict[int, Decimal] = {}
+        
+        for i, price in enumerate(prices):
+            for period, (multiplier, keep) in alphas.items():
+                if i < period:
+                    sums[period] += price
+                    if i == period - 1:
+                        emas[period] = sums[period] / period
+                else:
+                    emas[period] = (price * multiplier) + (emas[period] * keep)
+        
+        return emas
+    
+    def _calculate_macd(
+        self,
+        prices: List[Decimal],
+        ema_fast: Optional[Decimal] = None,
+        ema_slow: Optional[Decimal] = None,
+    ) -> Optional[Dict[str, Decimal]]:
+        """Calculate MACD indicator (optionally from precomputed 12/26 EMAs)"""
         if len(prices) < 26:
             return None
         
-        ema_fast = self._calculate_ema(list(prices), 12)
-        ema_slow = self._calculate_ema(list(prices), 26)
+        if ema_fast is None:
+            ema_fast = self._calculate_ema(prices, 12)
+        if ema_slow is None:
+            ema_slow = self._calculate_ema(prices, 26)
         
         if ema_fast is None or ema_slow is None:
             return None
@@ -170,8 +233,15 @@ class IndicatorCalculator:
         macd_line = ema_fast - ema_slow
         self.macd_values.append(macd_line)
         
-        if len(self.macd_values) >= 9:
-            signal_line = self._calculate_ema(list(self.macd_values), 9)
+        # Signal line = EMA(9) of MACD, seeded from the first 9 values and then
+        # advanced one step per new MACD value (O(1) instead of re-walking history)
+        if self.macd_signal is not None:
+            multiplier, keep = _ema_alpha(9)
+            self.macd_signal = (macd_line * multiplier) + (self.macd_signal * keep)
+            signal_line = self.macd_signal
+        elif len(self.macd_values) >= 9:
+            self.macd_signal = self._calculate_ema(self.macd_values, 9)
+            signal_line = self.macd_signal
         else:
             signal_line = macd_line
         
@@ -212,7 +282,8 @@ class IndicatorCalculator:
         plus_dm_list = []
         minus_dm_list = []
         
-        for i in range(1, len(prices)):
+        # Only the last `period` moves feed the averages below
+        for i in range(len(prices) - period, len(prices)):
             current = prices[i]
             previous = prices[i-1]
             
@@ -255,7 +326,7 @@ class IndicatorCalculator:
             return None
         
         tr_list = []
-        for i in range(1, len(prices)):
+        for i in range(len(prices) - period, len(prices)):
             tr = abs(prices[i] - prices[i-1])
             tr_list.append(tr)
         
@@ -274,7 +345,9 @@ class IndicatorCalculator:
         plus_dm_list = []
         minus_dm_list = []
         
-        for i in range(1, len(candles)):
+        # Only the last `period` candles feed the averages below - skip
+        # converting the rest of the history to Decimal
+        for i in range(len(candles) - period, len(candles)):
             high = Decimal(str(candles[i].get('high', candles[i].get('h', 0))))
             low = Decimal(str(candles[i].get('low', candles[i].get('l', 0))))
             prev_high = Decimal(str(candles[i-1].get('high', candles[i-1].get('h', 0))))
@@ -322,7 +395,7 @@ class IndicatorCalculator:
             return None
         
         tr_list = []
-        for i in range(1, len(candles)):
+        for i in range(len(candles) - period, len(candles)):
             high = Decimal(str(candles[i].get('high', candles[i].get('h', 0))))
             low = Decimal(str(candles[i].get('low', candles[i].get('l', 0))))
             prev_close = Decimal(str(candles[i-1].get('close', candles[i-1].get('c', 0))))
@@ -340,4 +413,5 @@ class IndicatorCalculator:
         """Invalidate cache on new candle"""
         self._indicator_cache = {}
         self._last_prices_hash = None
+        self._last_prices_ref = None
         logger.debug("🔄 Indicator cache invalidated")
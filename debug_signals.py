@@ -214,7 +214,7 @@ async def main():
     # Test signal generation
     hdr("Full Signal Generation Test")
     try:
-        signal = await strategy.generate_signal(symbol, df)
+        signal = strategy.generate_signal(symbol, df)
         
         if signal:
             ok(f"Signal Generated!")